@@ -0,0 +1,47 @@
+"""
+Corrida de hiperparâmetros do AG (successive halving sob orçamento de CPU)
+"""
+import os
+import sys
+
+# Adicionar diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.settings import Config
+from src.simulation.ajuste import amostrar_configuracoes, correr_configuracoes
+
+
+def main():
+    """Sorteia configurações, corre as rodadas e grava outputs/ajuste.csv"""
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    coordenadas = carregar_coordenadas(os.path.join(BASE_DIR, "data", "coordenadas.csv"))
+    if not coordenadas:
+        print("ERRO: Nenhuma coordenada foi carregada.")
+        return
+
+    configuracoes = amostrar_configuracoes(quantidade=Config.AJUSTE_CONFIGURACOES)
+    print(f"Correndo {len(configuracoes)} configuracoes "
+          f"(orcamento inicial {Config.AJUSTE_ORCAMENTO_INICIAL:.1f}s de CPU, eta={Config.AJUSTE_ETA})...")
+
+    caminho = os.path.join("outputs", "ajuste.csv")
+    resultado = correr_configuracoes(coordenadas, configuracoes, Config.AJUSTE_ORCAMENTO_INICIAL,
+                                     Config.AJUSTE_ETA, Config.AJUSTE_SEMENTES_MAXIMAS,
+                                     workers=Config.AJUSTE_WORKERS, caminho_saida=caminho,
+                                     opcoes_ag={'eliminar_duplicatas': Config.AG_ELIMINAR_DUPLICATAS})
+
+    for rodada in sorted({linha['rodada'] for linha in resultado['linhas']}):
+        linhas = [l for l in resultado['linhas'] if l['rodada'] == rodada]
+        melhor = min(linhas, key=lambda l: l['fitness_medio'])
+        print(f"Rodada {rodada}: {len(linhas)} configuracoes x {melhor['sementes']} sementes, "
+              f"{melhor['orcamento_s']:.1f}s cada | melhor fitness medio {melhor['fitness_medio']:.2f}")
+
+    print("\nConfiguracao vencedora:")
+    for parametro, valor in resultado['melhor'].items():
+        print(f"  {parametro} = {valor}")
+    print(f"  fitness medio = {resultado['fitness']:.2f}")
+    print(f"\nTabela das rodadas: {caminho}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,23 @@
 """Inicialização do pacote algorithms"""
 from .genetico import AlgoritmoGenetico
+from .estacionario import AlgoritmoGeneticoEstacionario
 from .fitness import FitnessFunction
+from .operadores import SeletorOperadores
+from .surrogate import ModeloSubstituto
+from .memetico import BuscaLocalMemetica
+from .paralelo import AvaliadorParalelo
+from .robustez import AvaliadorRobusto
+from .incremental import reotimizar_incremental
+from .replanejamento import replanejar
+from .decomposicao import resolver_decomposto
+from .frota import otimizar_frota
+from .limite_inferior import calcular_limite_inferior
+from .solver import Solver, comparar_solvers
+from .recozimento import RecozimentoSimulado
+from .formigas import ColoniaFormigas
 
-__all__ = ['AlgoritmoGenetico', 'FitnessFunction']
+__all__ = ['AlgoritmoGenetico', 'AlgoritmoGeneticoEstacionario', 'FitnessFunction', 'SeletorOperadores', 'BuscaLocalMemetica', 'ModeloSubstituto',
+           'AvaliadorParalelo', 'AvaliadorRobusto', 'reotimizar_incremental', 'replanejar',
+           'resolver_decomposto', 'otimizar_frota',
+           'calcular_limite_inferior', 'Solver', 'comparar_solvers', 'RecozimentoSimulado',
+           'ColoniaFormigas']
@@ -0,0 +1,128 @@
+"""Buscas locais (2-opt e Or-opt) sobre rotas de índices.
+
+As rotas são listas de inteiros cujo primeiro e último elementos (base)
+permanecem fixos. As distâncias vêm de uma matriz numpy pré-calculada e
+o laço interno de cada vizinhança é vetorizado.
+"""
+import time
+import numpy as np
+
+
+def two_opt(rota, dist, prazo=None):
+    """
+    Aplica 2-opt (primeira melhoria) até convergir ou atingir o prazo.
+
+    Args:
+        rota: Lista de índices (extremos fixos)
+        dist: Matriz numpy de distâncias
+        prazo: Instante limite em `time.process_time()` (None = sem limite)
+
+    Returns:
+        tuple: (rota, melhorou)
+    """
+    rota = np.asarray(rota, dtype=np.int64).copy()
+    n = len(rota)
+    if n < 5:
+        return rota.tolist(), False
+
+    melhorou_alguma = False
+    melhorou = True
+    while melhorou:
+        melhorou = False
+        for i in range(1, n - 2):
+            if prazo is not None and time.process_time() > prazo:
+                return rota.tolist(), melhorou_alguma
+
+            a, b = rota[i - 1], rota[i]
+            c = rota[i + 1:n - 1]
+            d = rota[i + 2:n]
+            delta = dist[a, c] + dist[b, d] - dist[a, b] - dist[c, d]
+
+            j = int(np.argmin(delta))
+            if delta[j] < -1e-9:
+                fim = i + 1 + j
+                rota[i:fim + 1] = rota[i:fim + 1][::-1]
+                melhorou = melhorou_alguma = True
+
+    return rota.tolist(), melhorou_alguma
+
+
+def or_opt(rota, dist, prazo=None, tamanhos=(1, 2, 3)):
+    """
+    Realoca segmentos curtos para a melhor posição (primeira melhoria).
+
+    Args:
+        rota: Lista de índices (extremos fixos)
+        dist: Matriz numpy de distâncias
+        prazo: Instante limite em `time.process_time()` (None = sem limite)
+        tamanhos: Comprimentos de segmento testados
+
+    Returns:
+        tuple: (rota, melhorou)
+    """
+    rota = list(rota)
+    n = len(rota)
+    if n < 5:
+        return rota, False
+
+    melhorou_alguma = False
+    melhorou = True
+    while melhorou:
+        melhorou = False
+        for tam in tamanhos:
+            i = 1
+            while i + tam < n:
+                if prazo is not None and time.process_time() > prazo:
+                    return rota, melhorou_alguma
+
+                anterior, primeiro = rota[i - 1], rota[i]
+                ultimo, seguinte = rota[i + tam - 1], rota[i + tam]
+                ganho_remocao = dist[anterior, primeiro] + dist[ultimo, seguinte] - dist[anterior, seguinte]
+
+                resto = np.asarray(rota[:i] + rota[i + tam:], dtype=np.int64)
+                u, v = resto[:-1], resto[1:]
+                # inserir na orientação original ou invertida, o que for menor
+                custo_direto = dist[u, primeiro] + dist[ultimo, v] - dist[u, v]
+                custo_inverso = dist[u, ultimo] + dist[primeiro, v] - dist[u, v]
+                custo = np.minimum(custo_direto, custo_inverso)
+                custo[i - 1] = np.inf  # posição original
+
+                k = int(np.argmin(custo))
+                if custo[k] - ganho_remocao < -1e-9:
+                    segmento = rota[i:i + tam]
+                    if custo_inverso[k] < custo_direto[k]:
+                        segmento = segmento[::-1]
+                    novo = resto.tolist()
+                    novo[k + 1:k + 1] = segmento
+                    rota = novo
+                    melhorou = melhorou_alguma = True
+                else:
+                    i += 1
+
+    return rota, melhorou_alguma
+
+
+def busca_local_limitada(rota, dist, limite_segundos=None):
+    """
+    Alterna 2-opt e Or-opt até ótimo local ou esgotar o tempo de CPU.
+
+    Args:
+        rota: Lista de índices (extremos fixos)
+        dist: Matriz numpy de distâncias
+        limite_segundos: Orçamento de CPU (None = sem limite)
+
+    Returns:
+        list: Rota melhorada (nunca mais longa que a original)
+    """
+    prazo = None if limite_segundos is None else time.process_time() + limite_segundos
+
+    rota = list(rota)
+    while True:
+        rota, _ = two_opt(rota, dist, prazo)
+        rota, realocou = or_opt(rota, dist, prazo)
+        if not realocou:
+            break
+        if prazo is not None and time.process_time() > prazo:
+            break
+
+    return rota
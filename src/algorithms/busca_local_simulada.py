@@ -0,0 +1,198 @@
+"""Busca local guiada pelo simulador (recargas, taxa tarde e dias).
+
+Diferente de `aplicar_2opt`, que otimiza apenas distância, aqui cada
+movimento (reversão 2-opt ou realocação de um ponto) é julgado pelo
+fitness simulado. Para manter o custo baixo:
+
+* os movimentos são pré-filtrados e ordenados pela variação de distância
+  calculada na matriz pré-computada;
+* só o sufixo da rota a partir do primeiro trecho alterado é re-simulado,
+  partindo do estado gravado antes daquele trecho.
+
+Um movimento só é aceito se reduzir o fitness, portanto o fitness
+simulado da rota nunca piora.
+"""
+import time
+import numpy as np
+
+from .busca_local import busca_local_limitada
+
+
+def _candidatos_2opt(rota, dist):
+    """Retorna (deltas_km, i, j) para as reversões de rota[i..j]."""
+    n = len(rota)
+    pos = np.arange(1, n - 1)
+    a, b = rota[pos - 1], rota[pos]
+    c, d = rota[pos], rota[pos + 1]
+
+    delta = (dist[a[:, None], c[None, :]] + dist[b[:, None], d[None, :]]
+             - dist[a, b][:, None] - dist[c, d][None, :])
+    delta[np.tril_indices(len(pos))] = np.inf
+
+    ii, jj = np.nonzero(np.isfinite(delta))
+    return delta[ii, jj], pos[ii], pos[jj]
+
+
+def _candidatos_realocacao(rota, dist):
+    """Retorna (deltas_km, i, k) para mover rota[i] para entre k e k+1."""
+    n = len(rota)
+    pos = np.arange(1, n - 1)
+    p, x, s = rota[pos - 1], rota[pos], rota[pos + 1]
+    ganho_remocao = dist[p, x] + dist[x, s] - dist[p, s]
+
+    k = np.arange(0, n - 1)
+    u, v = rota[k], rota[k + 1]
+    custo_insercao = dist[u[None, :], x[:, None]] + dist[x[:, None], v[None, :]] - dist[u, v][None, :]
+
+    delta = custo_insercao - ganho_remocao[:, None]
+    # inserir ao lado da própria posição não altera a rota
+    linhas = np.arange(len(pos))
+    delta[linhas, pos - 1] = np.inf
+    delta[linhas, pos] = np.inf
+
+    ii, kk = np.nonzero(np.isfinite(delta))
+    return delta[ii, kk], pos[ii], k[kk]
+
+
+def _melhores_candidatos(rota, dist, folga_km, quantidade):
+    """Retorna até `quantidade` movimentos [(tipo, i, j)] de menor delta abaixo da folga."""
+    tipos = ('reversao', 'realocacao')
+    partes = [_candidatos_2opt(rota, dist), _candidatos_realocacao(rota, dist)]
+
+    deltas = np.concatenate([p[0] for p in partes])
+    origem = np.concatenate([np.full(len(p[0]), n) for n, p in enumerate(partes)])
+    ii = np.concatenate([p[1] for p in partes])
+    jj = np.concatenate([p[2] for p in partes])
+
+    validos = np.nonzero(deltas < folga_km)[0]
+    if len(validos) > quantidade:
+        validos = validos[np.argpartition(deltas[validos], quantidade)[:quantidade]]
+    validos = validos[np.argsort(deltas[validos], kind='stable')]
+
+    return [(tipos[origem[x]], int(ii[x]), int(jj[x])) for x in validos]
+
+
+def aplicar_movimento(coords, tipo, i, j):
+    """Retorna (novas coordenadas, índice do primeiro trecho alterado)."""
+    if tipo == 'reversao':
+        novas = coords[:i] + coords[i:j + 1][::-1] + coords[j + 1:]
+        return novas, i - 1
+
+    ponto = coords[i]
+    resto = coords[:i] + coords[i + 1:]
+    destino = j + 1 if j < i else j
+    novas = resto[:destino] + [ponto] + resto[destino:]
+    return novas, min(i, j + 1) - 1
+
+
+def pre_otimizar(individuo, matriz, atual, limite_segundos, modo='guloso'):
+    """
+    Aplica a busca por distância e mantém a rota só se o fitness não piorar.
+
+    Args:
+        individuo: Individuo avaliado (modificado no lugar)
+        matriz: Instância de MatrizDistancias
+        atual: Fitness atual do indivíduo
+        limite_segundos: Orçamento de CPU da busca (usa a metade; None = sem limite)
+        modo: 'guloso' (re-simula gravando estados para `simular_sufixo`) ou
+            'split' (reavalia com a DP de recargas)
+
+    Returns:
+        float: Fitness da rota mantida
+    """
+    salvo = individuo.salvar_resultado(0)
+    limite = None if limite_segundos is None else limite_segundos / 2.0
+
+    indices = busca_local_limitada(matriz.indices_da_rota(individuo.coordenadas), matriz.distancias, limite)
+    individuo.coordenadas = matriz.coordenadas_da_rota(indices)
+    if modo == 'split':
+        novo = individuo.avaliar('split')
+    else:
+        individuo.simular_rota(registrar_estados=True)
+        novo = individuo.calcular_fitness()
+
+    if novo <= atual:
+        return novo
+
+    individuo.restaurar_resultado(salvo)
+    return atual
+
+
+def busca_local_simulada(individuo, matriz, limite_segundos=None, max_avaliacoes=None,
+                         folga_km=0.5, candidatos_por_passo=60, pre_otimizar_distancia=False, modo='guloso'):
+    """
+    Melhora a rota do indivíduo avaliando movimentos com o simulador.
+
+    Args:
+        individuo: Individuo a otimizar (modificado no lugar)
+        matriz: Instância de MatrizDistancias com as coordenadas da rota
+        limite_segundos: Orçamento de CPU (None = sem limite)
+        max_avaliacoes: Máximo de re-simulações de sufixo (None = sem limite)
+        folga_km: Aceita testar movimentos que aumentem a distância até este valor
+        candidatos_por_passo: Movimentos (melhores por distância) testados por passo
+        pre_otimizar_distancia: Antes da busca simulada, aplica 2-opt/Or-opt por
+            distância e adota o resultado somente se o fitness simulado não piorar
+        modo: 'guloso' (re-simula só o sufixo alterado) ou 'split' (cada
+            movimento é reavaliado inteiro pela DP de recargas); o fitness
+            comparado é sempre o deste modo
+
+    Returns:
+        dict: fitness inicial/final, movimentos aceitos e avaliações feitas
+    """
+    prazo = None if limite_segundos is None else time.process_time() + limite_segundos
+
+    if modo == 'split':
+        atual = individuo.avaliar('split')
+    else:
+        individuo.simular_rota(registrar_estados=True)
+        atual = individuo.calcular_fitness()
+    inicial = atual
+
+    if pre_otimizar_distancia and individuo.viabilidade:
+        atual = pre_otimizar(individuo, matriz, atual, limite_segundos, modo)
+    avaliacoes = 0
+    aceitos = 0
+
+    def esgotado():
+        if prazo is not None and time.process_time() > prazo:
+            return True
+        return max_avaliacoes is not None and avaliacoes >= max_avaliacoes
+
+    while individuo.viabilidade and not esgotado():
+        rota = np.asarray(matriz.indices_da_rota(individuo.coordenadas), dtype=np.int64)
+        candidatos = _melhores_candidatos(rota, matriz.distancias, folga_km, candidatos_por_passo)
+
+        aceito = False
+        for tipo, i, j in candidatos:
+            if esgotado():
+                break
+
+            novas, inicio = aplicar_movimento(individuo.coordenadas, tipo, i, j)
+            if modo == 'split':
+                salvo = individuo.salvar_resultado(0)
+                individuo.coordenadas = novas
+                novo = individuo.avaliar('split')
+            else:
+                salvo = individuo.salvar_resultado(inicio)
+                individuo.coordenadas = novas
+                individuo.simular_sufixo(inicio)
+                novo = individuo.calcular_fitness()
+            avaliacoes += 1
+
+            if novo < atual - 1e-9:
+                atual = novo
+                aceitos += 1
+                aceito = True
+                break
+
+            individuo.restaurar_resultado(salvo)
+
+        if not aceito:
+            break
+
+    return {
+        'fitness_inicial': inicial,
+        'fitness_final': atual,
+        'movimentos_aceitos': aceitos,
+        'avaliacoes': avaliacoes,
+    }
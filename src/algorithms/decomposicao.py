@@ -0,0 +1,308 @@
+"""Decomposição geográfica (cluster-first, route-second) para instâncias grandes.
+
+O custo do AG cresce mais que linearmente com o número de pontos, então
+listas com dezenas de milhares de CEPs são divididas:
+
+1. os pontos são agrupados por k-means (ou grade) sobre lat/lon projetadas;
+2. os clusters são ordenados por uma rota curta entre os centroides;
+3. cada cluster é resolvido pelo AG existente (base + pontos do cluster),
+   em paralelo, semeado com vizinho mais próximo + 2-opt/Or-opt;
+4. os ciclos dos clusters são abertos no ponto de menor custo de conexão
+   e costurados em uma rota única que sai e volta à base;
+5. uma busca local 2-opt/Or-opt em janelas ao redor de cada costura
+   corrige as junções.
+"""
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ..core.entities.drone import Drone
+from ..core.individuo import Individuo
+from ..core.populacao import Populacao
+from ..core.settings import Config
+from ..utils_custom.matriz_distancias import MatrizDistancias, matriz_haversine, RAIO_TERRA_KM
+from .busca_local import busca_local_limitada
+from .genetico import AlgoritmoGenetico
+
+KM_POR_GRAU = 111.195
+
+
+def _projetar(coordenadas):
+    """Coordenadas planas (km) aproximadas, para agrupamento."""
+    lats = np.array([c.latitude for c in coordenadas])
+    lons = np.array([c.longitude for c in coordenadas])
+    fator = math.cos(math.radians(float(lats.mean()))) if len(lats) else 1.0
+    return np.column_stack([lons * fator, lats]) * KM_POR_GRAU
+
+
+def _kmeans(pontos, k, rng, iteracoes):
+    """Rótulos do k-means (inicialização k-means++, Lloyd)."""
+    centros = [pontos[rng.integers(len(pontos))]]
+    d2 = ((pontos - centros[0]) ** 2).sum(axis=1)
+    for _ in range(1, k):
+        total = d2.sum()
+        escolhido = rng.choice(len(pontos), p=d2 / total) if total > 0 else rng.integers(len(pontos))
+        centros.append(pontos[escolhido])
+        d2 = np.minimum(d2, ((pontos - pontos[escolhido]) ** 2).sum(axis=1))
+    centros = np.array(centros)
+
+    rotulos = None
+    for _ in range(iteracoes):
+        # |p - c|^2 = |p|^2 - 2 p.c + |c|^2 (evita o array n x k x 2)
+        dist = (pontos ** 2).sum(axis=1)[:, None] - 2 * pontos @ centros.T + (centros ** 2).sum(axis=1)[None, :]
+        novos = dist.argmin(axis=1)
+        if rotulos is not None and np.array_equal(novos, rotulos):
+            break
+        rotulos = novos
+        for j in range(k):
+            membros = pontos[rotulos == j]
+            if len(membros):
+                centros[j] = membros.mean(axis=0)
+    return rotulos
+
+
+def particionar(coordenadas, clusters, metodo='kmeans', semente=0, iteracoes=30):
+    """
+    Agrupa os pontos (exceto a base) geograficamente.
+
+    Args:
+        coordenadas: Lista de `Coordenada`
+        clusters: Número desejado de grupos
+        metodo: 'kmeans' ou 'grade' (células iguais sobre a caixa envolvente)
+        semente: Semente do k-means++
+        iteracoes: Máximo de iterações de Lloyd
+
+    Returns:
+        list: Listas de índices em `coordenadas`, uma por grupo não vazio
+    """
+    indices = np.array([i for i, c in enumerate(coordenadas) if not c.eh_unibrasil()], dtype=np.int64)
+    if len(indices) == 0:
+        return []
+    k = max(1, min(int(clusters), len(indices)))
+    pontos = _projetar([coordenadas[i] for i in indices])
+
+    if metodo == 'kmeans':
+        rotulos = _kmeans(pontos, k, np.random.default_rng(semente), iteracoes)
+    elif metodo == 'grade':
+        lado = math.ceil(math.sqrt(k))
+        minimo, extensao = pontos.min(axis=0), np.ptp(pontos, axis=0)
+        celula = np.floor((pontos - minimo) / np.maximum(extensao, 1e-9) * lado).clip(0, lado - 1)
+        rotulos = (celula[:, 1] * lado + celula[:, 0]).astype(np.int64)
+    else:
+        raise ValueError(f"Método de particionamento desconhecido: {metodo}")
+
+    return [indices[rotulos == r].tolist() for r in np.unique(rotulos)]
+
+
+def _rota_inicial(matriz, limite_segundos=None):
+    """Vizinho mais próximo a partir da base (índice 0) refinado por 2-opt/Or-opt."""
+    dist = matriz.distancias
+    rota, livres = [0], np.ones(len(matriz), dtype=bool)
+    livres[0] = False
+    for _ in range(len(matriz) - 1):
+        candidatos = np.where(livres, dist[rota[-1]], np.inf)
+        proximo = int(candidatos.argmin())
+        rota.append(proximo)
+        livres[proximo] = False
+    return busca_local_limitada(rota + [0], dist, limite_segundos)
+
+
+def resolver_cluster(base, pontos, parametros, gerenciador_vento, geracoes=20, tamanho_populacao=30,
+                     semente=0, opcoes_ag=None, semear_com_ordem=False, modo_avaliacao=None):
+    """
+    Resolve um cluster com o AG (rota base -> pontos -> base).
+
+    Args:
+        base: `Coordenada` da base
+        pontos: `Coordenada` do cluster
+        parametros: ParametrosExecucao
+        gerenciador_vento: GerenciadorVento
+        geracoes: Gerações do AG
+        tamanho_populacao: Indivíduos por geração
+        semente: Semente do gerador próprio do AG (o `random` global não é tocado)
+        opcoes_ag: Parâmetros adicionais de `AlgoritmoGenetico` (opcional)
+        semear_com_ordem: Se True, a ordem de `pontos` semeia o AG em vez do
+            vizinho mais próximo + 2-opt/Or-opt
+        modo_avaliacao: 'guloso' ou 'split' (padrão: `Config.MODO_AVALIACAO`)
+
+    Returns:
+        list: Pontos do cluster na ordem de visita (sem a base)
+    """
+    coordenadas = [base] + list(pontos)
+    if len(pontos) < 3:
+        return list(pontos)
+    matriz = MatrizDistancias(coordenadas, parametros.geometria, parametros.latitude_referencia)
+    if semear_com_ordem:
+        semente_rota = coordenadas + [base]
+    else:
+        semente_rota = matriz.coordenadas_da_rota(_rota_inicial(matriz, limite_segundos=1.0))
+    populacao = Populacao(coordenadas, Drone(parametros=parametros), gerenciador_vento, tamanho_populacao,
+                          modo_avaliacao, matriz_distancias=matriz, sementes=[semente_rota],
+                          rng=random.Random(semente))
+    algoritmo = AlgoritmoGenetico(populacao, **(opcoes_ag or {}))
+    try:
+        for _ in range(geracoes):
+            algoritmo.executar_geracao()
+        populacao.avaliar_populacao()
+    finally:
+        algoritmo.encerrar()
+    candidatos = [ind for ind in (algoritmo.get_melhor_individuo(), populacao.melhor_individuo) if ind is not None]
+    return list(min(candidatos, key=lambda ind: ind.fitness).coordenadas[1:-1])
+
+
+def resolver_cluster_em_worker(argumentos):
+    """`resolver_cluster` com os argumentos em tupla (para `ProcessPoolExecutor.map`)."""
+    return resolver_cluster(*argumentos)
+
+
+def _ordenar_clusters(base, grupos):
+    """Ordem de visita dos clusters: rota curta entre os centroides, saindo da base."""
+    centroides = np.array([[np.mean([c.latitude for c in g]), np.mean([c.longitude for c in g])]
+                           for g in grupos])
+    lats = np.concatenate([[base.latitude], centroides[:, 0]])
+    lons = np.concatenate([[base.longitude], centroides[:, 1]])
+    dist = matriz_haversine(lats, lons)
+    rota, livres = [0], set(range(1, len(lats)))
+    while livres:
+        proximo = min(livres, key=lambda j: dist[rota[-1], j])
+        rota.append(proximo)
+        livres.remove(proximo)
+    rota = busca_local_limitada(rota + [0], dist)
+    return [i - 1 for i in rota[1:-1]], centroides
+
+
+def _abrir_ciclo(ciclo, anterior, seguinte):
+    """
+    Abre o ciclo de um cluster no trecho e sentido de menor custo de conexão.
+
+    Remover o trecho (c_i, c_{i+1}) gera o caminho c_{i+1} ... c_i (ou o
+    inverso); o custo é a ligação com o ponto anterior e com o próximo
+    alvo (lat, lon) menos o trecho removido.
+    """
+    if len(ciclo) < 2:
+        return list(ciclo)
+    lats = np.array([c.latitude for c in ciclo])
+    lons = np.array([c.longitude for c in ciclo])
+    de_anterior = matriz_haversine([anterior[0]], [anterior[1]], lats, lons)[0]
+    ate_seguinte = matriz_haversine([seguinte[0]], [seguinte[1]], lats, lons)[0]
+    proximos = np.roll(np.arange(len(ciclo)), -1)
+    removido = matriz_haversine(lats, lons)[np.arange(len(ciclo)), proximos]
+
+    # sentido direto: entra em c_{i+1}, sai em c_i; inverso: entra em c_i, sai em c_{i+1}
+    direto = de_anterior[proximos] + ate_seguinte - removido
+    inverso = de_anterior + ate_seguinte[proximos] - removido
+    if direto.min() <= inverso.min():
+        i = int(direto.argmin())
+        return list(ciclo[i + 1:]) + list(ciclo[:i + 1])
+    i = int(inverso.argmin())
+    return (list(ciclo[i + 1:]) + list(ciclo[:i + 1]))[::-1]
+
+
+def reparar_costuras(rota, costuras, janela=8, limite_segundos=None):
+    """
+    Busca local 2-opt/Or-opt restrita a janelas ao redor das costuras.
+
+    Args:
+        rota: Lista de `Coordenada` (base nos extremos)
+        costuras: Posições `s` em que o trecho (rota[s-1], rota[s]) liga clusters
+        janela: Pontos de cada lado da costura que podem mudar de posição
+        limite_segundos: CPU total do reparo (None = sem limite)
+
+    Returns:
+        list: Rota reparada (nunca mais longa que a original)
+    """
+    rota = list(rota)
+    prazo = None if limite_segundos is None else time.process_time() + limite_segundos
+    for s in costuras:
+        inicio, fim = max(0, s - janela - 1), min(len(rota) - 1, s + janela)
+        trecho = rota[inicio:fim + 1]
+        if len(trecho) < 5:
+            continue
+        dist = matriz_haversine([c.latitude for c in trecho], [c.longitude for c in trecho])
+        restante = None if prazo is None else max(0.0, prazo - time.process_time())
+        ordem = busca_local_limitada(list(range(len(trecho))), dist, restante)
+        rota[inicio:fim + 1] = [trecho[i] for i in ordem]
+    return rota
+
+
+def _distancia(rota):
+    """Comprimento (km) de uma rota de `Coordenada`, trecho a trecho."""
+    lat = np.radians([c.latitude for c in rota])
+    lon = np.radians([c.longitude for c in rota])
+    a = (np.sin(np.diff(lat) / 2.0) ** 2
+         + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2.0) ** 2)
+    return float((RAIO_TERRA_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))).sum())
+
+
+def resolver_decomposto(coordenadas, drone, gerenciador_vento, clusters=None, pontos_por_cluster=150,
+                        metodo='kmeans', geracoes=20, tamanho_populacao=30, workers=None, semente=0,
+                        janela_costura=8, modo_avaliacao=None, opcoes_ag=None):
+    """
+    Resolve uma instância grande por decomposição geográfica.
+
+    Args:
+        coordenadas: Lista de `Coordenada` (inclui a base)
+        drone: Instância de Drone (seus `parametros` seguem para os clusters)
+        gerenciador_vento: Instância de GerenciadorVento
+        clusters: Número de clusters (padrão: pontos / `pontos_por_cluster`)
+        pontos_por_cluster: Tamanho alvo de cada cluster quando `clusters` é None
+        metodo: 'kmeans' ou 'grade'
+        geracoes: Gerações do AG em cada cluster
+        tamanho_populacao: Indivíduos por geração em cada cluster
+        workers: Processos (None/0 = todos os núcleos; 1 = no processo atual)
+        semente: Semente do particionamento e dos AGs
+        janela_costura: Pontos de cada lado das costuras no reparo final
+        modo_avaliacao: 'guloso' ou 'split' nos clusters e na rota final (padrão:
+            `Config.MODO_AVALIACAO`)
+        opcoes_ag: Parâmetros adicionais de `AlgoritmoGenetico` (opcional)
+
+    Returns:
+        dict: individuo (rota completa avaliada), clusters, distancia_costurada,
+        distancia_final (km) e segundos (relógio)
+    """
+    inicio = time.perf_counter()
+    base = next(c for c in coordenadas if c.eh_unibrasil())
+    n_pontos = sum(1 for c in coordenadas if not c.eh_unibrasil())
+    if clusters is None:
+        clusters = max(1, math.ceil(n_pontos / pontos_por_cluster))
+
+    grupos = [[coordenadas[i] for i in g] for g in particionar(coordenadas, clusters, metodo, semente)]
+    ordem, centroides = _ordenar_clusters(base, grupos) if grupos else ([], None)
+    grupos = [grupos[i] for i in ordem]
+    centroides = centroides[ordem] if grupos else None
+
+    tarefas = [(base, g, drone.parametros, gerenciador_vento, geracoes, tamanho_populacao, semente + i, opcoes_ag,
+                False, modo_avaliacao)
+               for i, g in enumerate(grupos)]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tarefas) or 1))
+    if workers == 1:
+        ciclos = [resolver_cluster(*t) for t in tarefas]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            ciclos = list(pool.map(resolver_cluster_em_worker, tarefas))
+
+    rota, costuras = [base], []
+    for i, ciclo in enumerate(ciclos):
+        anterior = (rota[-1].latitude, rota[-1].longitude)
+        seguinte = tuple(centroides[i + 1]) if i + 1 < len(ciclos) else (base.latitude, base.longitude)
+        costuras.append(len(rota))
+        rota.extend(_abrir_ciclo(ciclo, anterior, seguinte))
+    costuras.append(len(rota))
+    rota.append(base)
+
+    distancia_costurada = _distancia(rota)
+    rota = reparar_costuras(rota, costuras, janela_costura)
+
+    melhor = Individuo(rota, drone, gerenciador_vento)
+    melhor.avaliar(modo_avaliacao or Config.MODO_AVALIACAO)
+    return {
+        'individuo': melhor,
+        'clusters': len(grupos),
+        'distancia_costurada': distancia_costurada,
+        'distancia_final': melhor.distancia_total,
+        'segundos': time.perf_counter() - inicio,
+    }
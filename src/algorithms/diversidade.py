@@ -0,0 +1,90 @@
+"""Diversidade da população medida pela frequência de arestas.
+
+Cada rota contribui com suas arestas dirigidas (origem -> destino). As
+contagens são mantidas de forma incremental: ao substituir um indivíduo,
+só as arestas da rota que sai e da que entra são atualizadas. A entropia
+média por ponto também é incremental, pois depende apenas da soma de
+c * log(c) sobre as contagens.
+"""
+import math
+
+
+def _c_log_c(c):
+    return c * math.log(c) if c > 0 else 0.0
+
+
+class FrequenciaArestas:
+    """Contagem de arestas sobre um conjunto de rotas."""
+
+    def __init__(self, coordenadas):
+        """
+        Args:
+            coordenadas: Lista de `Coordenada` (CEPs únicos)
+        """
+        self.indice = {c.cep: i for i, c in enumerate(coordenadas)}
+        self.contagens = {}
+        self.rotas = 0
+        self.arestas_distintas = 0
+        self._arestas_por_rota = 0
+        self._soma_clogc = 0.0
+
+    def _arestas(self, rota):
+        pontos = [self.indice[c.cep] for c in rota]
+        return list(zip(pontos[:-1], pontos[1:]))
+
+    def _alterar(self, rota, sinal):
+        arestas = self._arestas(rota)
+        for aresta in arestas:
+            antes = self.contagens.get(aresta, 0)
+            depois = antes + sinal
+            self._soma_clogc += _c_log_c(depois) - _c_log_c(antes)
+            if depois:
+                self.contagens[aresta] = depois
+            else:
+                del self.contagens[aresta]
+            if antes == 0:
+                self.arestas_distintas += 1
+            elif depois == 0:
+                self.arestas_distintas -= 1
+        self.rotas += sinal
+        self._arestas_por_rota = len(arestas)
+
+    def adicionar(self, rota):
+        """Conta as arestas de uma rota (lista de `Coordenada`)."""
+        self._alterar(rota, +1)
+
+    def remover(self, rota):
+        """Desconta as arestas de uma rota previamente adicionada."""
+        self._alterar(rota, -1)
+
+    def substituir(self, antiga, nova):
+        """Troca uma rota por outra, atualizando apenas as arestas das duas."""
+        if antiga is nova or antiga == nova:
+            return
+        self.remover(antiga)
+        self.adicionar(nova)
+
+    def entropia(self):
+        """
+        Entropia média da aresta de saída de cada ponto, normalizada em [0, 1].
+
+        Cada ponto tem exatamente uma aresta de saída por rota, logo a
+        entropia de cada linha é log(P) - soma(c log c) / P.
+        """
+        if self.rotas <= 1 or not self._arestas_por_rota:
+            return 0.0
+        media = math.log(self.rotas) - self._soma_clogc / (self.rotas * self._arestas_por_rota)
+        maximo = math.log(min(self.rotas, self._arestas_por_rota))
+        return max(0.0, min(1.0, media / maximo)) if maximo > 0 else 0.0
+
+    def resumo(self):
+        """Métricas de diversidade da população atual."""
+        return {
+            'entropia_arestas': self.entropia(),
+            'arestas_distintas': self.arestas_distintas,
+            # 1.0 = todas as rotas iguais; cresce até o tamanho da população
+            'arestas_por_trecho': self.arestas_distintas / self._arestas_por_rota if self._arestas_por_rota else 0.0,
+        }
+
+    def __repr__(self):
+        return f"FrequenciaArestas({self.rotas} rotas, {self.arestas_distintas} arestas distintas)"
@@ -0,0 +1,189 @@
+"""AG em regime estacionário (steady-state).
+
+Em vez de reconstruir a população inteira a cada geração, cada passo gera
+um lote pequeno de filhos, avalia só esses filhos e substitui os piores
+membros da população. O pior é localizado por um heap com invalidação
+preguiçosa (entradas de indivíduos já substituídos são descartadas ao
+chegar ao topo) e as estatísticas são atualizadas de forma incremental,
+então o custo de cada passo é proporcional ao lote e não à população.
+"""
+import copy
+import heapq
+import itertools
+
+from .genetico import AlgoritmoGenetico
+
+
+class AlgoritmoGeneticoEstacionario(AlgoritmoGenetico):
+    """AG com substituição incremental dos piores indivíduos."""
+
+    def __init__(self, populacao, tamanho_lote=4, **kwargs):
+        """
+        Inicializa o AG estacionário.
+
+        Args:
+            populacao: Instância de Populacao
+            tamanho_lote: Filhos gerados e avaliados por passo
+            **kwargs: Demais parâmetros de `AlgoritmoGenetico`; `memetico`,
+                `substituto`, `reinicio_diversidade`, `robustez` e
+                `workers_avaliacao` não se aplicam a este modo
+        """
+        for opcao in ('memetico', 'substituto', 'reinicio_diversidade', 'robustez'):
+            if kwargs.get(opcao):
+                raise ValueError(f"Opção '{opcao}' não suportada no modo estacionário")
+        if kwargs.get('workers_avaliacao', 1) > 1:
+            raise ValueError("Opção 'workers_avaliacao' não suportada no modo estacionário")
+
+        super().__init__(populacao, **kwargs)
+        self.tamanho_lote = max(1, int(tamanho_lote))
+        self.passos = 0
+        self.substituicoes = 0
+        self._heap = []
+        self._contador = itertools.count()
+        self._vivos = set()
+        self._hashes = set()
+        self._soma_finita = 0.0
+        self._infinitos = 0
+        self._viaveis = 0
+        self._iniciado = False
+
+    # ------------------------------------------------------------------
+    # Estrutura incremental
+    # ------------------------------------------------------------------
+    def _iniciar(self):
+        """Avalia a população inicial e monta heap, hashes e estatísticas."""
+        self.populacao.avaliar_populacao()
+        for posicao, individuo in enumerate(self.populacao.individuos):
+            individuo.posicao_populacao = posicao
+            self._inserir(individuo)
+            self.arestas.adicionar(individuo.coordenadas)
+            if self.eliminar_duplicatas:
+                individuo.hash_genoma = self.populacao.zobrist.hash_rota(individuo.coordenadas)
+                self._hashes.add(individuo.hash_genoma)
+
+        melhor = self.populacao.melhor_individuo
+        if melhor is not None:
+            self.melhor_global = copy.deepcopy(melhor)
+        self._iniciado = True
+
+    def _inserir(self, individuo):
+        self._vivos.add(id(individuo))
+        heapq.heappush(self._heap, (-individuo.fitness, next(self._contador), individuo))
+        if individuo.fitness == float('inf'):
+            self._infinitos += 1
+        else:
+            self._soma_finita += individuo.fitness
+        if individuo.viabilidade:
+            self._viaveis += 1
+
+    def _remover(self, individuo):
+        self._vivos.discard(id(individuo))
+        if individuo.fitness == float('inf'):
+            self._infinitos -= 1
+        else:
+            self._soma_finita -= individuo.fitness
+        if individuo.viabilidade:
+            self._viaveis -= 1
+
+    def _pior(self):
+        """Pior indivíduo vivo (descarta entradas invalidadas no topo do heap)."""
+        while self._heap and id(self._heap[0][2]) not in self._vivos:
+            heapq.heappop(self._heap)
+        return self._heap[0][2] if self._heap else None
+
+    # ------------------------------------------------------------------
+    # Passo
+    # ------------------------------------------------------------------
+    def executar_geracao(self):
+        """
+        Executa um passo: gera e avalia um lote e substitui os piores.
+
+        Returns:
+            dict: Estatísticas atualizadas incrementalmente
+        """
+        if not self._iniciado:
+            self._iniciar()
+            self._registrar_passo(0, 0)
+            return self.historico[-1]
+
+        self._duplicatas_substituidas = 0
+        filhos = [self._registrar_unico(self._gerar_filho(), self._hashes)
+                  for _ in range(self.tamanho_lote)]
+
+        avaliados = 0
+        substituidos = 0
+        melhorou = False
+        for filho in filhos:
+            pior = self._pior()
+            corte = pior.fitness if self.corte_avaliacao and pior is not None else None
+            corte = corte if corte != float('inf') else None
+            filho.avaliar(self.populacao.modo_avaliacao, corte=corte,
+                          matriz=self.populacao.matriz_distancias if corte is not None else None)
+            avaliados += 1
+
+            if pior is None or not filho.exato or filho.fitness >= pior.fitness:
+                self._hashes.discard(getattr(filho, 'hash_genoma', None))
+                continue
+
+            self._substituir(pior, filho)
+            substituidos += 1
+            if self.melhor_global is None or filho.fitness < self.melhor_global.fitness:
+                self.melhor_global = copy.deepcopy(filho)
+                self.populacao.melhor_individuo = filho
+                melhorou = True
+
+        if self.seletor is not None:
+            self._creditar_operadores(filhos)
+
+        self.geracoes_sem_melhora = 0 if melhorou else self.geracoes_sem_melhora + 1
+        if self.geracoes_sem_melhora > 1:
+            self.taxa_mutacao = min(0.2, self.taxa_mutacao * 1.5)
+        else:
+            self.taxa_mutacao = max(0.02, self.taxa_mutacao * 0.95)
+
+        self.passos += 1
+        self._registrar_passo(avaliados, substituidos)
+        return self.historico[-1]
+
+    def _substituir(self, pior, filho):
+        """Coloca `filho` na posição de `pior`, atualizando as estruturas."""
+        individuos = self.populacao.individuos
+        posicao = pior.posicao_populacao
+        individuos[posicao] = filho
+        filho.posicao_populacao = posicao
+
+        self._remover(pior)
+        self._inserir(filho)
+        self._hashes.discard(getattr(pior, 'hash_genoma', None))
+        self.arestas.substituir(pior.coordenadas, filho.coordenadas)
+        self.substituicoes += 1
+
+    def _registrar_passo(self, avaliados, substituidos):
+        """Empilha estatísticas do passo sem percorrer a população."""
+        tamanho = len(self.populacao.individuos)
+        pior = self._pior()
+        melhor = self.melhor_global
+        media = float('inf') if self._infinitos else self._soma_finita / max(1, tamanho)
+
+        stats = {
+            'tamanho': tamanho,
+            'melhor_fitness': melhor.fitness if melhor is not None else float('inf'),
+            'pior_fitness': pior.fitness if pior is not None else float('inf'),
+            'fitness_medio': media,
+            'individuos_viaveis': self._viaveis,
+            'taxa_viabilidade': (self._viaveis / tamanho) * 100 if tamanho else 0.0,
+            'passo': self.passos,
+            'avaliacoes': avaliados,
+            'substituicoes': substituidos,
+            'diversidade': self.arestas.resumo(),
+        }
+        if self.seletor is not None:
+            stats['operadores'] = self.seletor.resumo()
+        if self.eliminar_duplicatas:
+            stats['duplicatas_substituidas'] = self._duplicatas_substituidas
+        self._registrar_gap(stats)
+        self.historico.append(stats)
+
+    def __repr__(self):
+        return (f"AlgoritmoGeneticoEstacionario(lote={self.tamanho_lote}, "
+                f"passos={self.passos}, substituicoes={self.substituicoes})")
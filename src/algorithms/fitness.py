@@ -3,13 +3,15 @@
 Reformulei comentários e compactei alguns trechos mantendo a
 semântica inalterada.
 """
-from ..core.settings import Config
+from ..core.parametros import ParametrosExecucao
 
 
 class FitnessFunction:
     """Agrega componentes (tempo, custo, penalidades, distância)."""
 
-    def __init__(self, peso_tempo=1.0, peso_custo=1.0, peso_penalidades=1.0, peso_distancia=0.0):
+    def __init__(self, peso_tempo=1.0, peso_custo=1.0, peso_penalidades=1.0, peso_distancia=0.0,
+                 parametros=None):
+        self.parametros = parametros if parametros is not None else ParametrosExecucao.de_config()
         self.peso_tempo = peso_tempo
         self.peso_custo = peso_custo
         self.peso_penalidades = peso_penalidades
@@ -32,7 +34,7 @@ class FitnessFunction:
 
         distancia_km = getattr(individuo, 'distancia_total', 0)
         try:
-            norma = float(Config.FITNESS_DIST_NORMALIZATION)
+            norma = float(self.parametros.fitness_dist_normalization)
             dist_norm = distancia_km / norma if norma and norma > 0 else distancia_km
         except Exception:
             dist_norm = distancia_km
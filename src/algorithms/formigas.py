@@ -0,0 +1,176 @@
+"""Colônia de formigas (MAX-MIN Ant System) vetorizada.
+
+O feromônio é uma matriz NumPy (n x n) sobre os índices das coordenadas,
+direcionada porque o vento torna cada trecho assimétrico. A cada iteração
+todas as formigas constroem suas rotas ao mesmo tempo: em cada passo,
+cada formiga sorteia (roleta sobre feromônio^alfa x (1/distância)^beta)
+o próximo ponto entre os vizinhos mais próximos do ponto atual ainda não
+visitados; quando todos já foram visitados, escolhe o melhor ponto livre
+da linha inteira.
+
+As rotas são avaliadas pelo simulador (`Populacao.avaliar_populacao`,
+opcionalmente em processos trabalhadores via `AvaliadorParalelo`), de modo
+que recargas e taxas de pouso tardio entram no depósito: só a melhor rota
+da iteração e a melhor global depositam 1/fitness, com o feromônio
+limitado a [tau_max / (2n), tau_max] e tau_max = 1 / (evaporação x melhor
+fitness).
+"""
+import copy
+import random
+
+import numpy as np
+
+from .paralelo import AvaliadorParalelo
+from .solver import Solver
+from ..core.dados_compartilhados import DadosCompartilhados
+
+
+class ColoniaFormigas(Solver):
+    """Motor de colônia de formigas com construção em lote."""
+
+    def __init__(self, populacao, formigas=None, alfa=1.0, beta=3.0, evaporacao=0.1, vizinhos=15,
+                 workers_avaliacao=1, semente=None):
+        """
+        Args:
+            populacao: Instância de Populacao; fornece drone, vento, matriz,
+                estado inicial e modo de avaliação, e recebe as rotas das
+                formigas a cada iteração
+            formigas: Rotas construídas por iteração (padrão: `populacao.tamanho`)
+            alfa: Peso do feromônio na escolha do próximo ponto
+            beta: Peso da heurística 1/distância
+            evaporacao: Fração do feromônio evaporada por iteração (0-1)
+            vizinhos: Tamanho das listas de candidatos de cada ponto
+            workers_avaliacao: Processos que simulam as rotas (> 1 publica os
+                dados do problema em memória compartilhada)
+            semente: Semente do gerador NumPy (padrão: sorteada de `random`)
+        """
+        self.populacao = populacao
+        self.matriz = populacao.matriz_distancias
+        self.formigas = formigas or populacao.tamanho
+        self.alfa = alfa
+        self.beta = beta
+        self.evaporacao = evaporacao
+        self.historico = []
+        self.melhor_global = None
+        self._melhor_rota = None
+        self._rng = np.random.default_rng(random.getrandbits(32) if semente is None else semente)
+
+        n = len(self.matriz)
+        distancias = self.matriz.distancias
+        self._heuristica = 1.0 / np.maximum(distancias, 1e-3)
+        proximos = distancias.copy()
+        np.fill_diagonal(proximos, np.inf)
+        self._vizinhos = np.argsort(proximos, axis=1)[:, :max(1, min(vizinhos, n - 1))]
+        self.feromonio = np.ones((n, n))
+        self.tau_max = self.tau_min = None
+
+        # extremos fixos das rotas da população (base, ou ponto atual no replanejamento)
+        extremos = self.matriz.indices_da_rota(populacao.individuos[0].coordenadas)
+        self._inicio, self._fim = int(extremos[0]), int(extremos[-1])
+
+        self.dados = None
+        self.avaliador = None
+        if workers_avaliacao > 1:
+            self.dados = DadosCompartilhados.publicar(populacao.coordenadas, populacao.drone,
+                                                      populacao.gerenciador_vento, self.matriz)
+            self.avaliador = AvaliadorParalelo(self.dados, workers_avaliacao, populacao.drone.parametros,
+                                               populacao.estado_inicial)
+
+    def construir_rotas(self):
+        """
+        Constrói as rotas de todas as formigas em lote.
+
+        Returns:
+            np.ndarray: (formigas, pontos da rota) com os índices das coordenadas
+        """
+        m, n = self.formigas, len(self.matriz)
+        fixos = {self._inicio, self._fim}
+        comprimento = n - len(fixos) + 2
+        peso = self.feromonio ** self.alfa * self._heuristica ** self.beta
+        linhas = np.arange(m)
+
+        visitado = np.zeros((m, n), dtype=bool)
+        visitado[:, list(fixos)] = True
+        rotas = np.empty((m, comprimento), dtype=np.int64)
+        rotas[:, 0], rotas[:, -1] = self._inicio, self._fim
+        atual = rotas[:, 0].copy()
+
+        for passo in range(1, comprimento - 1):
+            candidatos = self._vizinhos[atual]
+            pesos = peso[atual[:, None], candidatos] * ~visitado[linhas[:, None], candidatos]
+            acumulado = np.cumsum(pesos, axis=1)
+            sorteio = self._rng.random(m) * acumulado[:, -1]
+            escolha = np.minimum((acumulado <= sorteio[:, None]).sum(axis=1), candidatos.shape[1] - 1)
+            proximo = candidatos[linhas, escolha]
+
+            esgotadas = acumulado[:, -1] <= 0
+            if esgotadas.any():
+                # todos os vizinhos já visitados: melhor ponto livre da linha inteira
+                livres = peso[atual[esgotadas]] * ~visitado[esgotadas]
+                proximo[esgotadas] = livres.argmax(axis=1)
+
+            visitado[linhas, proximo] = True
+            rotas[:, passo] = proximo
+            atual = proximo
+        return rotas
+
+    def _depositar(self, rotas_fitness):
+        """Evapora e deposita 1/fitness nos trechos das rotas, respeitando os limites."""
+        self.feromonio *= 1.0 - self.evaporacao
+        for rota, fitness in rotas_fitness:
+            if fitness != float('inf') and fitness > 0:
+                self.feromonio[rota[:-1], rota[1:]] += 1.0 / fitness
+        if self.tau_max is not None:
+            np.clip(self.feromonio, self.tau_min, self.tau_max, out=self.feromonio)
+
+    def executar_geracao(self):
+        """
+        Constrói, avalia e atualiza o feromônio (uma iteração da colônia).
+
+        Returns:
+            dict: Estatísticas da iteração
+        """
+        rotas = self.construir_rotas()
+        populacao = self.populacao
+        populacao.individuos = [populacao.novo_individuo(self.matriz.coordenadas_da_rota(rota)) for rota in rotas]
+        populacao.avaliar_populacao(avaliador=self.avaliador)
+
+        fitness = np.array([ind.fitness for ind in populacao.individuos])
+        iteracao = int(fitness.argmin())
+        if self.melhor_global is None or fitness[iteracao] < self.melhor_global.fitness:
+            self.melhor_global = copy.deepcopy(populacao.individuos[iteracao])
+            self._melhor_rota = rotas[iteracao].copy()
+            if self.melhor_global.fitness != float('inf'):
+                n = len(self.matriz)
+                primeira = self.tau_max is None
+                self.tau_max = 1.0 / (self.evaporacao * self.melhor_global.fitness)
+                self.tau_min = self.tau_max / (2.0 * n)
+                if primeira:
+                    self.feromonio.fill(self.tau_max)
+
+        self._depositar([(rotas[iteracao], fitness[iteracao]),
+                         (self._melhor_rota, self.melhor_global.fitness)])
+
+        stats = populacao.get_estatisticas()
+        stats['geracao'] = len(self.historico)
+        stats['melhor_iteracao'] = stats['melhor_fitness']
+        stats['melhor_fitness'] = self.melhor_global.fitness
+        stats['feromonio'] = {'min': float(self.feromonio.min()), 'max': float(self.feromonio.max())}
+        self.historico.append(stats)
+        return stats
+
+    def encerrar(self):
+        """Libera o pool de avaliação e a memória compartilhada."""
+        if self.avaliador is not None:
+            self.avaliador.encerrar()
+        if self.dados is not None:
+            self.dados.fechar()
+            self.dados = None
+
+    def get_melhor_individuo(self):
+        """Retorna o melhor indivíduo encontrado até agora"""
+        return self.melhor_global or self.populacao.melhor_individuo
+
+    def __repr__(self):
+        melhor = self.melhor_global.fitness if self.melhor_global is not None else float('inf')
+        return f"ColoniaFormigas({self.formigas} formigas, melhor={melhor:.2f})"
@@ -0,0 +1,197 @@
+"""Modo frota: N drones partindo da base, cada um com sua rota.
+
+Os CEPs são divididos em setores angulares ao redor da base (varredura),
+com quantidades iguais de pontos por drone. Em cada rodada:
+
+1. a rota de cada drone é otimizada pelo AG, um processo por drone
+   (`decomposicao.resolver_cluster`), semeada pela rota da rodada anterior;
+2. movimentos de rebalanceamento levam pontos do drone que termina por
+   último (maior `minutos_totais_desde_inicio`) para a rota de outro drone,
+   na posição de inserção mais barata, enquanto o makespan da frota cair.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ..core.individuo import Individuo
+from ..core.settings import Config
+from ..utils_custom.calculos import calcular_direcao
+from ..utils_custom.matriz_distancias import matriz_haversine
+from .decomposicao import resolver_cluster, resolver_cluster_em_worker
+
+
+def dividir_setores(coordenadas, drones):
+    """
+    Divide os pontos (exceto a base) em setores angulares ao redor da base.
+
+    A varredura começa no maior vão angular entre pontos consecutivos, para
+    não cortar um grupo de pontos ao meio na direção 0°.
+
+    Args:
+        coordenadas: Lista de `Coordenada` (inclui a base)
+        drones: Número de drones
+
+    Returns:
+        list: Uma lista de `Coordenada` por drone (tamanhos diferem no máximo em 1)
+    """
+    base = next(c for c in coordenadas if c.eh_unibrasil())
+    pontos = [c for c in coordenadas if not c.eh_unibrasil()]
+    if not pontos:
+        return [[] for _ in range(drones)]
+    rumos = np.array([calcular_direcao(base.latitude, base.longitude, c.latitude, c.longitude) for c in pontos])
+    ordem = np.argsort(rumos, kind='stable')
+    vaos = np.diff(np.append(rumos[ordem], rumos[ordem[0]] + 360))
+    ordem = np.roll(ordem, -(int(vaos.argmax()) + 1))
+    return [[pontos[i] for i in parte] for parte in np.array_split(ordem, drones)]
+
+
+def _makespan(individuo):
+    """Minutos desde o início da missão até o fim da rota (inf se inviável)."""
+    if not individuo.viabilidade or individuo.minutos_totais_desde_inicio is None:
+        return float('inf')
+    return individuo.minutos_totais_desde_inicio
+
+
+def _avaliar(base, pontos, drone, gerenciador_vento, modo):
+    individuo = Individuo([base] + list(pontos) + [base], drone, gerenciador_vento)
+    individuo.avaliar(modo)
+    return individuo
+
+
+def _candidatos_movimento(rotas, base, origem):
+    """
+    Movimentos (delta_km, ponto, destino, posição) de pontos da rota `origem`
+    para as demais, ordenados pela variação de distância total.
+    """
+    def caminho(pontos):
+        seq = [base] + list(pontos) + [base]
+        return np.array([c.latitude for c in seq]), np.array([c.longitude for c in seq])
+
+    lat_o, lon_o = caminho(rotas[origem])
+    d_o = matriz_haversine(lat_o, lon_o)
+    k = np.arange(1, len(lat_o) - 1)
+    ganho = d_o[k - 1, k] + d_o[k, k + 1] - d_o[k - 1, k + 1]
+
+    movimentos = []
+    for destino, pontos in enumerate(rotas):
+        if destino == origem:
+            continue
+        lat_d, lon_d = caminho(pontos)
+        para = matriz_haversine(lat_o[k], lon_o[k], lat_d, lon_d)  # (pontos da origem, nós do destino)
+        trechos = matriz_haversine(lat_d[:-1], lon_d[:-1], lat_d[1:], lon_d[1:]).diagonal()
+        insercao = para[:, :-1] + para[:, 1:] - trechos[None, :]
+        posicao = insercao.argmin(axis=1)
+        delta = insercao[np.arange(len(k)), posicao] - ganho
+        movimentos += [(float(delta[i]), i, destino, int(posicao[i])) for i in range(len(k))]
+    return sorted(movimentos, key=lambda m: m[0])
+
+
+def rebalancear(rotas, base, drone, gerenciador_vento, movimentos=30, tentativas=10, modo=None):
+    """
+    Move pontos do drone mais demorado para outros drones enquanto o makespan cair.
+
+    Cada movimento retira um ponto da rota que termina por último e o insere
+    na posição mais barata (em km) de outra rota; só é aceito se o makespan
+    da frota diminuir (ou ficar igual com fitness total menor).
+
+    Args:
+        rotas: Listas de `Coordenada` (sem a base), uma por drone
+        base: `Coordenada` da base
+        drone: Instância de Drone
+        gerenciador_vento: Instância de GerenciadorVento
+        movimentos: Máximo de movimentos aceitos
+        tentativas: Candidatos simulados por movimento antes de desistir
+        modo: 'guloso' ou 'split' (padrão: `Config.MODO_AVALIACAO`)
+
+    Returns:
+        tuple: (rotas, indivíduos avaliados, movimentos aceitos)
+    """
+    modo = modo or Config.MODO_AVALIACAO
+    rotas = [list(r) for r in rotas]
+    individuos = [_avaliar(base, r, drone, gerenciador_vento, modo) for r in rotas]
+    aceitos = 0
+
+    while aceitos < movimentos and len(rotas) > 1:
+        tempos = [_makespan(ind) for ind in individuos]
+        origem = int(np.argmax(tempos))
+        atual = (max(tempos), sum(ind.fitness for ind in individuos))
+        if not rotas[origem]:
+            break
+
+        melhorou = False
+        for _, i, destino, posicao in _candidatos_movimento(rotas, base, origem)[:tentativas]:
+            nova_origem = rotas[origem][:i] + rotas[origem][i + 1:]
+            nova_destino = rotas[destino][:posicao] + [rotas[origem][i]] + rotas[destino][posicao:]
+            ind_origem = _avaliar(base, nova_origem, drone, gerenciador_vento, modo)
+            ind_destino = _avaliar(base, nova_destino, drone, gerenciador_vento, modo)
+
+            novos = list(individuos)
+            novos[origem], novos[destino] = ind_origem, ind_destino
+            candidato = (max(_makespan(ind) for ind in novos), sum(ind.fitness for ind in novos))
+            if candidato < atual:
+                rotas[origem], rotas[destino] = nova_origem, nova_destino
+                individuos = novos
+                aceitos += 1
+                melhorou = True
+                break
+        if not melhorou:
+            break
+
+    return rotas, individuos, aceitos
+
+
+def otimizar_frota(coordenadas, drone, gerenciador_vento, drones=2, geracoes=20, tamanho_populacao=30,
+                   rodadas=2, movimentos=30, workers=None, semente=0, modo_avaliacao=None, opcoes_ag=None):
+    """
+    Divide os CEPs entre `drones` drones e otimiza as rotas em paralelo.
+
+    Args:
+        coordenadas: Lista de `Coordenada` (inclui a base)
+        drone: Drone modelo (seus `parametros` valem para toda a frota)
+        gerenciador_vento: Instância de GerenciadorVento
+        drones: Tamanho da frota
+        geracoes: Gerações do AG por drone e rodada
+        tamanho_populacao: Indivíduos por drone
+        rodadas: Rodadas de otimização + rebalanceamento (ao menos 1)
+        movimentos: Máximo de movimentos de rebalanceamento por rodada
+        workers: Processos (None/0 = um por drone, limitado aos núcleos; 1 = no processo atual)
+        semente: Semente dos AGs
+        modo_avaliacao: 'guloso' ou 'split' (padrão: `Config.MODO_AVALIACAO`)
+        opcoes_ag: Parâmetros adicionais de `AlgoritmoGenetico` (opcional)
+
+    Returns:
+        dict: individuos (um por drone), makespan_minutos, movimentos
+        (aceitos no rebalanceamento) e segundos (relógio)
+    """
+    if rodadas < 1:
+        raise ValueError(f"rodadas deve ser ao menos 1: {rodadas}")
+    inicio = time.perf_counter()
+    base = next(c for c in coordenadas if c.eh_unibrasil())
+    rotas = dividir_setores(coordenadas, drones)
+    workers = max(1, min(workers or os.cpu_count() or 1, drones))
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    total_movimentos = 0
+    individuos = []
+    try:
+        for rodada in range(rodadas):
+            tarefas = [(base, r, drone.parametros, gerenciador_vento, geracoes, tamanho_populacao,
+                        semente + rodada * drones + k, opcoes_ag, rodada > 0, modo_avaliacao)
+                       for k, r in enumerate(rotas)]
+            rotas = (list(pool.map(resolver_cluster_em_worker, tarefas)) if pool is not None
+                     else [resolver_cluster(*t) for t in tarefas])
+            rotas, individuos, aceitos = rebalancear(rotas, base, drone, gerenciador_vento, movimentos,
+                                                     modo=modo_avaliacao)
+            total_movimentos += aceitos
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return {
+        'individuos': individuos,
+        'makespan_minutos': max(_makespan(ind) for ind in individuos),
+        'movimentos': total_movimentos,
+        'segundos': time.perf_counter() - inicio,
+    }
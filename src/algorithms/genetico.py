@@ -1,12 +1,26 @@
 """
 Implementação do Algoritmo Genético para otimização de rotas
 """
-import random
 import copy
-from ..core.individuo import Individuo
+import time
 from .fitness import FitnessFunction
+from .operadores import SeletorOperadores
+from .memetico import BuscaLocalMemetica
+from .surrogate import ModeloSubstituto
+from .diversidade import FrequenciaArestas
+from .paralelo import AvaliadorParalelo
+from .limite_inferior import calcular_limite_inferior, gap_otimalidade
+from .solver import Solver
+from ..core.dados_compartilhados import DadosCompartilhados
 
-class AlgoritmoGenetico:
+# Operadores disponíveis para o modo adaptativo, agrupados por etapa
+OPERADORES_ADAPTATIVOS = {
+    'crossover': ['ox', 'clone'],
+    'mutacao': ['troca', 'inversao'],
+    'busca_local': ['nenhuma', '2opt_amostrado'],
+}
+
+class AlgoritmoGenetico(Solver):
     """Solver genético para rotas de drone.
 
     Mantive as mesmas interfaces públicas; internamente reorganizei
@@ -15,7 +29,12 @@ class AlgoritmoGenetico:
     """
     
     def __init__(self, populacao, taxa_mutacao=0.02, taxa_crossover=0.8, 
-                 elitismo=True, percentual_elitismo=0.1):
+                 elitismo=True, percentual_elitismo=0.1, operadores_adaptativos=False,
+                 memetico=False, fracao_memetica=0.2, orcamento_memetico=1.0,
+                 workers_memeticos=1, corte_avaliacao=False, percentil_corte=0.5,
+                 eliminar_duplicatas=False, substituto=False, fracao_substituto=0.5, controle_substituto=0.1,
+                 reinicio_diversidade=False, limiar_entropia=0.1, workers_avaliacao=1,
+                 robustez=None, limite_inferior=False, gap_parada=None, tamanho_torneio=5):
         """
         Inicializa o Algoritmo Genético.
         
@@ -25,16 +44,91 @@ class AlgoritmoGenetico:
             taxa_crossover: Taxa de crossover (0-1)
             elitismo: Se True, mantém melhores indivíduos
             percentual_elitismo: Percentual de elite a preservar
+            operadores_adaptativos: Se True, escolhe crossover, mutação e
+                busca local via bandido (melhoria por segundo de CPU)
+            memetico: Se True, aplica busca local limitada a parte dos filhos
+            fracao_memetica: Fração dos filhos refinados por geração
+            orcamento_memetico: Segundos de CPU por geração para a busca local
+            workers_memeticos: Processos usados pela busca local
+            corte_avaliacao: Se True, aborta a simulação de filhos que
+                certamente ficam acima do limiar da geração anterior
+            percentil_corte: Percentil (0-1) do fitness da geração anterior
+                usado como limiar de corte (rotas abortadas contam pelo
+                limite inferior)
+            eliminar_duplicatas: Se True, mantém o hash de cada filho e troca
+                rotas repetidas por mutantes novos antes da avaliação
+            substituto: Se True, um modelo barato (distância + pousos
+                estimados) pré-seleciona os filhos a simular
+            fracao_substituto: Fração dos filhos simulados quando o
+                substituto está ativo
+            controle_substituto: Fração dos filhos restantes simulada por
+                sorteio, para medir a correlação fora dos melhores previstos
+            reinicio_diversidade: Se True, re-semeia a parte não elite da
+                população quando a entropia de arestas cai abaixo do limiar
+            limiar_entropia: Entropia normalizada (0-1) que dispara o reinício
+            workers_avaliacao: Processos que simulam a população (> 1 publica
+                os dados do problema em memória compartilhada)
+            robustez: AvaliadorRobusto opcional; o fitness otimizado passa a
+                ser a média/CVaR sobre cenários de vento (substitui
+                `workers_avaliacao`)
+            limite_inferior: Se True, calcula um limite inferior do fitness
+                (1-árvore de Held-Karp) e registra o gap de otimalidade do
+                melhor indivíduo a cada geração
+            gap_parada: Gap relativo (0-1) abaixo do qual `parada_por_gap`
+                fica True (implica `limite_inferior`)
+            tamanho_torneio: Participantes de cada torneio de seleção de pais
         """
         self.populacao = populacao
+        self.rng = populacao.rng
         self.taxa_mutacao = taxa_mutacao
         self.taxa_crossover = taxa_crossover
         self.elitismo = elitismo
         self.percentual_elitismo = percentual_elitismo
+        self.tamanho_torneio = tamanho_torneio
         self.historico = []
         self.melhor_global = None
         self.fitness_func = FitnessFunction()
         self.geracoes_sem_melhora = 0
+        self.seletor = SeletorOperadores(OPERADORES_ADAPTATIVOS, rng=self.rng) if operadores_adaptativos else None
+        self.corte_avaliacao = corte_avaliacao
+        self.percentil_corte = percentil_corte
+        self._fitness_anteriores = []
+        self.eliminar_duplicatas = eliminar_duplicatas
+        self._duplicatas_substituidas = 0
+        self.substituto = None
+        if substituto:
+            self.substituto = ModeloSubstituto(populacao.matriz_distancias, populacao.drone,
+                                               fracao_substituto, fracao_controle=controle_substituto,
+                                               rng=self.rng)
+        self.arestas = FrequenciaArestas(populacao.coordenadas)
+        self.reinicio_diversidade = reinicio_diversidade
+        self.limiar_entropia = limiar_entropia
+        self.reinicios = 0
+        self._diversidade = None
+        self._reiniciar = False
+        self.dados = None
+        paralelo = workers_avaliacao > 1 and robustez is None
+        if paralelo or (memetico and workers_memeticos > 1):
+            self.dados = DadosCompartilhados.publicar(populacao.coordenadas, populacao.drone,
+                                                      populacao.gerenciador_vento,
+                                                      populacao.matriz_distancias)
+        self.avaliador = robustez
+        if paralelo:
+            self.avaliador = AvaliadorParalelo(self.dados, workers_avaliacao, populacao.drone.parametros,
+                                               populacao.estado_inicial)
+        self.gap_parada = gap_parada
+        self.gap = None
+        self.parada_por_gap = False
+        self.limite_inferior = None
+        if limite_inferior or gap_parada is not None:
+            self.limite_inferior = calcular_limite_inferior(populacao.matriz_distancias, populacao.drone,
+                                                            populacao.gerenciador_vento, populacao.estado_inicial,
+                                                            coordenadas=populacao.coordenadas)
+        self.memetico = None
+        self._memetico_stats = None
+        if memetico:
+            self.memetico = BuscaLocalMemetica(populacao.matriz_distancias, fracao_memetica,
+                                               orcamento_memetico, workers_memeticos, self.dados, self.rng)
     
     def executar_geracao(self):
         """
@@ -43,8 +137,19 @@ class AlgoritmoGenetico:
         Returns:
             dict: Estatísticas da geração
         """
-        # Avaliar população atual
-        self.populacao.avaliar_populacao()
+        # Avaliar população atual (com corte branch-and-bound e substituto, se ativos)
+        self.populacao.avaliar_populacao(corte=self._limiar_corte(), substituto=self.substituto,
+                                         avaliador=self.avaliador)
+        # Limiar sobre toda a geração: rotas abortadas entram com o limite
+        # inferior (já acima do corte) e as inviáveis com inf; só as que
+        # nem foram simuladas (estimadas pelo substituto) ficam de fora
+        self._fitness_anteriores = sorted(
+            ind.fitness for ind in self.populacao.individuos if not ind.fitness_estimado
+        )
+
+        # Creditar operadores que produziram os filhos recém-avaliados
+        if self.seletor is not None:
+            self._creditar_operadores()
         
         # Atualizar melhor global
         if self.populacao.melhor_individuo:
@@ -61,18 +166,48 @@ class AlgoritmoGenetico:
         else:
             self.taxa_mutacao = max(0.02, self.taxa_mutacao * 0.95)
         
+        # Medir diversidade (arestas) e decidir reinício parcial
+        if self.arestas.rotas == 0:
+            for individuo in self.populacao.individuos:
+                self.arestas.adicionar(individuo.coordenadas)
+        self._diversidade = self.arestas.resumo()
+        self._reiniciar = (self.reinicio_diversidade
+                           and self._diversidade['entropia_arestas'] < self.limiar_entropia)
+
         # Registrar métricas
         self._registrar_metricas()
         
         # Gerar próxima geração e substituir indivíduos
         proxima_geracao = self._criar_nova_populacao()
+        self._atualizar_arestas(self.populacao.individuos, proxima_geracao)
         self.populacao.individuos = proxima_geracao
         
         return self.populacao.get_estatisticas()
     
+    def _limiar_corte(self):
+        """Fitness no percentil configurado da geração anterior (None se inativo)."""
+        if not self.corte_avaliacao or not self._fitness_anteriores:
+            return None
+        pos = min(len(self._fitness_anteriores) - 1, int(self.percentil_corte * len(self._fitness_anteriores)))
+        limiar = self._fitness_anteriores[pos]
+        return limiar if limiar != float('inf') else None
+    
+    def _atualizar_arestas(self, anteriores, novos):
+        """Atualiza a frequência de arestas só com as rotas substituídas."""
+        for antigo, novo in zip(anteriores, novos):
+            self.arestas.substituir(antigo.coordenadas, novo.coordenadas)
+        for antigo in anteriores[len(novos):]:
+            self.arestas.remover(antigo.coordenadas)
+        for novo in novos[len(anteriores):]:
+            self.arestas.adicionar(novo.coordenadas)
+
     def _criar_nova_populacao(self):
         """Gera a próxima geração combinando elitismo, seleção, crossover e mutação."""
         proxima = []
+        qtd_elite = 0
+        vistos = set()
+        self._duplicatas_substituidas = 0
+        elite = []
 
         # preservar elite quando aplicável
         if self.elitismo and self.populacao.individuos:
@@ -81,29 +216,205 @@ class AlgoritmoGenetico:
             for membro in elite:
                 # tentativa de refinamento local (inversão) para a elite
                 candidato = self._mutacao_inversao(membro)
-                proxima.append(copy.deepcopy(candidato))
+                proxima.append(self._registrar_unico(copy.deepcopy(candidato), vistos))
+
+        # diversidade colapsada: re-semear o restante, metade com rotas
+        # aleatórias e metade com perturbações fortes da elite
+        if self._reiniciar and self.populacao.individuos:
+            sementes = elite or [min(self.populacao.individuos, key=lambda x: x.fitness)]
+            while len(proxima) < self.populacao.tamanho:
+                if len(proxima) % 2:
+                    novo = self.populacao.gerar_individuo_aleatorio()
+                else:
+                    novo = self._perturbar(self.rng.choice(sementes))
+                proxima.append(self._registrar_unico(novo, vistos))
+            self.reinicios += 1
 
         # completar população usando torneios, OX e mutações
         while len(proxima) < self.populacao.tamanho:
-            pai_a = self._selecao_torneio(k=5)
-            pai_b = self._selecao_torneio(k=5)
+            proxima.append(self._registrar_unico(self._gerar_filho(), vistos))
+
+        proxima = proxima[:self.populacao.tamanho]
+
+        if self.memetico is not None:
+            self._aplicar_memetico(proxima, qtd_elite)
 
-            if random.random() < self.taxa_crossover:
-                filho = self._crossover_ox(pai_a, pai_b)
+        return proxima
+
+    def _gerar_filho(self):
+        """Seleciona dois pais por torneio e produz um filho (crossover + mutação)."""
+        pai_a = self._selecao_torneio(k=self.tamanho_torneio)
+        pai_b = self._selecao_torneio(k=self.tamanho_torneio)
+
+        if self.seletor is not None:
+            return self._gerar_filho_adaptativo(pai_a, pai_b)
+
+        if self.rng.random() < self.taxa_crossover:
+            filho = self._crossover_ox(pai_a, pai_b)
+        else:
+            filho = copy.deepcopy(pai_a)
+
+        # decisão de mutar
+        if self.rng.random() < self.taxa_mutacao:
+            if self.rng.random() < 0.5:
+                filho = self._mutacao_troca(filho)
             else:
-                filho = copy.deepcopy(pai_a)
+                filho = self._mutacao_inversao(filho)
 
-            # decisão de mutar
-            if random.random() < self.taxa_mutacao:
-                if random.random() < 0.5:
-                    filho = self._mutacao_troca(filho)
-                else:
-                    filho = self._mutacao_inversao(filho)
+        return filho
+
+    def _registrar_unico(self, filho, vistos, tentativas=10):
+        """Calcula o hash do filho e, se a rota já existe, troca por um mutante novo.
+
+        O mutante aplica trocas aleatórias de dois pontos; cada troca
+        atualiza o hash em O(1) até obter uma rota ainda não vista.
 
-            proxima.append(filho)
+        Args:
+            filho: Individuo recém-criado
+            vistos: Conjunto de hashes da geração em construção
+            tentativas: Máximo de trocas antes de aceitar a repetição
+
+        Returns:
+            Individuo: O próprio filho ou o mutante que o substitui
+        """
+        if not self.eliminar_duplicatas:
+            return filho
+
+        tabela = self.populacao.zobrist
+        valor = tabela.hash_rota(filho.coordenadas)
+        if valor in vistos and len(filho.coordenadas) > 3:
+            coords = filho.coordenadas.copy()
+            for _ in range(tentativas):
+                a, b = self.rng.sample(range(1, len(coords) - 1), 2)
+                valor = tabela.atualizar_troca(valor, coords, a, b)
+                coords[a], coords[b] = coords[b], coords[a]
+                if valor not in vistos:
+                    break
+
+            mutante = self.populacao.novo_individuo(coords)
+            self._transferir_rastreio(filho, mutante)
+            filho = mutante
+            self._duplicatas_substituidas += 1
+
+        filho.hash_genoma = valor
+        vistos.add(valor)
+        return filho
+
+    @staticmethod
+    def _transferir_rastreio(origem, destino):
+        """Copia os dados de crédito de operadores de um filho para seu substituto."""
+        for atributo in ('operadores_usados', 'tempo_operadores', 'ganho_operadores', 'fitness_referencia',
+                         'tempo_memetico', 'ganho_memetico'):
+            if hasattr(origem, atributo):
+                setattr(destino, atributo, getattr(origem, atributo))
+
+    def _aplicar_memetico(self, proxima, qtd_elite):
+        """Substitui filhos (fora da elite) por versões refinadas por busca local."""
+        filhos = proxima[qtd_elite:]
+        refinadas, economia, tempos = self.memetico.aplicar([f.coordenadas for f in filhos])
 
-        return proxima[:self.populacao.tamanho]
+        # CPU e km do refinamento entram no crédito dos operadores do filho
+        for pos, segundos in tempos.items():
+            filhos[pos].tempo_memetico = segundos
+        for pos, coords in refinadas.items():
+            filhos[pos].ganho_memetico = self._comprimento(filhos[pos].coordenadas) - self._comprimento(coords)
+            novo = self.populacao.novo_individuo(coords)
+            self._transferir_rastreio(filhos[pos], novo)
+            proxima[qtd_elite + pos] = novo
+
+        if self.eliminar_duplicatas and refinadas:
+            # filhos refinados podem cair no mesmo ótimo local (ou em uma rota
+            # já presente): recalcular o hash e checar contra os demais
+            alterados = {qtd_elite + pos for pos in refinadas}
+            vistos = {ind.hash_genoma for i, ind in enumerate(proxima) if i not in alterados}
+            for i in sorted(alterados):
+                proxima[i] = self._registrar_unico(proxima[i], vistos)
+
+        self._memetico_stats = {'refinados': len(refinadas), 'economia_km': economia,
+                                'cpu_segundos': sum(tempos.values())}
     
+    def _comprimento(self, coordenadas):
+        """Comprimento (km) da rota pela matriz de distâncias da população."""
+        matriz = self.populacao.matriz_distancias
+        return matriz.distancia_rota(matriz.indices_da_rota(coordenadas))
+
+    def _gerar_filho_adaptativo(self, pai_a, pai_b):
+        """Gera um filho com operadores sorteados pelo seletor adaptativo.
+
+        Para o crédito pós-avaliação o filho guarda, por grupo, o operador
+        usado, seu tempo de CPU e a redução de comprimento da rota que ele
+        próprio causou (a partir do pai de melhor fitness, a referência).
+        """
+        usados, tempos, ganhos = {}, {}, {}
+        referencia = min((pai_a, pai_b), key=lambda pai: pai.fitness)
+        km = self._comprimento(referencia.coordenadas)
+
+        def medir(grupo, filho, inicio):
+            nonlocal km
+            tempos[grupo] = time.process_time() - inicio
+            novo = self._comprimento(filho.coordenadas)
+            ganhos[grupo] = km - novo
+            km = novo
+
+        inicio = time.process_time()
+        usados['crossover'] = self.seletor.escolher('crossover')
+        if usados['crossover'] == 'ox':
+            filho = self._crossover_ox(pai_a, pai_b)
+        else:
+            filho = copy.deepcopy(pai_a)
+        medir('crossover', filho, inicio)
+
+        if self.rng.random() < self.taxa_mutacao:
+            inicio = time.process_time()
+            usados['mutacao'] = self.seletor.escolher('mutacao')
+            if usados['mutacao'] == 'troca':
+                filho = self._mutacao_troca(filho)
+            else:
+                filho = self._mutacao_inversao(filho)
+            medir('mutacao', filho, inicio)
+
+        inicio = time.process_time()
+        usados['busca_local'] = self.seletor.escolher('busca_local')
+        if usados['busca_local'] == '2opt_amostrado':
+            filho = self._busca_local_amostrada(filho)
+        medir('busca_local', filho, inicio)
+
+        filho.operadores_usados = usados
+        filho.tempo_operadores = tempos
+        filho.ganho_operadores = ganhos
+        filho.fitness_referencia = referencia.fitness
+        filho.tempo_memetico = filho.ganho_memetico = 0.0
+        return filho
+
+    def _creditar_operadores(self, individuos=None):
+        """Atribui a cada operador a sua parte da melhoria por segundo dos filhos avaliados.
+
+        A melhoria de fitness do filho sobre a referência é repartida
+        entre as etapas na proporção dos km que cada uma reduziu (etapas
+        que alongaram a rota não recebem nada); a parte do refinamento
+        memético não vai para nenhum operador. O tempo de cada operador
+        soma sua CPU, a da avaliação e a do refinamento do filho.
+        """
+        for individuo in individuos if individuos is not None else self.populacao.individuos:
+            usados = getattr(individuo, 'operadores_usados', None)
+            if not usados:
+                continue
+
+            referencia = individuo.fitness_referencia
+            if referencia == float('inf') or individuo.fitness == float('inf'):
+                melhoria = 0.0
+            else:
+                melhoria = referencia - individuo.fitness
+
+            ganhos = {grupo: max(0.0, km) for grupo, km in individuo.ganho_operadores.items()}
+            total = sum(ganhos.values()) + max(0.0, individuo.ganho_memetico)
+            comum = getattr(individuo, 'tempo_avaliacao', 0.0) + individuo.tempo_memetico
+            for grupo, operador in usados.items():
+                parte = melhoria * ganhos[grupo] / total if total > 0 else 0.0
+                self.seletor.registrar(grupo, operador, parte, individuo.tempo_operadores[grupo] + comum)
+
+            individuo.operadores_usados = None
+
     def _selecao_torneio(self, k=3):
         """
         Seleção por torneio.
@@ -114,7 +425,7 @@ class AlgoritmoGenetico:
         Returns:
             Individuo: Indivíduo vencedor do torneio
         """
-        participantes = random.sample(self.populacao.individuos, min(k, len(self.populacao.individuos)))
+        participantes = self.rng.sample(self.populacao.individuos, min(k, len(self.populacao.individuos)))
         vencedor = min(participantes, key=lambda x: x.fitness)
         return vencedor
     
@@ -133,19 +444,22 @@ class AlgoritmoGenetico:
             return copy.deepcopy(pai1)
         
         # Selecionar segmento aleatório
-        start, end = sorted(random.sample(range(1, size - 1), 2))
+        start, end = sorted(self.rng.sample(range(1, size - 1), 2))
         
         # construir cromossomo-filho preservando início/fim
         filho_coords = [None] * size
         filho_coords[0] = pai1.coordenadas[0]
         filho_coords[-1] = pai1.coordenadas[-1]
         filho_coords[start:end] = pai1.coordenadas[start:end]
+        # conjunto de genes já colocados: teste de pertinência O(1) em vez de varrer a lista
+        presentes = set(filho_coords[start:end])
+        presentes.update((filho_coords[0], filho_coords[-1]))
 
         pos_insercao = end
         for gene in pai2.coordenadas:
             if gene.eh_unibrasil():
                 continue
-            if gene in filho_coords:
+            if gene in presentes:
                 continue
             # avançar até encontrar slot livre (ignora último índice)
             while pos_insercao < size - 1 and filho_coords[pos_insercao] is not None:
@@ -153,8 +467,9 @@ class AlgoritmoGenetico:
                 if pos_insercao >= size - 1:
                     pos_insercao = 1
             filho_coords[pos_insercao] = gene
+            presentes.add(gene)
 
-        return Individuo(filho_coords, self.populacao.drone, self.populacao.gerenciador_vento)
+        return self.populacao.novo_individuo(filho_coords)
     
     def _mutacao_troca(self, individuo):
         """
@@ -169,10 +484,10 @@ class AlgoritmoGenetico:
         coords = individuo.coordenadas.copy()
         posicoes = [i for i, c in enumerate(coords) if not c.eh_unibrasil() and i not in (0, len(coords)-1)]
         if len(posicoes) >= 2:
-            a, b = random.sample(posicoes, 2)
+            a, b = self.rng.sample(posicoes, 2)
             coords[a], coords[b] = coords[b], coords[a]
 
-        return Individuo(coords, self.populacao.drone, self.populacao.gerenciador_vento)
+        return self.populacao.novo_individuo(coords)
     
     def _mutacao_inversao(self, individuo):
         """
@@ -187,24 +502,104 @@ class AlgoritmoGenetico:
         coords = individuo.coordenadas.copy()
         candidatos = [i for i in range(1, len(coords)-1) if not coords[i].eh_unibrasil()]
         if len(candidatos) >= 2:
-            i, j = sorted(random.sample(candidatos, 2))
+            i, j = sorted(self.rng.sample(candidatos, 2))
             # aplicar reversão do segmento escolhido
             segmento = list(coords[i:j])
             segmento.reverse()
             coords[i:j] = segmento
 
-        return Individuo(coords, self.populacao.drone, self.populacao.gerenciador_vento)
+        return self.populacao.novo_individuo(coords)
+    
+    def _perturbar(self, individuo, inversoes=None):
+        """
+        Aplica várias inversões aleatórias seguidas (reinício parcial).
+
+        Args:
+            individuo: Indivíduo de partida
+            inversoes: Número de inversões (padrão: ~10% dos pontos, mínimo 3)
+
+        Returns:
+            Individuo: Novo indivíduo perturbado
+        """
+        coords = individuo.coordenadas.copy()
+        n = len(coords)
+        if n >= 4:
+            for _ in range(inversoes or max(3, n // 10)):
+                i, j = sorted(self.rng.sample(range(1, n - 1), 2))
+                coords[i:j + 1] = coords[i:j + 1][::-1]
+
+        return self.populacao.novo_individuo(coords)
+
+    def _busca_local_amostrada(self, individuo, tentativas=50):
+        """
+        Busca local 2-opt por amostragem: testa pares aleatórios e aplica
+        as reversões que encurtam a rota.
+        
+        Args:
+            individuo: Indivíduo a melhorar
+            tentativas: Número de pares (i, j) avaliados
+        
+        Returns:
+            Individuo: Novo indivíduo com a rota refinada
+        """
+        coords = individuo.coordenadas.copy()
+        n = len(coords)
+        if n < 5:
+            return self.populacao.novo_individuo(coords)
+
+        matriz = self.populacao.matriz_distancias
+        dist = matriz.distancias
+        rota = matriz.indices_da_rota(coords)
+        for _ in range(tentativas):
+            i, j = sorted(self.rng.sample(range(1, n - 1), 2))
+            a, b = rota[i - 1], rota[i]
+            c, d = rota[j], rota[j + 1]
+            delta = dist[a, c] + dist[b, d] - dist[a, b] - dist[c, d]
+            if delta < -1e-9:
+                rota[i:j + 1] = rota[i:j + 1][::-1]
+
+        return self.populacao.novo_individuo(matriz.coordenadas_da_rota(rota))
     
     def _registrar_metricas(self):
         """Empilha estatísticas da geração no histórico interno."""
         stats = self.populacao.get_estatisticas()
         stats["media_fitness"] = self.fitness_func.calcular_media_geracao(self.populacao.individuos)
+        if self.seletor is not None:
+            stats["operadores"] = self.seletor.resumo()
+        if self._memetico_stats is not None:
+            stats["memetico"] = self._memetico_stats
+        if self.eliminar_duplicatas:
+            stats["duplicatas_substituidas"] = self._duplicatas_substituidas
+        if self.substituto is not None:
+            stats["substituto"] = self.substituto.resumo()
+        if self._diversidade is not None:
+            stats["diversidade"] = dict(self._diversidade, reinicio=self._reiniciar)
+        self._registrar_gap(stats)
         self.historico.append(stats)
+
+    def _registrar_gap(self, stats):
+        """Acrescenta limite inferior e gap do melhor global às estatísticas."""
+        if self.limite_inferior is None or self.melhor_global is None:
+            return
+        self.gap = gap_otimalidade(self.melhor_global.fitness, self.limite_inferior['fitness'])
+        stats["limite_inferior"] = self.limite_inferior['fitness']
+        stats["gap"] = self.gap
+        self.parada_por_gap = self.gap_parada is not None and self.gap <= self.gap_parada
     
     def get_historico(self):
         """Retorna histórico de métricas de todas as gerações"""
         return self.historico
     
+    def encerrar(self):
+        """Libera recursos auxiliares (pools de processos e memória compartilhada)."""
+        if self.memetico is not None:
+            self.memetico.encerrar()
+        if self.avaliador is not None:
+            self.avaliador.encerrar()
+        if self.dados is not None:
+            self.dados.fechar()
+            self.dados = None
+    
     def get_melhor_individuo(self):
         """Retorna melhor indivíduo encontrado até agora"""
         return self.melhor_global or self.populacao.melhor_individuo
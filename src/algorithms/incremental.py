@@ -0,0 +1,77 @@
+"""Re-otimização incremental após inclusão/remoção de CEPs.
+
+Em vez de rodar o AG completo sobre todos os pontos quando poucos
+endereços mudam, a rota anterior é reaproveitada:
+
+1. a matriz de distâncias é atualizada só nas linhas/colunas novas;
+2. pontos removidos saem da rota e os novos entram por inserção mais barata;
+3. opcionalmente, um AG curto semeado com a rota reparada;
+4. busca local guiada pelo simulador com orçamento de CPU limitado.
+"""
+import copy
+import time
+
+from ..core.individuo import Individuo
+from ..core.populacao import Populacao
+from ..core.settings import Config
+from .busca_local_simulada import busca_local_simulada
+from .genetico import AlgoritmoGenetico
+
+
+def reotimizar_incremental(rota_anterior, matriz, drone, gerenciador_vento, adicionados=(), removidos=(),
+                           limite_segundos=5.0, geracoes=0, tamanho_populacao=20, modo_avaliacao=None):
+    """
+    Ajusta a melhor rota anterior a um conjunto de CEPs alterado.
+
+    Args:
+        rota_anterior: Rota anterior (lista de CEPs ou de `Coordenada`, ver `carregar_rota`)
+        matriz: MatrizDistancias do conjunto anterior
+        drone: Instância de Drone
+        gerenciador_vento: Instância de GerenciadorVento
+        adicionados: Lista de `Coordenada` novas
+        removidos: CEPs (ou `Coordenada`) retirados
+        limite_segundos: CPU da busca local de polimento
+        geracoes: Gerações de um AG curto semeado com a rota reparada (0 = sem AG)
+        tamanho_populacao: Indivíduos do AG curto
+        modo_avaliacao: 'guloso' ou 'split' (padrão: `Config.MODO_AVALIACAO`)
+
+    Returns:
+        dict: individuo, matriz (atualizada), fitness_reparado, fitness_final,
+        descartados, inseridos e segundos de CPU
+    """
+    inicio = time.process_time()
+    modo_avaliacao = modo_avaliacao or Config.MODO_AVALIACAO
+    matriz = matriz.atualizar(adicionados, removidos)
+    indices, descartados, inseridos = matriz.reparar_rota(rota_anterior)
+
+    melhor = Individuo(matriz.coordenadas_da_rota(indices), drone, gerenciador_vento)
+    fitness_reparado = melhor.avaliar(modo_avaliacao)
+
+    if geracoes > 0:
+        populacao = Populacao(matriz.coordenadas, drone, gerenciador_vento, tamanho_populacao,
+                              modo_avaliacao, matriz_distancias=matriz, sementes=[melhor.coordenadas])
+        algoritmo = AlgoritmoGenetico(populacao, eliminar_duplicatas=True)
+        try:
+            for _ in range(geracoes):
+                algoritmo.executar_geracao()
+        finally:
+            algoritmo.encerrar()
+        candidato = algoritmo.get_melhor_individuo()
+        if candidato is not None and candidato.fitness < melhor.fitness:
+            melhor = copy.deepcopy(candidato)
+
+    restante = None if limite_segundos is None else max(0.0, limite_segundos - (time.process_time() - inicio))
+    resultado = busca_local_simulada(melhor, matriz, limite_segundos=restante, modo=modo_avaliacao)
+    melhor.avaliar(modo_avaliacao)
+
+    return {
+        'individuo': melhor,
+        'matriz': matriz,
+        'fitness_reparado': fitness_reparado,
+        'fitness_final': melhor.fitness,
+        'movimentos_aceitos': resultado['movimentos_aceitos'],
+        'descartados': descartados,
+        'inseridos': inseridos,
+        'segundos': time.process_time() - inicio,
+    }
+
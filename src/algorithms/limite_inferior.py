@@ -0,0 +1,167 @@
+"""Limite inferior do fitness e gap de otimalidade.
+
+A distância de qualquer rota é limitada por baixo pela 1-árvore de
+Held-Karp sobre a matriz pré-calculada (árvore geradora mínima dos pontos
+intermediários + as duas arestas mais baratas da base), refinada por
+subgradiente nos pesos dos nós. Desse limite em km derivam-se:
+
+* tempo de voo mínimo, voando na velocidade máxima com o vento mais
+  forte da previsão a favor;
+* recargas mínimas, dividindo esse tempo pela carga útil da bateria
+  (autonomia menos a reserva), como em `Individuo._excede_corte`;
+* o fitness mínimo: recargas x custo de recarga + tempo x custo por
+  minuto + componente de distância (penalidades e taxas >= 0).
+"""
+import math
+import numpy as np
+
+
+def _arvore_minima(dist):
+    """Custo e graus da árvore geradora mínima (Prim vetorizado, O(n^2))."""
+    n = len(dist)
+    graus = np.zeros(n, dtype=np.int64)
+    if n < 2:
+        return 0.0, graus
+    na_arvore = np.zeros(n, dtype=bool)
+    na_arvore[0] = True
+    melhor = dist[0].copy()
+    pai = np.zeros(n, dtype=np.int64)
+    total = 0.0
+    for _ in range(n - 1):
+        j = int(np.argmin(np.where(na_arvore, np.inf, melhor)))
+        total += melhor[j]
+        graus[j] += 1
+        graus[pai[j]] += 1
+        na_arvore[j] = True
+        menores = dist[j] < melhor
+        melhor = np.where(menores, dist[j], melhor)
+        pai = np.where(menores, j, pai)
+    return total, graus
+
+
+def _uma_arvore(dist, pesos):
+    """Valor da 1-árvore (nó 0 especial) com pesos `pesos` e graus resultantes."""
+    ajustada = dist + pesos[:, None] + pesos[None, :]
+    custo, graus_resto = _arvore_minima(ajustada[1:, 1:])
+    duas = np.argpartition(ajustada[0, 1:], 1)[:2] + 1
+    graus = np.concatenate([[2], graus_resto])
+    graus[duas] += 1
+    valor = custo + ajustada[0, duas].sum() - 2.0 * pesos.sum()
+    return valor, graus
+
+
+def _vizinho_mais_proximo(dist):
+    """Comprimento de uma rota por vizinho mais próximo a partir do nó 0 (limite superior)."""
+    n = len(dist)
+    livres = np.ones(n, dtype=bool)
+    livres[0] = False
+    atual, total = 0, 0.0
+    for _ in range(n - 1):
+        j = int(np.argmin(np.where(livres, dist[atual], np.inf)))
+        total += dist[atual, j]
+        livres[j] = False
+        atual = j
+    return total + dist[atual, 0]
+
+
+def limite_distancia(dist, iteracoes=50, limite_superior=None, inicio=None):
+    """
+    Limite inferior (km) de Held-Karp para uma rota que passa por todos os nós.
+
+    Args:
+        dist: Matriz (n x n) de distâncias; o nó 0 é a base
+        iteracoes: Passos de subgradiente
+        limite_superior: Comprimento de uma rota conhecida (padrão: vizinho
+            mais próximo), usado no tamanho do passo
+        inicio: Índice do ponto de partida quando a rota é um caminho
+            `inicio` -> ... -> base (replanejamento); a aresta base-`inicio`
+            passa a custar zero, fechando o caminho em ciclo
+
+    Returns:
+        float: Limite inferior da distância total
+    """
+    dist = np.asarray(dist, dtype=float)
+    n = len(dist)
+    if n < 3:
+        return float(dist[0, 1]) if n == 2 and inicio is None else 0.0
+    if inicio is not None and inicio != 0:
+        dist = dist.copy()
+        dist[0, inicio] = dist[inicio, 0] = 0.0
+    if limite_superior is None:
+        limite_superior = _vizinho_mais_proximo(dist)
+
+    pesos = np.zeros(n)
+    melhor = -np.inf
+    passo = 2.0
+    sem_melhora = 0
+    for _ in range(iteracoes):
+        valor, graus = _uma_arvore(dist, pesos)
+        if valor > melhor + 1e-9:
+            melhor, sem_melhora = valor, 0
+        else:
+            sem_melhora += 1
+            if sem_melhora >= 5:
+                passo, sem_melhora = passo / 2.0, 0
+        subgradiente = graus - 2
+        norma = float((subgradiente ** 2).sum())
+        if norma == 0:
+            break  # a 1-árvore já é uma rota: limite exato
+        pesos = pesos + passo * max(0.0, limite_superior - valor) / norma * subgradiente
+    return float(max(melhor, 0.0))
+
+
+def calcular_limite_inferior(matriz, drone, gerenciador_vento, estado_inicial=None, iteracoes=50,
+                             coordenadas=None):
+    """
+    Limites inferiores de distância, tempo de voo, recargas e fitness.
+
+    Args:
+        matriz: MatrizDistancias das coordenadas da população (base incluída)
+        drone: Instância de Drone (usa seus `parametros`)
+        gerenciador_vento: GerenciadorVento (vento mais forte da previsão)
+        estado_inicial: EstadoMissao do replanejamento (opcional)
+        iteracoes: Passos de subgradiente
+        coordenadas: Pontos que a rota visita (padrão: todos os de `matriz`);
+            no replanejamento a matriz pode conter pontos já visitados, que
+            invalidariam o limite
+
+    Returns:
+        dict: distancia_km, tempo_voo_min, recargas e fitness
+    """
+    p = drone.parametros
+    if coordenadas is not None:
+        matriz = matriz.submatriz(coordenadas)
+    coordenadas = matriz.coordenadas
+    base = next(i for i, c in enumerate(coordenadas) if c.eh_unibrasil())
+    ordem = [base] + [i for i in range(len(coordenadas)) if i != base]
+    dist = matriz.distancias[np.ix_(ordem, ordem)]
+    inicio = None
+    bateria = drone.calcular_autonomia(p.velocidade_minima)
+    if estado_inicial is not None:
+        inicio = next(k for k, i in enumerate(ordem) if coordenadas[i].cep == estado_inicial.cep_atual)
+        if estado_inicial.bateria is not None:
+            bateria = estado_inicial.bateria
+
+    distancia = limite_distancia(dist, iteracoes, inicio=inicio)
+
+    vento_max = max(v for v, _ in gerenciador_vento.ventos_possiveis())
+    tempo_s = distancia / (p.velocidade_maxima + vento_max) * 3600
+    util = max(1.0, drone.calcular_autonomia(drone.velocidade_padrao) - p.battery_reserve_seconds)
+    recargas = max(0, math.ceil((tempo_s - max(0.0, bateria - p.battery_reserve_seconds)) / util - 1e-9))
+
+    fitness = (recargas * p.custo_recarga
+               + (tempo_s / 60.0) * p.custo_por_minuto
+               + (distancia / float(p.fitness_dist_normalization)) * p.fitness_peso_distancia)
+    return {
+        'distancia_km': distancia,
+        'tempo_voo_min': tempo_s / 60.0,
+        'recargas': recargas,
+        'fitness': fitness,
+    }
+
+
+def gap_otimalidade(fitness, limite):
+    """Gap relativo (fitness - limite) / fitness; 0 quando o limite é atingido."""
+    if fitness == float('inf') or fitness <= 0:
+        return float('inf') if fitness == float('inf') else 0.0
+    return max(0.0, (fitness - limite) / fitness)
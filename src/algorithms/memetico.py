@@ -0,0 +1,124 @@
+"""Modo memético: busca local limitada aplicada aos filhos de cada geração.
+
+Uma fração dos filhos recebe um passe de 2-opt/Or-opt sobre a matriz de
+distâncias antes da avaliação. Os passes rodam em um pool de processos e
+dividem um orçamento de CPU por geração. Os trabalhadores leem a matriz da
+memória compartilhada; só as rotas (índices) trafegam entre processos.
+"""
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .busca_local import busca_local_limitada
+from ..core.dados_compartilhados import DadosCompartilhados
+
+# Dados e matriz de distâncias do processo trabalhador (definidos no initializer)
+_DADOS_WORKER = None
+_DISTANCIAS_WORKER = None
+
+
+def _inicializar_worker(descritor):
+    global _DADOS_WORKER, _DISTANCIAS_WORKER
+    _DADOS_WORKER = DadosCompartilhados.anexar(descritor)
+    _DISTANCIAS_WORKER = _DADOS_WORKER.distancias
+
+
+def _refinar_medindo(rota, dist, limite_segundos):
+    """Busca local limitada; retorna (rota, segundos de CPU gastos)."""
+    inicio = time.process_time()
+    rota = busca_local_limitada(rota, dist, limite_segundos)
+    return rota, time.process_time() - inicio
+
+
+def _refinar_no_worker(rota, limite_segundos):
+    return _refinar_medindo(rota, _DISTANCIAS_WORKER, limite_segundos)
+
+
+class BuscaLocalMemetica:
+    """Refina parte dos filhos com busca local dentro de um orçamento de CPU."""
+
+    def __init__(self, matriz, fracao=0.2, orcamento_segundos=1.0, workers=1, dados=None, rng=None):
+        """
+        Inicializa o refinador.
+
+        Args:
+            matriz: Instância de MatrizDistancias
+            fracao: Fração dos filhos (0-1) que recebe busca local
+            orcamento_segundos: CPU total por geração somando todos os workers
+            workers: Número de processos (<= 1 executa no próprio processo)
+            dados: DadosCompartilhados já publicados; se omitido e houver
+                mais de um worker, a matriz é publicada pelo próprio refinador
+            rng: `random.Random` que sorteia os filhos (padrão: o módulo `random`)
+        """
+        self.matriz = matriz
+        self.fracao = fracao
+        self.orcamento_segundos = orcamento_segundos
+        self.workers = max(1, int(workers))
+        self.dados = dados
+        self.rng = rng if rng is not None else random
+        self._dados_proprios = None
+        self._pool = None
+
+    def _obter_pool(self):
+        if self._pool is None:
+            if self.dados is None:
+                self._dados_proprios = DadosCompartilhados.publicar(self.matriz.coordenadas, matriz=self.matriz)
+                self.dados = self._dados_proprios
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_inicializar_worker,
+                initargs=(self.dados.descritor,),
+            )
+        return self._pool
+
+    def aplicar(self, rotas):
+        """
+        Refina uma amostra das rotas.
+
+        Args:
+            rotas: Lista de listas de `Coordenada`
+
+        Returns:
+            tuple: (dict {posição: rota refinada}, km economizados,
+                dict {posição: segundos de CPU} de todas as rotas da amostra)
+        """
+        qtd = int(round(len(rotas) * self.fracao))
+        if qtd <= 0:
+            return {}, 0.0, {}
+
+        posicoes = self.rng.sample(range(len(rotas)), min(qtd, len(rotas)))
+        indices = [self.matriz.indices_da_rota(rotas[p]) for p in posicoes]
+
+        # cada tarefa recebe uma fatia do orçamento total de CPU; com vários
+        # workers a geração termina antes, mas a CPU somada é a mesma
+        limite = self.orcamento_segundos / len(indices)
+
+        if self.workers > 1:
+            medidas = list(self._obter_pool().map(_refinar_no_worker, indices, [limite] * len(indices)))
+        else:
+            medidas = [_refinar_medindo(r, self.matriz.distancias, limite) for r in indices]
+
+        resultado = {}
+        economia = 0.0
+        tempos = {pos: segundos for pos, (_, segundos) in zip(posicoes, medidas)}
+        for pos, antes, (depois, _) in zip(posicoes, indices, medidas):
+            ganho = self.matriz.distancia_rota(antes) - self.matriz.distancia_rota(depois)
+            if ganho > 1e-9:
+                resultado[pos] = self.matriz.coordenadas_da_rota(depois)
+                economia += ganho
+
+        return resultado, economia, tempos
+
+    def encerrar(self):
+        """Finaliza o pool de processos, se criado."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._dados_proprios is not None:
+            self._dados_proprios.fechar()
+            self._dados_proprios = None
+            self.dados = None
+
+    def __repr__(self):
+        return (f"BuscaLocalMemetica(fracao={self.fracao}, "
+                f"orcamento={self.orcamento_segundos}s, workers={self.workers})")
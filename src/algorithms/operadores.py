@@ -0,0 +1,87 @@
+"""Seleção adaptativa de operadores do AG (bandido multi-braço).
+
+Cada grupo de operadores (crossover, mutação, busca local) mantém uma
+média exponencial da recompensa de cada braço, onde a recompensa é a
+melhoria de fitness produzida dividida pelos segundos de CPU gastos.
+As probabilidades seguem *probability matching* com piso mínimo, para
+que nenhum operador deixe de ser experimentado.
+"""
+import random
+
+
+class SeletorOperadores:
+    """Escolhe operadores proporcionalmente à melhoria por segundo de CPU."""
+
+    def __init__(self, grupos, taxa_aprendizado=0.3, probabilidade_minima=0.05, rng=None):
+        """
+        Inicializa o seletor.
+
+        Args:
+            grupos: dict {nome_do_grupo: [nomes dos operadores]}
+            taxa_aprendizado: Peso da recompensa mais recente (0-1)
+            probabilidade_minima: Piso de probabilidade para cada operador
+            rng: `random.Random` usado nos sorteios (padrão: o módulo `random`)
+        """
+        self.grupos = {grupo: list(ops) for grupo, ops in grupos.items()}
+        self.taxa_aprendizado = taxa_aprendizado
+        self.probabilidade_minima = probabilidade_minima
+        self.rng = rng if rng is not None else random
+
+        self.recompensas = {g: {op: 0.0 for op in ops} for g, ops in self.grupos.items()}
+        self.probabilidades = {g: {op: 1.0 / len(ops) for op in ops} for g, ops in self.grupos.items()}
+        self.usos = {g: {op: 0 for op in ops} for g, ops in self.grupos.items()}
+
+    def escolher(self, grupo):
+        """Sorteia um operador do grupo segundo as probabilidades atuais."""
+        ops = self.grupos[grupo]
+        pesos = [self.probabilidades[grupo][op] for op in ops]
+        escolhido = self.rng.choices(ops, weights=pesos, k=1)[0]
+        self.usos[grupo][escolhido] += 1
+        return escolhido
+
+    def registrar(self, grupo, operador, melhoria, segundos):
+        """
+        Credita ao operador a melhoria obtida por segundo de CPU.
+
+        Args:
+            grupo: Nome do grupo
+            operador: Nome do operador utilizado
+            melhoria: Redução de fitness atribuída ao operador (negativos contam como zero)
+            segundos: CPU do operador mais a de avaliar e refinar o filho
+        """
+        recompensa = max(0.0, melhoria) / max(segundos, 1e-6)
+        medias = self.recompensas[grupo]
+        medias[operador] += self.taxa_aprendizado * (recompensa - medias[operador])
+        self._atualizar_probabilidades(grupo)
+
+    def _atualizar_probabilidades(self, grupo):
+        """Recalcula probabilidades do grupo (probability matching com piso)."""
+        ops = self.grupos[grupo]
+        piso = min(self.probabilidade_minima, 1.0 / len(ops))
+        medias = self.recompensas[grupo]
+        total = sum(medias.values())
+
+        if total <= 0:
+            self.probabilidades[grupo] = {op: 1.0 / len(ops) for op in ops}
+            return
+
+        livre = 1.0 - piso * len(ops)
+        self.probabilidades[grupo] = {op: piso + livre * medias[op] / total for op in ops}
+
+    def resumo(self, reiniciar_usos=True):
+        """
+        Retorna probabilidades atuais e contagem de usos por grupo.
+
+        Args:
+            reiniciar_usos: Se True, zera as contagens após a leitura
+        """
+        dados = {
+            'probabilidades': {g: dict(p) for g, p in self.probabilidades.items()},
+            'usos': {g: dict(u) for g, u in self.usos.items()},
+        }
+        if reiniciar_usos:
+            self.usos = {g: {op: 0 for op in ops} for g, ops in self.grupos.items()}
+        return dados
+
+    def __repr__(self):
+        return f"SeletorOperadores({', '.join(self.grupos)})"
@@ -0,0 +1,95 @@
+"""Avaliação de rotas em processos trabalhadores.
+
+Os trabalhadores anexam os dados estáticos publicados em memória
+compartilhada (`core.dados_compartilhados`) e recriam uma única vez
+coordenadas, drone e vento; os `ParametrosExecucao` do processo principal
+seguem junto com o descritor. Cada tarefa recebe apenas o genoma (lista de
+índices) e devolve a tupla de `Individuo.resultado`.
+"""
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ..core.dados_compartilhados import DadosCompartilhados
+from ..core.individuo import Individuo
+
+# Contexto do processo trabalhador (definido no initializer)
+_CONTEXTO = None
+
+
+def _inicializar_worker(descritor, parametros, estado_inicial):
+    global _CONTEXTO
+    dados = DadosCompartilhados.anexar(descritor)
+    _CONTEXTO = {
+        'dados': dados,
+        'coordenadas': dados.coordenadas(),
+        'matriz': dados.matriz(),
+        'drone': dados.drone(parametros),
+        'vento': dados.gerenciador_vento(),
+        'estado_inicial': estado_inicial,
+    }
+
+
+def _avaliar_no_worker(genoma, modo, corte):
+    inicio = time.process_time()
+    coords = [_CONTEXTO['coordenadas'][i] for i in genoma]
+    individuo = Individuo(coords, _CONTEXTO['drone'], _CONTEXTO['vento'], estado_inicial=_CONTEXTO['estado_inicial'])
+    individuo.avaliar(modo, corte=corte, matriz=_CONTEXTO['matriz'] if corte is not None else None)
+    return individuo.resultado(), time.process_time() - inicio
+
+
+class AvaliadorParalelo:
+    """Distribui simulações de rotas entre processos sobre dados compartilhados."""
+
+    def __init__(self, dados, workers, parametros=None, estado_inicial=None):
+        """
+        Args:
+            dados: DadosCompartilhados publicados pelo processo principal
+            workers: Número de processos
+            parametros: ParametrosExecucao enviados aos trabalhadores (padrão: `Config`)
+            estado_inicial: EstadoMissao das rotas avaliadas (replanejamento)
+        """
+        self.dados = dados
+        self.workers = max(1, int(workers))
+        self.parametros = parametros
+        self.estado_inicial = estado_inicial
+        self._pool = None
+
+    def _obter_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_inicializar_worker,
+                initargs=(self.dados.descritor, self.parametros, self.estado_inicial),
+            )
+        return self._pool
+
+    def avaliar(self, individuos, matriz, modo='guloso', corte=None):
+        """
+        Avalia os indivíduos nos trabalhadores e aplica os resultados.
+
+        Args:
+            individuos: Lista de Individuo (modificados no lugar)
+            matriz: MatrizDistancias usada para converter rotas em genomas
+            modo: Modo de avaliação ('guloso' ou 'split')
+            corte: Fitness de corte (opcional)
+        """
+        if not individuos:
+            return
+
+        genomas = [matriz.indices_da_rota(ind.coordenadas) for ind in individuos]
+        lote = max(1, len(genomas) // (self.workers * 4))
+        resultados = self._obter_pool().map(
+            _avaliar_no_worker, genomas, [modo] * len(genomas), [corte] * len(genomas), chunksize=lote)
+
+        for individuo, (resultado, segundos) in zip(individuos, resultados):
+            individuo.aplicar_resultado(resultado)
+            individuo.tempo_avaliacao = segundos
+
+    def encerrar(self):
+        """Finaliza o pool de processos, se criado."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __repr__(self):
+        return f"AvaliadorParalelo(workers={self.workers})"
@@ -0,0 +1,246 @@
+"""Recozimento simulado sobre uma única rota.
+
+Alternativa ao AG para re-planejamentos rápidos: em vez de uma população,
+uma rota é perturbada por reversões de segmento (2-opt) e realocações de
+um ponto, escolhidas entre vizinhos próximos na matriz de distâncias. Cada
+movimento é avaliado pelo mesmo simulador do AG, re-simulando apenas o
+sufixo a partir do primeiro trecho alterado (`Individuo.simular_sufixo`),
+e aceito pelo critério de Metropolis. Movimentos que tornam a rota
+inviável são sempre desfeitos.
+
+A busca otimiza o mesmo objetivo que reporta: `populacao.modo_avaliacao`.
+No modo 'split' as posições de recarga mudam com a rota inteira, então cada
+movimento é reavaliado por completo (DP + simulação) em vez de só o sufixo.
+
+Resfriamentos:
+
+* 'geometrico': a temperatura é multiplicada por `alfa` a cada passo;
+* 'tempo': a temperatura cai exponencialmente de T0 a
+  `fracao_temperatura_final * T0` ao longo do orçamento de relógio de
+  `executar` (sem orçamento, vale o geométrico).
+"""
+import math
+
+import numpy as np
+
+from .busca_local_simulada import aplicar_movimento, pre_otimizar
+from .solver import Solver
+
+RESFRIAMENTOS = ('geometrico', 'tempo')
+
+
+class RecozimentoSimulado(Solver):
+    """Motor de recozimento simulado com avaliação incremental de movimentos."""
+
+    def __init__(self, populacao, passos_por_temperatura=200, resfriamento='geometrico', alfa=0.95,
+                 temperatura_inicial=None, aceitacao_inicial=0.1, fracao_temperatura_final=1e-3,
+                 vizinhos=10, folga_km=2.0, pre_otimizar_distancia=True):
+        """
+        Args:
+            populacao: Instância de Populacao; a busca parte do seu melhor
+                indivíduo (drone, vento, matriz e estado inicial são os dela)
+            passos_por_temperatura: Movimentos testados por passo (`executar_geracao`)
+            resfriamento: 'geometrico' ou 'tempo'
+            alfa: Fator do resfriamento geométrico (0-1)
+            temperatura_inicial: T0 (None = calibrada para que a fração
+                `aceitacao_inicial` dos movimentos de piora seja aceita)
+            aceitacao_inicial: Probabilidade de aceitar a piora mediana no início
+            fracao_temperatura_final: Temperatura final / T0 no resfriamento 'tempo'
+            vizinhos: Vizinhos mais próximos usados para sortear movimentos
+            folga_km: Movimentos que aumentam a distância além disto são
+                descartados sem simular (None = simula todos)
+            pre_otimizar_distancia: Aplica 2-opt/Or-opt por distância à rota
+                inicial e mantém o resultado se o fitness não piorar
+        """
+        if resfriamento not in RESFRIAMENTOS:
+            raise ValueError(f"Resfriamento desconhecido: {resfriamento}")
+        self.populacao = populacao
+        self.rng = populacao.rng
+        self.modo = populacao.modo_avaliacao
+        self.matriz = populacao.matriz_distancias
+        self.passos_por_temperatura = passos_por_temperatura
+        self.resfriamento = resfriamento
+        self.alfa = alfa
+        self.aceitacao_inicial = aceitacao_inicial
+        self.fracao_temperatura_final = fracao_temperatura_final
+        self.folga_km = folga_km
+        self.pre_otimizar_distancia = pre_otimizar_distancia
+        self.temperatura_inicial = temperatura_inicial
+        self.temperatura = temperatura_inicial
+        self.historico = []
+        self.avaliacoes = 0
+
+        k = max(1, min(vizinhos, len(self.matriz) - 1))
+        distancias = self.matriz.distancias.copy()
+        np.fill_diagonal(distancias, np.inf)
+        self._vizinhos = np.argsort(distancias, axis=1)[:, :k]
+
+        self.atual = None
+        self.fitness_atual = float('inf')
+        self._melhor_coordenadas = None
+        self.melhor_fitness = float('inf')
+        self._melhor = None
+
+    def _iniciar(self):
+        """Parte do melhor indivíduo da população (avaliando-a se preciso)."""
+        populacao = self.populacao
+        if populacao.melhor_individuo is None:
+            populacao.avaliar_populacao()
+        origem = populacao.melhor_individuo or populacao.individuos[0]
+        self.atual = populacao.novo_individuo(list(origem.coordenadas))
+        if self.modo == 'split':
+            self.fitness_atual = self.atual.avaliar('split')
+        else:
+            self.atual.simular_rota(registrar_estados=True)
+            self.fitness_atual = self.atual.calcular_fitness()
+        if self.pre_otimizar_distancia and self.atual.viabilidade:
+            self.fitness_atual = pre_otimizar(self.atual, self.matriz, self.fitness_atual, None, self.modo)
+        self._atualizar_posicoes()
+        self._registrar_melhor()
+        if self.temperatura is None:
+            self.temperatura = self.temperatura_inicial = self._calibrar_temperatura()
+
+    def _atualizar_posicoes(self):
+        self._rota = self.matriz.indices_da_rota(self.atual.coordenadas)
+        ultimo = len(self._rota) - 1
+        self._posicoes = {indice: p for p, indice in enumerate(self._rota) if 0 < p < ultimo}
+
+    def _registrar_melhor(self):
+        self._melhor_coordenadas = list(self.atual.coordenadas)
+        self.melhor_fitness = self.fitness_atual
+        self._melhor = None
+
+    def _sortear_movimento(self):
+        """Sorteia (tipo, i, j) para `aplicar_movimento`, ou None se a rota for curta demais."""
+        n = len(self._rota)
+        if n < 5:
+            return None
+        i = self.rng.randint(1, n - 2)
+        j = self._posicoes.get(int(self.rng.choice(self._vizinhos[self._rota[i - 1]])))
+        if self.rng.random() < 0.5:
+            # reversão que torna rota[i-1] adjacente ao vizinho sorteado
+            if j is not None and j > i:
+                return 'reversao', i, j
+            if j is not None and j < i - 1:
+                return 'reversao', j + 1, i - 1
+        elif j is not None and j not in (i - 1, i):
+            # realocação do vizinho sorteado para logo após rota[i-1]
+            return 'realocacao', j, i - 1
+        a, b = sorted(self.rng.sample(range(1, n - 1), 2))
+        return 'reversao', a, b
+
+    def _delta_km(self, movimento):
+        """Variação de distância do movimento, calculada na matriz."""
+        tipo, i, j = movimento
+        r, d = self._rota, self.matriz.distancias
+        if tipo == 'reversao':
+            return d[r[i - 1], r[j]] + d[r[i], r[j + 1]] - d[r[i - 1], r[i]] - d[r[j], r[j + 1]]
+        x = r[i]
+        remocao = d[r[i - 1], x] + d[x, r[i + 1]] - d[r[i - 1], r[i + 1]]
+        return d[r[j], x] + d[x, r[j + 1]] - d[r[j], r[j + 1]] - remocao
+
+    def _testar(self, movimento):
+        """Aplica o movimento e reavalia a rota; retorna (fitness, estado salvo).
+
+        No modo guloso só o sufixo a partir do primeiro trecho alterado é
+        re-simulado; no split a rota é reavaliada inteira.
+        """
+        tipo, i, j = movimento
+        novas, inicio = aplicar_movimento(self.atual.coordenadas, tipo, i, j)
+        if self.modo == 'split':
+            salvo = self.atual.salvar_resultado(0)
+            self.atual.coordenadas = novas
+            self.avaliacoes += 1
+            return self.atual.avaliar('split'), salvo
+
+        salvo = self.atual.salvar_resultado(inicio)
+        self.atual.coordenadas = novas
+        self.atual.simular_sufixo(inicio)
+        self.avaliacoes += 1
+        return self.atual.calcular_fitness(), salvo
+
+    def _calibrar_temperatura(self, amostras=30):
+        """T0 tal que a piora mediana seja aceita com probabilidade `aceitacao_inicial`."""
+        pioras = []
+        for _ in range(amostras if self.atual.viabilidade else 0):
+            movimento = self._sortear_movimento()
+            if movimento is None:
+                break
+            novo, salvo = self._testar(movimento)
+            self.atual.restaurar_resultado(salvo)
+            if self.fitness_atual < novo < float('inf'):
+                pioras.append(novo - self.fitness_atual)
+        if not pioras:
+            return 1.0
+        return -float(np.median(pioras)) / math.log(self.aceitacao_inicial)
+
+    def _resfriar(self):
+        limite = getattr(self, 'limite_segundos', None)
+        if self.resfriamento == 'tempo' and limite:
+            fracao = min(1.0, self.segundos_decorridos() / limite)
+            self.temperatura = self.temperatura_inicial * self.fracao_temperatura_final ** fracao
+        else:
+            self.temperatura *= self.alfa
+
+    def executar_geracao(self):
+        """
+        Testa `passos_por_temperatura` movimentos e resfria.
+
+        Returns:
+            dict: Estatísticas do passo
+        """
+        if self.atual is None:
+            self._iniciar()
+
+        limite = getattr(self, 'limite_segundos', None)
+        aceitos = testados = 0
+        for _ in range(self.passos_por_temperatura):
+            if not self.atual.viabilidade:
+                break  # sem estados de simulação para re-simular sufixos
+            if limite and self.segundos_decorridos() >= limite:
+                break  # orçamento de relógio de `executar` esgotado no meio do passo
+            movimento = self._sortear_movimento()
+            if movimento is None:
+                break
+            if self.folga_km is not None and self._delta_km(movimento) > self.folga_km:
+                continue
+            novo, salvo = self._testar(movimento)
+            testados += 1
+            aceitar = novo <= self.fitness_atual or (
+                novo != float('inf') and self.temperatura > 0
+                and self.rng.random() < math.exp(-(novo - self.fitness_atual) / self.temperatura))
+            if not aceitar:
+                self.atual.restaurar_resultado(salvo)
+                continue
+            aceitos += 1
+            self.fitness_atual = novo
+            self._atualizar_posicoes()
+            if novo < self.melhor_fitness - 1e-9:
+                self._registrar_melhor()
+
+        stats = {
+            'geracao': len(self.historico),
+            'melhor_fitness': self.melhor_fitness,
+            'fitness_atual': self.fitness_atual,
+            'temperatura': self.temperatura,
+            'taxa_aceitacao': aceitos / testados if testados else 0.0,
+            'avaliacoes': self.avaliacoes,
+            'individuos_viaveis': int(self.atual.viabilidade),
+            'tamanho': 1,
+        }
+        self.historico.append(stats)
+        self._resfriar()
+        return stats
+
+    def get_melhor_individuo(self):
+        """Melhor rota encontrada, avaliada no modo da população."""
+        if self._melhor_coordenadas is None:
+            return None
+        if self._melhor is None:
+            self._melhor = self.populacao.novo_individuo(list(self._melhor_coordenadas))
+            self._melhor.avaliar(self.populacao.modo_avaliacao)
+        return self._melhor
+
+    def __repr__(self):
+        return (f"RecozimentoSimulado({self.resfriamento}, T={self.temperatura}, "
+                f"melhor={self.melhor_fitness:.2f})")
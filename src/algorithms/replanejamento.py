@@ -0,0 +1,74 @@
+"""Replanejamento em horizonte rolante a partir do estado da missão.
+
+Quando a previsão de vento muda no meio da semana, só o restante da rota
+precisa ser otimizado: os pontos já visitados saem do problema e as rotas
+partem do CEP, dia, minuto e bateria atuais (`EstadoMissao`). A rota em
+execução, se informada, semeia a população.
+"""
+import copy
+import time
+
+from ..core.populacao import Populacao
+from .busca_local_simulada import busca_local_simulada
+from .genetico import AlgoritmoGenetico
+
+
+def replanejar(estado, coordenadas, drone, gerenciador_vento, rota_anterior=None, matriz=None,
+               geracoes=20, tamanho_populacao=30, limite_segundos=None, modo_avaliacao=None,
+               opcoes_ag=None):
+    """
+    Otimiza o restante da missão a partir de `estado`.
+
+    Args:
+        estado: EstadoMissao (CEP atual, dia, minuto, bateria e visitados)
+        coordenadas: Todas as `Coordenada` da missão
+        drone: Instância de Drone
+        gerenciador_vento: Previsão de vento atualizada
+        rota_anterior: Plano em execução (CEPs ou `Coordenada`) usado como semente (opcional)
+        matriz: MatrizDistancias de `coordenadas` já calculada (opcional; é
+            restrita aos pontos ainda não visitados)
+        geracoes: Gerações do AG sobre o sufixo
+        tamanho_populacao: Indivíduos por geração
+        limite_segundos: CPU da busca local final (None = sem busca local)
+        modo_avaliacao: 'guloso' ou 'split' (padrão: `Config.MODO_AVALIACAO`)
+        opcoes_ag: Parâmetros adicionais de `AlgoritmoGenetico` (opcional)
+
+    Returns:
+        dict: individuo (rota de `estado.cep_atual` até a base), restantes
+        (pontos ainda a visitar) e segundos de CPU
+    """
+    inicio = time.process_time()
+    if not any(c.cep == estado.cep_atual for c in coordenadas):
+        raise ValueError(f"CEP atual {estado.cep_atual} não pertence às coordenadas")
+
+    pontos = [c for c in coordenadas
+              if c.eh_unibrasil() or c.cep == estado.cep_atual or c.cep not in estado.visitados]
+    if matriz is not None:
+        # a população (e quem publica sua matriz) supõe que ela cubra só `pontos`
+        matriz = matriz.submatriz(pontos)
+    populacao = Populacao(pontos, drone, gerenciador_vento, tamanho_populacao, modo_avaliacao,
+                          matriz_distancias=matriz, sementes=[rota_anterior] if rota_anterior else None,
+                          estado_inicial=estado)
+
+    algoritmo = AlgoritmoGenetico(populacao, **(opcoes_ag or {}))
+    try:
+        for _ in range(geracoes):
+            algoritmo.executar_geracao()
+        # a última geração criada ainda não foi avaliada
+        populacao.avaliar_populacao()
+        candidatos = [ind for ind in (algoritmo.get_melhor_individuo(), populacao.melhor_individuo)
+                      if ind is not None]
+    finally:
+        algoritmo.encerrar()
+    melhor = copy.deepcopy(min(candidatos, key=lambda ind: ind.fitness))
+
+    if limite_segundos:
+        busca_local_simulada(melhor, populacao.matriz_distancias, limite_segundos=limite_segundos,
+                             modo=populacao.modo_avaliacao)
+    melhor.avaliar(populacao.modo_avaliacao)
+
+    return {
+        'individuo': melhor,
+        'restantes': sum(1 for c in pontos if not c.eh_unibrasil() and c.cep != estado.cep_atual),
+        'segundos': time.process_time() - inicio,
+    }
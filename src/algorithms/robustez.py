@@ -0,0 +1,52 @@
+"""Avaliação da população pelo fitness robusto a erros de previsão do vento.
+
+Cada rota é simulada normalmente com a previsão nominal (métricas e
+trechos continuam disponíveis para relatórios) e, em seguida, sob todos
+os cenários de `CenariosVento` de uma só vez (`core.robustez`). O fitness
+usado pelo AG passa a ser a média ou o CVaR da distribuição por cenário.
+"""
+import time
+
+from ..core.robustez import simular_cenarios, medida_risco
+
+
+class AvaliadorRobusto:
+    """Substitui o fitness de cada indivíduo por uma medida de risco sobre cenários de vento."""
+
+    def __init__(self, cenarios, medida='cvar', alfa=0.9):
+        """
+        Args:
+            cenarios: CenariosVento
+            medida: 'media' ou 'cvar'
+            alfa: Nível do CVaR (0-1)
+        """
+        medida_risco([0.0], medida, alfa)  # valida a medida
+        self.cenarios = cenarios
+        self.medida = medida
+        self.alfa = alfa
+
+    def avaliar(self, individuos, matriz=None, modo='guloso', corte=None):
+        """
+        Avalia os indivíduos (mesma interface de `AvaliadorParalelo.avaliar`).
+
+        O corte branch-and-bound não se aplica ao fitness robusto e é
+        ignorado; os cenários são sempre simulados com a regra gulosa.
+
+        Args:
+            individuos: Lista de Individuo (modificados no lugar)
+            matriz: Não utilizada (compatibilidade)
+            modo: Modo da simulação nominal ('guloso' ou 'split')
+            corte: Ignorado
+        """
+        for individuo in individuos:
+            inicio = time.process_time()
+            individuo.fitness_nominal = individuo.avaliar(modo)
+            resultado = simular_cenarios(individuo, self.cenarios)
+            individuo.fitness = medida_risco(resultado['fitness'], self.medida, self.alfa)
+            individuo.tempo_avaliacao = time.process_time() - inicio
+
+    def encerrar(self):
+        """Nada a liberar (compatibilidade com `AvaliadorParalelo`)."""
+
+    def __repr__(self):
+        return f"AvaliadorRobusto({len(self.cenarios)} cenários, {self.medida})"
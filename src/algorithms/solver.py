@@ -0,0 +1,106 @@
+"""Interface comum dos motores de busca (AG e recozimento simulado).
+
+Todo motor avança em passos (`executar_geracao`), guarda o histórico de
+estatísticas e expõe o melhor indivíduo; `executar` roda passos até um
+número fixo ou até esgotar um orçamento de relógio, o que permite comparar
+motores diferentes com o mesmo tempo de parede (`comparar_solvers`).
+"""
+import time
+from abc import ABC, abstractmethod
+
+
+class Solver(ABC):
+    """Base dos motores de busca de rotas."""
+
+    gap = None
+    parada_por_gap = False
+
+    @abstractmethod
+    def executar_geracao(self):
+        """Executa um passo da busca e retorna suas estatísticas."""
+
+    @abstractmethod
+    def get_melhor_individuo(self):
+        """Retorna o melhor indivíduo encontrado até agora."""
+
+    def get_historico(self):
+        """Retorna o histórico de estatísticas dos passos."""
+        return self.historico
+
+    def encerrar(self):
+        """Libera recursos auxiliares (nada por padrão)."""
+
+    def executar(self, iteracoes=None, limite_segundos=None, ao_passo=None):
+        """
+        Roda passos até `iteracoes`, até esgotar `limite_segundos` de relógio
+        ou até `parada_por_gap` (o que vier primeiro).
+
+        Args:
+            iteracoes: Número máximo de passos (None = sem limite)
+            limite_segundos: Orçamento de relógio (`time.perf_counter`);
+                o passo em andamento sempre termina
+            ao_passo: Função chamada como `ao_passo(passo, stats)` (opcional)
+
+        Returns:
+            int: Passos executados
+        """
+        if iteracoes is None and limite_segundos is None:
+            raise ValueError("Informe iteracoes ou limite_segundos")
+        self.inicio_execucao = time.perf_counter()
+        self.limite_segundos = limite_segundos
+        passos = 0
+        while iteracoes is None or passos < iteracoes:
+            stats = self.executar_geracao()
+            passos += 1
+            if ao_passo is not None:
+                ao_passo(passos, stats)
+            if self.parada_por_gap:
+                break
+            if limite_segundos is not None and self.segundos_decorridos() >= limite_segundos:
+                break
+        return passos
+
+    def segundos_decorridos(self):
+        """Tempo de relógio desde o início de `executar` (0 fora dele)."""
+        inicio = getattr(self, 'inicio_execucao', None)
+        return 0.0 if inicio is None else time.perf_counter() - inicio
+
+
+def comparar_solvers(fabricas, limite_segundos=None, iteracoes=None):
+    """
+    Roda vários motores com o mesmo orçamento de relógio.
+
+    Sem `limite_segundos`, o primeiro motor roda `iteracoes` passos e o
+    tempo que ele gastou vira o orçamento dos demais.
+
+    Args:
+        fabricas: {nome: função sem argumentos que cria o Solver}
+        limite_segundos: Orçamento de relógio de cada motor
+        iteracoes: Passos do primeiro motor quando não há `limite_segundos`
+
+    Returns:
+        list: Um dict por motor com nome, solver, melhor (indivíduo),
+        fitness, passos e segundos
+    """
+    resultados = []
+    for nome, fabrica in fabricas.items():
+        solver = fabrica()
+        try:
+            if limite_segundos is None:
+                passos = solver.executar(iteracoes=iteracoes)
+                limite_segundos = solver.segundos_decorridos()
+            else:
+                passos = solver.executar(limite_segundos=limite_segundos)
+            segundos = solver.segundos_decorridos()
+        finally:
+            solver.encerrar()
+        melhor = solver.get_melhor_individuo()
+        resultados.append({
+            'nome': nome,
+            'solver': solver,
+            'melhor': melhor,
+            'fitness': melhor.fitness if melhor is not None else float('inf'),
+            'passos': passos,
+            'segundos': segundos,
+        })
+    return resultados
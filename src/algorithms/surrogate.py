@@ -0,0 +1,162 @@
+"""Modelo substituto para pré-selecionar filhos antes da simulação.
+
+O fitness é dominado pela distância e pelo número de pousos, que cresce
+com o tempo de voo. O modelo prevê o fitness como combinação linear de
+(1, km, pousos estimados), com a distância obtida da matriz pré-calculada
+de forma vetorizada para todos os filhos de uma vez. Somente a fração de
+melhor previsão é simulada, mais uma pequena amostra sorteada dos demais
+(controle); os coeficientes são recalibrados a cada geração por mínimos
+quadrados contra os fitness simulados. Sem o controle, a correlação de
+postos seria medida só entre os melhores previstos e superestimaria a
+confiabilidade do modelo.
+"""
+import math
+import random
+import numpy as np
+
+
+def correlacao_spearman(a, b):
+    """Correlação de postos de Spearman (None se indefinida)."""
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if len(a) < 3:
+        return None
+    postos_a = np.argsort(np.argsort(a))
+    postos_b = np.argsort(np.argsort(b))
+    if postos_a.std() == 0 or postos_b.std() == 0:
+        return None
+    return float(np.corrcoef(postos_a, postos_b)[0, 1])
+
+
+class ModeloSubstituto:
+    """Prevê o fitness de rotas e escolhe quais merecem simulação completa."""
+
+    def __init__(self, matriz, drone, fracao_simulada=0.5, minimo_amostras=10, janela=500,
+                 fracao_controle=0.1, rng=None):
+        """
+        Args:
+            matriz: Instância de MatrizDistancias
+            drone: Drone usado para estimar o alcance por carga
+            fracao_simulada: Fração (0-1) dos filhos simulados por geração
+            minimo_amostras: Amostras reais antes de começar a filtrar
+            janela: Máximo de amostras recentes usadas na calibração
+            fracao_controle: Fração (0-1) dos filhos fora da seleção que
+                também é simulada, sorteada (ao menos 1 se > 0)
+            rng: `random.Random` do sorteio do controle (padrão: o módulo `random`)
+        """
+        self.matriz = matriz
+        self.fracao_simulada = fracao_simulada
+        self.fracao_controle = fracao_controle
+        self.rng = rng if rng is not None else random
+        self.minimo_amostras = minimo_amostras
+        self.janela = janela
+
+        parametros = drone.parametros
+        carga = drone.calcular_autonomia(drone.velocidade_padrao) - parametros.battery_reserve_seconds
+        self.alcance_km = max(1e-6, carga / 3600.0 * drone.velocidade_padrao)
+
+        # coeficientes iniciais: componente de distância do fitness + custo por pouso
+        self.coeficientes = np.array([
+            0.0,
+            parametros.fitness_peso_distancia / parametros.fitness_dist_normalization,
+            parametros.custo_recarga,
+        ])
+        self._amostras_x = np.empty((0, 3))
+        self._amostras_y = np.empty(0)
+        self._ultimo = {'simulados': 0, 'estimados': 0, 'controle': 0, 'correlacao_spearman': None}
+        self._controle = 0
+
+    def caracteristicas(self, individuos):
+        """Matriz (m, 3) com [1, km, pousos estimados] de cada indivíduo."""
+        rotas = np.array([self.matriz.indices_da_rota(ind.coordenadas) for ind in individuos],
+                         dtype=np.int64).reshape(len(individuos), -1)
+        km = self.matriz.distancias[rotas[:, :-1], rotas[:, 1:]].sum(axis=1)
+        return np.column_stack([np.ones(len(km)), km, np.floor(km / self.alcance_km)])
+
+    def prever(self, individuos):
+        """Fitness previsto para cada indivíduo."""
+        return self.caracteristicas(individuos) @ self.coeficientes
+
+    def filtrar(self, individuos):
+        """
+        Escolhe os indivíduos a simular; os demais recebem o fitness previsto.
+
+        São simulados os de melhor previsão e uma amostra sorteada dos
+        restantes (controle), que entra na correlação e na calibração.
+
+        Args:
+            individuos: Indivíduos ainda não avaliados
+
+        Returns:
+            list: Indivíduos que devem ser simulados
+        """
+        self._controle = 0
+        if not individuos:
+            return []
+
+        x = self.caracteristicas(individuos)
+        previsoes = x @ self.coeficientes
+        for ind, caract, prev in zip(individuos, x, previsoes):
+            ind.caracteristicas_substituto = caract
+            ind.fitness_previsto = float(prev)
+
+        if len(self._amostras_y) < self.minimo_amostras:
+            return list(individuos)
+
+        qtd = max(1, math.ceil(len(individuos) * self.fracao_simulada))
+        ordem = np.argsort(previsoes, kind='stable')
+        restantes = [int(i) for i in ordem[qtd:]]
+        controle = []
+        if restantes and self.fracao_controle > 0:
+            k = min(len(restantes), max(1, math.ceil(len(restantes) * self.fracao_controle)))
+            controle = self.rng.sample(restantes, k)
+        self._controle = len(controle)
+
+        sorteados = set(controle)
+        simular = [individuos[i] for i in ordem[:qtd]] + [individuos[i] for i in controle]
+        for i in restantes:
+            if i not in sorteados:
+                individuos[i].marcar_estimado(previsoes[i])
+        return simular
+
+    def calibrar(self, simulados, estimados=0):
+        """
+        Acrescenta os resultados reais às amostras e reajusta os coeficientes.
+
+        Args:
+            simulados: Indivíduos que passaram por `filtrar` e foram simulados
+                (os melhores previstos e a amostra de controle)
+            estimados: Quantos indivíduos ficaram só com a estimativa
+        """
+        reais = [ind for ind in simulados
+                 if ind.exato and ind.fitness != float('inf')
+                 and getattr(ind, 'caracteristicas_substituto', None) is not None]
+
+        correlacao = None
+        if reais:
+            correlacao = correlacao_spearman([ind.fitness_previsto for ind in reais],
+                                             [ind.fitness for ind in reais])
+            x = np.array([ind.caracteristicas_substituto for ind in reais])
+            y = np.array([ind.fitness for ind in reais])
+            self._amostras_x = np.vstack([self._amostras_x, x])[-self.janela:]
+            self._amostras_y = np.concatenate([self._amostras_y, y])[-self.janela:]
+
+            if len(self._amostras_y) >= self.minimo_amostras:
+                self.coeficientes = np.linalg.lstsq(self._amostras_x, self._amostras_y, rcond=None)[0]
+
+        for ind in simulados:
+            ind.caracteristicas_substituto = None
+
+        self._ultimo = {
+            'simulados': len(simulados),
+            'estimados': estimados,
+            'controle': self._controle,
+            'correlacao_spearman': correlacao,
+        }
+
+    def resumo(self):
+        """Estatísticas da última geração e coeficientes atuais."""
+        return dict(self._ultimo, coeficientes=self.coeficientes.tolist())
+
+    def __repr__(self):
+        return f"ModeloSubstituto(fracao={self.fracao_simulada}, amostras={len(self._amostras_y)})"
@@ -1,4 +1,7 @@
 """Inicialização do pacote config"""
 from .settings import Config
+from .parametros import ParametrosExecucao
+from .estado_missao import EstadoMissao
+from .robustez import CenariosVento, simular_cenarios
 
-__all__ = ['Config']
+__all__ = ['Config', 'ParametrosExecucao', 'EstadoMissao', 'CenariosVento', 'simular_cenarios']
@@ -0,0 +1,185 @@
+"""Dados estáticos do problema publicados em memória compartilhada.
+
+Coordenadas, matrizes de distância/direção, tabela de vento e autonomia por
+velocidade são copiadas uma única vez para um bloco de
+`multiprocessing.shared_memory`. Processos trabalhadores recebem apenas o
+descritor (nome do bloco e layout) e anexam arrays numpy sobre o mesmo
+buffer, sem cópia; entre processos trafegam só genomas (listas de índices)
+e tuplas de resultado.
+"""
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .entities.coordenada import Coordenada
+from .entities.drone import Drone
+from .entities.vento import GerenciadorVento
+from ..utils_custom.matriz_distancias import MatrizDistancias
+
+# Codificação das direções cardeais e faixas horárias da tabela de vento
+CARDINAIS = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+             'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
+FAIXAS = ('06h', '09h', '12h', '15h', '18h', '21h')
+
+_ALINHAMENTO = 64
+
+
+def _tabelas_vento(gerenciador_vento):
+    """Converte a previsão em arrays (dias, velocidade por faixa, índice cardeal)."""
+    dias = sorted(gerenciador_vento.previsao)
+    velocidades = np.zeros((len(dias), len(FAIXAS)), dtype=np.float64)
+    direcoes = np.full((len(dias), len(FAIXAS)), -1, dtype=np.int8)
+    for i, dia in enumerate(dias):
+        for j, faixa in enumerate(FAIXAS):
+            info = gerenciador_vento.previsao[dia].get(faixa)
+            if info is not None:
+                velocidades[i, j] = info['velocidade']
+                direcoes[i, j] = CARDINAIS.index(info['direcao'].upper())
+    return np.asarray(dias, dtype=np.int32), velocidades, direcoes
+
+
+class DadosCompartilhados:
+    """Tabelas do problema em um bloco de memória compartilhada."""
+
+    def __init__(self, bloco, layout, dono):
+        """
+        Use `publicar` (processo principal) ou `anexar` (trabalhadores).
+
+        Args:
+            bloco: SharedMemory com os dados
+            layout: {nome: (offset, shape, dtype)} de cada array
+            dono: Se True, `fechar` também remove o bloco do sistema
+        """
+        self._bloco = bloco
+        self.layout = layout
+        self._dono = dono
+        self._arrays = {
+            nome: np.ndarray(shape, dtype=np.dtype(dtype), buffer=bloco.buf, offset=offset)
+            for nome, (offset, shape, dtype) in layout.items()
+        }
+        self._coordenadas = None
+
+    @classmethod
+    def publicar(cls, coordenadas, drone=None, gerenciador_vento=None, matriz=None):
+        """
+        Copia os dados estáticos para um novo bloco compartilhado.
+
+        Args:
+            coordenadas: Lista de `Coordenada`
+            drone: Drone cuja autonomia por velocidade é tabelada (opcional)
+            gerenciador_vento: Previsão de vento (opcional)
+            matriz: MatrizDistancias já calculada (opcional)
+
+        Returns:
+            DadosCompartilhados: Instância dona do bloco
+        """
+        if matriz is None:
+            matriz = MatrizDistancias(coordenadas)
+
+        arrays = {
+            'ceps': np.asarray([c.cep for c in coordenadas], dtype='U16'),
+            'latitudes': np.asarray([c.latitude for c in coordenadas], dtype=np.float64),
+            'longitudes': np.asarray([c.longitude for c in coordenadas], dtype=np.float64),
+            'distancias': np.ascontiguousarray(matriz.distancias, dtype=np.float64),
+            'direcoes': np.ascontiguousarray(matriz.direcoes, dtype=np.float64),
+        }
+        if gerenciador_vento is not None:
+            dias, vento_velocidade, vento_direcao = _tabelas_vento(gerenciador_vento)
+            arrays.update(vento_dias=dias, vento_velocidade=vento_velocidade, vento_direcao=vento_direcao)
+        if drone is not None:
+            velocidades = np.asarray(drone.get_velocidades_validas(), dtype=np.int32)
+            arrays['velocidades'] = velocidades
+            arrays['autonomias'] = np.asarray([drone.calcular_autonomia(int(v)) for v in velocidades],
+                                              dtype=np.float64)
+
+        layout = {}
+        tamanho = 0
+        for nome, array in arrays.items():
+            tamanho = -(-tamanho // _ALINHAMENTO) * _ALINHAMENTO
+            layout[nome] = (tamanho, array.shape, array.dtype.str)
+            tamanho += array.nbytes
+
+        bloco = shared_memory.SharedMemory(create=True, size=max(1, tamanho))
+        dados = cls(bloco, layout, dono=True)
+        for nome, array in arrays.items():
+            dados._arrays[nome][...] = array
+        return dados
+
+    @classmethod
+    def anexar(cls, descritor):
+        """
+        Anexa (sem cópia) a um bloco publicado por outro processo.
+
+        Args:
+            descritor: Tupla retornada por `descritor` no processo dono
+        """
+        nome, layout = descritor
+        return cls(shared_memory.SharedMemory(name=nome), layout, dono=False)
+
+    @property
+    def descritor(self):
+        """Tupla pequena e serializável que permite `anexar` em outro processo."""
+        return self._bloco.name, self.layout
+
+    def __getattr__(self, nome):
+        arrays = self.__dict__.get('_arrays')
+        if arrays is not None and nome in arrays:
+            return arrays[nome]
+        raise AttributeError(nome)
+
+    # ------------------------------------------------------------------
+    # Reconstrução dos objetos do domínio no trabalhador
+    # ------------------------------------------------------------------
+    def coordenadas(self):
+        """Lista de `Coordenada` (construída uma vez por processo)."""
+        if self._coordenadas is None:
+            self._coordenadas = [Coordenada(str(cep), lat, lon) for cep, lat, lon
+                                 in zip(self.ceps, self.latitudes, self.longitudes)]
+        return self._coordenadas
+
+    def matriz(self, geometria=None, latitude_referencia=None):
+        """MatrizDistancias apoiada diretamente nos arrays compartilhados.
+
+        Args:
+            geometria: Geometria em que a matriz publicada foi calculada
+                (padrão: `Config.GEOMETRIA`)
+            latitude_referencia: Referência da geometria plana (padrão: `Config`)
+        """
+        return MatrizDistancias.de_arrays(self.coordenadas(), self.distancias, self.direcoes,
+                                          geometria, latitude_referencia)
+
+    def drone(self, parametros=None):
+        """Drone com a autonomia por velocidade lida da tabela compartilhada.
+
+        Args:
+            parametros: ParametrosExecucao do processo dono (padrão: `Config` local)
+        """
+        tabela = {int(v): float(a) for v, a in zip(self.velocidades, self.autonomias)}
+        return Drone(tabela_autonomia=tabela, parametros=parametros)
+
+    def gerenciador_vento(self):
+        """GerenciadorVento com a previsão reconstruída da tabela compartilhada."""
+        previsao = {}
+        for i, dia in enumerate(self.vento_dias):
+            faixas = {}
+            for j, faixa in enumerate(FAIXAS):
+                if self.vento_direcao[i, j] >= 0:
+                    faixas[faixa] = {'velocidade': self.vento_velocidade[i, j].item(),
+                                     'direcao': CARDINAIS[self.vento_direcao[i, j]]}
+            previsao[int(dia)] = faixas
+        return GerenciadorVento(previsao=previsao)
+
+    def fechar(self):
+        """Solta as views e o bloco; o dono também remove o bloco do sistema."""
+        if self._bloco is None:
+            return
+        self._arrays = {}
+        self._coordenadas = None
+        self._bloco.close()
+        if self._dono:
+            self._bloco.unlink()
+        self._bloco = None
+
+    def __repr__(self):
+        n = self.layout['ceps'][1][0]
+        return f"DadosCompartilhados({n} pontos, dono={self._dono})"
@@ -1,6 +1,7 @@
 """
 Modelo de Coordenada geográfica
 """
+from ...utils_custom.calculos import projetar_plano
 
 class Coordenada:
     """Representa uma coordenada geográfica com CEP associado"""
@@ -9,6 +10,13 @@ class Coordenada:
         self.cep = str(cep)
         self.latitude = float(latitude)
         self.longitude = float(longitude)
+        self._plana = None
+
+    def posicao_plana(self):
+        """(x, y) em km da projeção plana rápida (calculada uma única vez)."""
+        if self._plana is None:
+            self._plana = projetar_plano(self.latitude, self.longitude)
+        return self._plana
     
     def eh_unibrasil(self):
         """Verifica se é o CEP do Unibrasil (ponto inicial/final)"""
@@ -1,31 +1,42 @@
 """Classe que encapsula autonomia e consumo do drone."""
-from ..settings import Config
+from ..parametros import ParametrosExecucao
 
 
 class Drone:
     """Modelo simples do drone (autonomia, carregamento e velocidades)."""
 
-    def __init__(self):
-        self.config = Config
-        self.velocidade_padrao = Config.VELOCIDADE_MINIMA
+    def __init__(self, tabela_autonomia=None, parametros=None):
+        """
+        Args:
+            tabela_autonomia: {velocidade: autonomia (s)} pré-calculada (opcional);
+                velocidades fora da tabela usam a fórmula
+            parametros: ParametrosExecucao (padrão: resolvidos de `Config`)
+        """
+        self.parametros = parametros if parametros is not None else ParametrosExecucao.de_config()
+        self.tabela_autonomia = dict(tabela_autonomia) if tabela_autonomia else None
+        self.velocidade_padrao = self.parametros.velocidade_minima
         self.bateria_atual = self.calcular_autonomia(self.velocidade_padrao)
     
     def calcular_autonomia(self, velocidade):
         """Retorna autonomia estimada (segundos) para uma velocidade dada."""
+        if self.tabela_autonomia is not None and velocidade in self.tabela_autonomia:
+            return self.tabela_autonomia[velocidade]
         if not self.velocidade_valida(velocidade):
             raise ValueError(f"Velocidade {velocidade} km/h inválida")
 
-        fator = (Config.VELOCIDADE_REFERENCIA / velocidade) ** 2
-        autonomia = Config.AUTONOMIA_REFERENCIA * fator * Config.FATOR_CORRECAO
+        p = self.parametros
+        fator = (p.velocidade_referencia / velocidade) ** 2
+        autonomia = p.autonomia_referencia * fator * p.fator_correcao
         return autonomia
     
     def velocidade_valida(self, velocidade):
         """Valida se velocidade atende restrições (múltiplo de 4 entre limites)."""
-        return (Config.VELOCIDADE_MINIMA <= velocidade <= Config.VELOCIDADE_MAXIMA and velocidade % 4 == 0)
+        p = self.parametros
+        return (p.velocidade_minima <= velocidade <= p.velocidade_maxima and velocidade % 4 == 0)
     
     def get_velocidades_validas(self):
         """Lista todas as velocidades permitidas pelo drone."""
-        return list(range(Config.VELOCIDADE_MINIMA, Config.VELOCIDADE_MAXIMA + 1, 4))
+        return list(self.parametros.velocidades_validas)
     
     def consumir_bateria(self, tempo_voo_segundos):
         """Subtrai tempo (s) da bateria atual; retorna se ainda há carga."""
@@ -1,12 +1,13 @@
 """Representa um segmento de voo com seus cálculos de tempo/consumo."""
-from ..settings import Config
-from ...utils_custom.calculos import distancia_haversine, calcular_direcao, calcular_velocidade_efetiva
+from ..parametros import ParametrosExecucao
+from ...utils_custom.calculos import distancia_e_direcao, calcular_velocidade_efetiva
 
 
 class Trecho:
     """Trecho entre `origem` e `destino` contendo métricas calculadas."""
 
-    def __init__(self, origem, destino, velocidade, dia, hora_partida, vento_velocidade, vento_angulo):
+    def __init__(self, origem, destino, velocidade, dia, hora_partida, vento_velocidade, vento_angulo,
+                 parametros=None):
         self.origem = origem
         self.destino = destino
         self.velocidade = int(velocidade)
@@ -14,13 +15,12 @@ class Trecho:
         self.hora_partida = int(hora_partida)
         self.vento_velocidade = vento_velocidade
         self.vento_angulo = vento_angulo
+        self.parametros = parametros
 
         self._calcular_metricas()
 
     def _calcular_metricas(self):
-        self.distancia = distancia_haversine(self.origem.latitude, self.origem.longitude, self.destino.latitude, self.destino.longitude)
-
-        self.direcao_voo = calcular_direcao(self.origem.latitude, self.origem.longitude, self.destino.latitude, self.destino.longitude)
+        self.distancia, self.direcao_voo = distancia_e_direcao(self.origem, self.destino, self.parametros)
 
         self.velocidade_efetiva = calcular_velocidade_efetiva(self.velocidade, self.direcao_voo, self.vento_velocidade, self.vento_angulo)
 
@@ -34,8 +34,9 @@ class Trecho:
         return self.hora_partida + (self.tempo_voo_segundos // 60)
 
     def precisa_recarregar(self, bateria_atual):
-        reserva = getattr(Config, 'BATTERY_RESERVE_SECONDS', 0)
-        return (self.consumo_bateria + reserva) > bateria_atual
+        if self.parametros is None:
+            self.parametros = ParametrosExecucao.de_config()
+        return (self.consumo_bateria + self.parametros.battery_reserve_seconds) > bateria_atual
 
     def __repr__(self):
         return (f"Trecho({self.origem.cep}→{self.destino.cep}: {self.distancia:.1f}km, v={self.velocidade}km/h, t={self.tempo_voo_segundos}s)")
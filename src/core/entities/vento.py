@@ -1,12 +1,43 @@
 """Previsão de vento (tabela estática reformatada internamente)."""
-from ...utils_custom.calculos import cardinal_para_angulo
+import csv
+
+from ...utils_custom.calculos import cardinal_para_angulo, angulo_para_cardinal
 
 
 class GerenciadorVento:
     """Fornece vento (velocidade e ângulo) para dia/hora."""
 
-    def __init__(self):
-        self.previsao = self._carregar_previsao()
+    def __init__(self, previsao=None):
+        """
+        Args:
+            previsao: Tabela {dia: {faixa: {'velocidade', 'direcao'}}} no formato
+                de `_carregar_previsao` (padrão: tabela embutida)
+        """
+        self.previsao = previsao if previsao is not None else self._carregar_previsao()
+
+    @classmethod
+    def de_csv(cls, caminho):
+        """
+        Carrega a previsão de um CSV `day,hour,wind_kmh,wind_dir_deg`.
+
+        A direção em graus (de onde o vento sopra) é arredondada para o
+        ponto cardeal mais próximo; a hora vira a faixa (`6` -> `'06h'`).
+
+        Args:
+            caminho: Caminho do CSV (ex.: data/wind_table.csv)
+
+        Returns:
+            GerenciadorVento: Gerenciador com a previsão lida
+        """
+        previsao = {}
+        with open(caminho, 'r', encoding='utf-8') as fh:
+            for linha in csv.DictReader(fh):
+                faixa = f"{int(linha['hour']):02d}h"
+                previsao.setdefault(int(linha['day']), {})[faixa] = {
+                    'velocidade': float(linha['wind_kmh']),
+                    'direcao': angulo_para_cardinal(linha['wind_dir_deg']),
+                }
+        return cls(previsao=previsao)
 
     def _carregar_previsao(self):
         # tabela compacta de exemplo (mantida igual)
@@ -32,6 +63,16 @@ class GerenciadorVento:
 
         return {'velocidade': vento_info['velocidade'], 'direcao': vento_info['direcao'], 'angulo': angulo_destino}
 
+    def ventos_possiveis(self):
+        """Conjunto de (velocidade, ângulo) que `get_vento` pode retornar."""
+        ventos = {(0, 0)}  # dias fora da previsão
+        for dia, faixas in self.previsao.items():
+            for faixa in faixas:
+                hora = int(faixa.rstrip('h')) * 60
+                vento = self.get_vento(dia, hora)
+                ventos.add((vento['velocidade'], vento['angulo']))
+        return ventos
+
     def _hora_para_faixa(self, hora_minutos):
         horas = hora_minutos // 60
         if horas < 9:
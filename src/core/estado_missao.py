@@ -0,0 +1,65 @@
+"""Estado de uma missão em andamento, ponto de partida do replanejamento.
+
+O simulador normalmente parte da base no dia 1 às `hora_inicio` com a
+bateria cheia. Um `EstadoMissao` descreve onde o drone está de fato (CEP,
+dia, minuto do dia, bateria e pontos já visitados) para que apenas o
+restante da rota seja otimizado.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EstadoMissao:
+    """Posição, relógio e bateria do drone no meio da missão.
+
+    Attributes:
+        cep_atual: CEP onde o drone está (primeiro ponto da rota replanejada)
+        dia: Dia da missão (1 = primeiro dia)
+        hora_minutos: Minuto do dia (ex.: 14:30 -> 870)
+        bateria: Autonomia restante em segundos (None = cheia)
+        visitados: CEPs já fotografados (não entram no replanejamento)
+    """
+
+    cep_atual: str
+    dia: int = 1
+    hora_minutos: int = 6 * 60
+    bateria: float = None
+    visitados: frozenset = frozenset()
+
+    @classmethod
+    def do_plano(cls, individuo, trechos_executados):
+        """
+        Estado após executar os primeiros trechos de um plano simulado.
+
+        Args:
+            individuo: Individuo com a rota planejada
+            trechos_executados: Quantos trechos já foram voados
+
+        Returns:
+            EstadoMissao: Estado na origem do trecho seguinte
+        """
+        individuo.simular_rota(registrar_estados=True)
+        ctx = individuo._estados[trechos_executados]['ctx']
+        coordenadas = individuo.coordenadas
+        return cls(cep_atual=coordenadas[trechos_executados].cep, dia=ctx['dia'],
+                   hora_minutos=ctx['hora_minutos'], bateria=ctx['bateria'],
+                   visitados=frozenset(c.cep for c in coordenadas[:trechos_executados + 1]))
+
+    def contexto(self, drone, parametros):
+        """Contexto inicial do simulador (`Individuo._criar_contexto_inicial`)."""
+        bateria = self.bateria
+        if bateria is None:
+            bateria = drone.calcular_autonomia(parametros.velocidade_minima)
+        return {
+            'dia': self.dia,
+            'minutos_abs': (self.dia - 1) * 24 * 60 + self.hora_minutos - parametros.hora_inicio,
+            'hora_minutos': self.hora_minutos,
+            'bateria': bateria,
+        }
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # imutável: cópias de indivíduos compartilham a mesma instância
+        return self
@@ -0,0 +1,65 @@
+"""Hash de genoma no estilo Zobrist para detectar rotas repetidas.
+
+Cada par (posição, ponto) recebe uma chave pseudoaleatória de 64 bits e o
+hash da rota é o XOR das chaves de todos os pares. Assim uma troca de dois
+pontos atualiza o hash em O(1), sem percorrer a rota. As chaves são
+derivadas de duas tabelas de tamanho n (posições e pontos) misturadas com
+splitmix64, evitando uma tabela n x n.
+"""
+import numpy as np
+
+_MASCARA = (1 << 64) - 1
+
+
+def _splitmix64(x):
+    """Mistura de bits (splitmix64) vetorizada sobre uint64."""
+    with np.errstate(over='ignore'):
+        x = (x + np.uint64(0x9E3779B97F4A7C15))
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+
+class TabelaZobrist:
+    """Calcula e atualiza hashes de rotas sobre um conjunto fixo de coordenadas."""
+
+    def __init__(self, coordenadas, semente=2025):
+        """
+        Args:
+            coordenadas: Lista de `Coordenada` (CEPs únicos)
+            semente: Semente das chaves pseudoaleatórias
+        """
+        self.indice = {c.cep: i for i, c in enumerate(coordenadas)}
+        rng = np.random.default_rng(semente)
+        n = len(coordenadas)
+        # rotas têm até n + 1 posições (base no início e no fim)
+        self._posicoes = rng.integers(0, 2 ** 63, size=n + 2, dtype=np.uint64)
+        self._pontos = rng.integers(0, 2 ** 63, size=n, dtype=np.uint64)
+
+    def _chaves(self, posicoes, pontos):
+        return _splitmix64(self._posicoes[posicoes] ^ self._pontos[pontos])
+
+    def _chave(self, posicao, ponto):
+        return int(self._chaves(np.array([posicao]), np.array([ponto]))[0])
+
+    def hash_rota(self, rota):
+        """Hash (int de 64 bits) de uma lista de `Coordenada`."""
+        pontos = np.fromiter((self.indice[c.cep] for c in rota), dtype=np.int64, count=len(rota))
+        chaves = self._chaves(np.arange(len(rota)), pontos)
+        return int(np.bitwise_xor.reduce(chaves)) & _MASCARA
+
+    def atualizar_troca(self, valor, rota, a, b):
+        """
+        Hash após trocar as posições `a` e `b` (calculado antes da troca).
+
+        Args:
+            valor: Hash atual da rota
+            rota: Rota ainda sem a troca aplicada
+            a, b: Posições trocadas
+        """
+        pa, pb = self.indice[rota[a].cep], self.indice[rota[b].cep]
+        return (valor ^ self._chave(a, pa) ^ self._chave(b, pb)
+                ^ self._chave(a, pb) ^ self._chave(b, pa)) & _MASCARA
+
+    def __repr__(self):
+        return f"TabelaZobrist({len(self._pontos)} pontos)"
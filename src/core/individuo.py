@@ -4,14 +4,17 @@ As funções foram levemente reescritas internamente (nomes locais e
 docstrings) para reduzir similaridade com versões externas, sem
 alterar o comportamento público.
 """
+import math
+import numpy as np
 from .entities.trecho import Trecho
-from .settings import Config
+from .split import AvaliadorSplit, planejar_recargas
 from ..utils_custom.time_utils import abs_to_day_and_minuto
+from ..utils_custom.calculos import distancia_e_direcao
 
 class Individuo:
     """Representa uma solução completa (rota) para o problema de otimização"""
     
-    def __init__(self, coordenadas, drone, gerenciador_vento):
+    def __init__(self, coordenadas, drone, gerenciador_vento, parametros=None, estado_inicial=None):
         """
         Cria um indivíduo com uma sequência de coordenadas.
         
@@ -19,10 +22,16 @@ class Individuo:
             coordenadas: Lista de objetos Coordenada
             drone: Instância de Drone
             gerenciador_vento: Instância de GerenciadorVento
+            parametros: ParametrosExecucao (padrão: os do drone)
+            estado_inicial: EstadoMissao de onde a rota parte (padrão: base,
+                dia 1, `hora_inicio`, bateria cheia); a rota começa em
+                `estado_inicial.cep_atual` e termina na base
         """
         self.coordenadas = coordenadas
         self.drone = drone
         self.gerenciador_vento = gerenciador_vento
+        self.parametros = parametros if parametros is not None else drone.parametros
+        self.estado_inicial = estado_inicial
         
         # Inicializar estruturas de dados
         self._inicializar_metricas()
@@ -54,7 +63,11 @@ class Individuo:
     
     def validar_estrutura(self):
         """Verifica regras básicas da rota (início/fim/duplicatas)."""
-        if len(self.coordenadas) < 2 or not self.coordenadas[0].eh_unibrasil():
+        if self.estado_inicial is not None:
+            inicio_valido = len(self.coordenadas) >= 2 and self.coordenadas[0].cep == self.estado_inicial.cep_atual
+        else:
+            inicio_valido = len(self.coordenadas) >= 2 and self.coordenadas[0].eh_unibrasil()
+        if not inicio_valido:
             self.marcar_invalida(10000)
 
         if not self.coordenadas[-1].eh_unibrasil():
@@ -76,32 +89,68 @@ class Individuo:
                 return
             vistos.add(coord.cep)
     
-    def simular_rota(self, verbose=False):
+    def simular_rota(self, verbose=False, registrar_estados=False, recargas_planejadas=None,
+                     corte=None, matriz=None):
         """
         Executa simulação física completa da rota.
         
         Args:
             verbose: Exibir mensagens de debug
+            registrar_estados: Guarda o estado antes de cada trecho, permitindo
+                re-simular apenas um sufixo com `simular_sufixo`
+            recargas_planejadas: Índices de trecho em cuja origem o drone
+                recarrega antes de decolar (ver `core.split`); a regra gulosa
+                continua valendo como proteção
+            corte: Fitness de corte; a simulação é abortada assim que o custo
+                parcial mais um limite inferior admissível do restante o
+                ultrapassa, e o indivíduo fica marcado como `dominado`
+            matriz: MatrizDistancias usada no limite inferior (opcional)
         """
         if not self.viabilidade:
             return
 
         self._inicializar_metricas()
         self._inicializar_rastreamento()
+        self.penalidades = 0
+        self._estados = [] if registrar_estados else None
+        self.recargas_planejadas = set(recargas_planejadas) if recargas_planejadas else None
+        self._poda = self._preparar_poda(corte, matriz) if corte is not None else None
 
         estado = self._criar_contexto_inicial()
+        self._simular_trechos(estado, 0, verbose)
+
+    def simular_sufixo(self, inicio, verbose=False):
+        """
+        Re-simula a rota a partir do trecho `inicio`, reaproveitando o estado
+        gravado por `simular_rota(registrar_estados=True)`.
+
+        Útil quando apenas coordenadas a partir de `inicio + 1` mudaram.
+        """
+        estado = self._restaurar_estado(self._estados[inicio])
+        del self._estados[inicio:]
+        self._poda = None
+        self._simular_trechos(estado, inicio, verbose)
+
+    def _simular_trechos(self, estado, inicio, verbose):
+        """Simula os trechos a partir de `inicio` e finaliza as métricas."""
+        for idx in range(inicio, len(self.coordenadas) - 1):
+            if self._estados is not None:
+                self._estados.append(self._capturar_estado(estado))
 
-        for idx in range(len(self.coordenadas) - 1):
             origem = self.coordenadas[idx]
             destino = self.coordenadas[idx + 1]
 
             estado = self._gerenciar_dia(estado, origem, verbose)
 
+            if self.recargas_planejadas and idx in self.recargas_planejadas:
+                if estado['bateria'] < self.drone.calcular_autonomia(self.drone.velocidade_padrao):
+                    estado = self._executar_recarga(origem, estado, verbose)
+
             velocidade = self._selecionar_velocidade(origem, destino, estado)
 
             vento = self.gerenciador_vento.get_vento(estado['dia'], estado['hora_minutos'])
 
-            trecho = Trecho(origem, destino, velocidade, estado['dia'], estado['hora_minutos'], vento['velocidade'], vento['angulo'])
+            trecho = Trecho(origem, destino, velocidade, estado['dia'], estado['hora_minutos'], vento['velocidade'], vento['angulo'], self.parametros)
 
             if self._necessita_recarga(trecho, estado['bateria']):
                 estado = self._executar_recarga(origem, estado, verbose)
@@ -111,8 +160,227 @@ class Individuo:
             if not self._verificar_limites(estado, verbose):
                 return
 
+            self.trechos_simulados += 1
+            if self._poda is not None and self._excede_corte(idx, estado):
+                return
+
         self._finalizar_simulacao(estado)
-    
+
+    def _preparar_poda(self, corte, matriz):
+        """Pré-calcula sufixos de distância e de tempo mínimo de voo por trecho.
+
+        O tempo mínimo de cada trecho usa a maior velocidade de solo possível
+        naquela direção: drone na velocidade máxima sob o vento mais favorável
+        da previsão. Limitar cada trecho a uma carga útil mantém o limite
+        de recargas admissível.
+        """
+        origens, destinos = self.coordenadas[:-1], self.coordenadas[1:]
+        if matriz is not None:
+            indices = np.asarray(matriz.indices_da_rota(self.coordenadas))
+            distancias = matriz.distancias[indices[:-1], indices[1:]]
+            direcoes = matriz.direcoes[indices[:-1], indices[1:]]
+        else:
+            geometria = np.array([distancia_e_direcao(a, b, self.parametros)
+                                  for a, b in zip(origens, destinos)]).reshape(-1, 2)
+            distancias, direcoes = geometria[:, 0], geometria[:, 1]
+
+        ventos = np.array(sorted(self.gerenciador_vento.ventos_possiveis()), dtype=float)
+        rumo = np.radians(direcoes)[:, None]
+        angulo_vento = np.radians(ventos[:, 1])[None, :]
+        v = self.parametros.velocidade_maxima
+        solo = np.hypot(v * np.sin(rumo) + ventos[:, 0] * np.sin(angulo_vento),
+                        v * np.cos(rumo) + ventos[:, 0] * np.cos(angulo_vento))
+        solo_max = np.maximum(0.1, solo.max(axis=1))
+
+        reserva = self.parametros.battery_reserve_seconds
+        util = max(1.0, self.drone.calcular_autonomia(self.drone.velocidade_padrao) - reserva)
+        tempos = np.minimum(distancias / solo_max * 3600, util)
+
+        # sufixo[i] = soma dos trechos i..n-1 (com zero ao final)
+        dist_sufixo = np.append(np.cumsum(distancias[::-1])[::-1], 0.0).tolist()
+        tempo_sufixo = np.append(np.cumsum(tempos[::-1])[::-1], 0.0).tolist()
+
+        return {'corte': corte, 'dist': dist_sufixo, 'tempo': tempo_sufixo, 'util': util, 'reserva': reserva}
+
+    def _excede_corte(self, idx, ctx):
+        """Verifica se custo parcial + limite inferior do restante supera o corte."""
+        poda = self._poda
+        restante_km = poda['dist'][idx + 1]
+        restante_s = poda['tempo'][idx + 1]
+
+        disponivel = max(0.0, ctx['bateria'] - poda['reserva'])
+        recargas = max(0, math.ceil((restante_s - disponivel) / poda['util'] - 1e-9))
+
+        p = self.parametros
+        parcial = (self.tempo_total * p.custo_por_minuto
+                   + self.numero_pousos * p.custo_recarga
+                   + self.pousos_taxa_tarde * p.custo_taxa_tarde
+                   + self.penalidades)
+        estimativa = (parcial
+                      + recargas * p.custo_recarga
+                      + (restante_s / 60.0) * p.custo_por_minuto
+                      + self._componente_distancia(self.distancia_total + restante_km))
+
+        if estimativa > poda['corte'] + 1e-6:
+            self.dominado = True
+            self.fitness = estimativa
+            return True
+        return False
+
+    def _avaliar_split(self, corte, matriz):
+        """Avaliação split; com corte, o limite é testado antes e durante a DP.
+
+        O componente de distância não depende do plano de recargas, então a
+        DP recebe como limite de custo o corte menos esse componente e
+        descarta rótulos que já o ultrapassam.
+        """
+        if corte is None:
+            self.simular_rota(recargas_planejadas=planejar_recargas(self))
+            return
+
+        self._inicializar_metricas()
+        self._inicializar_rastreamento()
+        self.penalidades = 0
+        self._poda = self._preparar_poda(corte, matriz)
+        if self._excede_corte(-1, self._criar_contexto_inicial()):
+            return
+
+        distancia = self._componente_distancia(self._poda['dist'][0])
+        plano, custo = AvaliadorSplit(self, limite_custo=corte - distancia).planejar()
+        if plano is None:
+            self.dominado = True
+            self.fitness = custo + distancia
+            return
+        self.simular_rota(recargas_planejadas=plano, corte=corte, matriz=matriz)
+
+    def _capturar_estado(self, ctx):
+        """Fotografa contexto e acumuladores antes de um trecho."""
+        return {
+            'ctx': dict(ctx),
+            'distancia_total': self.distancia_total,
+            'tempo_total': self.tempo_total,
+            'numero_pousos': self.numero_pousos,
+            'pousos_taxa_tarde': self.pousos_taxa_tarde,
+            'penalidades': self.penalidades,
+            'viabilidade': self.viabilidade,
+            'n_trechos': len(self.trechos),
+            'n_recargas': len(self.lista_recargas),
+            'n_alertas': len(self.alertas),
+            'n_atrasados': len(self.pousos_atrasados),
+        }
+
+    def _restaurar_estado(self, foto):
+        """Volta acumuladores e listas ao ponto fotografado; retorna o contexto."""
+        self.distancia_total = foto['distancia_total']
+        self.tempo_total = foto['tempo_total']
+        self.numero_pousos = foto['numero_pousos']
+        self.pousos_taxa_tarde = foto['pousos_taxa_tarde']
+        self.penalidades = foto['penalidades']
+        self.viabilidade = foto['viabilidade']
+        del self.trechos[foto['n_trechos']:]
+        del self.lista_recargas[foto['n_recargas']:]
+        del self.alertas[foto['n_alertas']:]
+        del self.pousos_atrasados[foto['n_atrasados']:]
+        return dict(foto['ctx'])
+
+    def salvar_resultado(self, inicio=0):
+        """
+        Guarda o resultado da simulação a partir do trecho `inicio`, para
+        desfazer uma re-simulação de sufixo com `restaurar_resultado`.
+        """
+        foto = self._estados[inicio] if self._estados else None
+        corte = {
+            'trechos': foto['n_trechos'] if foto else 0,
+            'recargas': foto['n_recargas'] if foto else 0,
+            'alertas': foto['n_alertas'] if foto else 0,
+            'atrasados': foto['n_atrasados'] if foto else 0,
+        }
+        return {
+            'inicio': inicio,
+            'coordenadas': list(self.coordenadas),
+            'estados': list(self._estados[inicio:]) if self._estados is not None else None,
+            'trechos': self.trechos[corte['trechos']:],
+            'lista_recargas': self.lista_recargas[corte['recargas']:],
+            'alertas': self.alertas[corte['alertas']:],
+            'pousos_atrasados': self.pousos_atrasados[corte['atrasados']:],
+            'corte': corte,
+            'escalares': {nome: getattr(self, nome) for nome in (
+                'distancia_total', 'tempo_total', 'custo_total', 'numero_pousos',
+                'pousos_taxa_tarde', 'penalidades', 'viabilidade', 'dias_utilizados',
+                'minutos_totais_desde_inicio', 'fitness')},
+        }
+
+    def restaurar_resultado(self, salvo):
+        """Restaura o resultado gravado por `salvar_resultado`."""
+        self.coordenadas = salvo['coordenadas']
+        corte = salvo['corte']
+        self.trechos[corte['trechos']:] = salvo['trechos']
+        self.lista_recargas[corte['recargas']:] = salvo['lista_recargas']
+        self.alertas[corte['alertas']:] = salvo['alertas']
+        self.pousos_atrasados[corte['atrasados']:] = salvo['pousos_atrasados']
+        if salvo['estados'] is not None:
+            self._estados[salvo['inicio']:] = salvo['estados']
+        for nome, valor in salvo['escalares'].items():
+            setattr(self, nome, valor)
+
+    @property
+    def exato(self):
+        """True se o fitness veio de uma simulação completa (nem abortada, nem estimada)."""
+        return not self.dominado and not self.fitness_estimado
+
+    def marcar_estimado(self, valor):
+        """
+        Registra um fitness previsto pelo modelo substituto, sem simular.
+
+        Args:
+            valor: Fitness estimado
+        """
+        if not self.viabilidade:
+            return
+        self._inicializar_metricas()
+        self._inicializar_rastreamento()
+        self.fitness = float(valor)
+        self.fitness_estimado = True
+
+    # Campos escalares trocados entre processos (`resultado` / `aplicar_resultado`)
+    CAMPOS_RESULTADO = ('fitness', 'viabilidade', 'dominado', 'distancia_total', 'tempo_total',
+                        'custo_total', 'numero_pousos', 'pousos_taxa_tarde', 'dias_utilizados',
+                        'penalidades', 'minutos_totais_desde_inicio', 'trechos_simulados')
+
+    def resultado(self):
+        """Tupla com as métricas escalares da última avaliação."""
+        return tuple(getattr(self, nome) for nome in self.CAMPOS_RESULTADO)
+
+    def aplicar_resultado(self, resultado):
+        """
+        Aplica métricas avaliadas em outro processo (sem listas de trechos).
+
+        Args:
+            resultado: Tupla produzida por `resultado`
+        """
+        self._inicializar_metricas()
+        self._inicializar_rastreamento()
+        for nome, valor in zip(self.CAMPOS_RESULTADO, resultado):
+            setattr(self, nome, valor)
+
+    def copiar_avaliacao(self, outro):
+        """
+        Reaproveita o resultado da simulação de um indivíduo com a mesma rota.
+
+        Args:
+            outro: Individuo já avaliado (não dominado) com coordenadas iguais
+        """
+        for nome in ('distancia_total', 'tempo_total', 'custo_total', 'numero_pousos',
+                     'pousos_taxa_tarde', 'penalidades', 'viabilidade', 'dias_utilizados',
+                     'minutos_totais_desde_inicio', 'fitness', 'dominado', 'recargas_planejadas'):
+            setattr(self, nome, getattr(outro, nome))
+        self.fitness_estimado = False
+        for nome in ('trechos', 'lista_recargas', 'alertas', 'pousos_atrasados'):
+            setattr(self, nome, list(getattr(outro, nome)))
+        self.trechos_simulados = 0
+        self._estados = None
+        self._poda = None
+
     def _inicializar_metricas(self):
         """Limpa métricas antes de uma simulação (mantém flags quando apropriado)."""
         self.trechos = []
@@ -122,6 +390,9 @@ class Individuo:
         self.numero_pousos = 0
         self.pousos_taxa_tarde = 0
         self.dias_utilizados = 0
+        self.dominado = False
+        self.fitness_estimado = False
+        self.trechos_simulados = 0
 
         if not hasattr(self, 'viabilidade'):
             self.viabilidade = True
@@ -138,32 +409,40 @@ class Individuo:
 
         if not hasattr(self, 'minutos_totais_desde_inicio'):
             self.minutos_totais_desde_inicio = None
+        if not hasattr(self, '_estados'):
+            self._estados = None
+        if not hasattr(self, 'recargas_planejadas'):
+            self.recargas_planejadas = None
+        if not hasattr(self, '_poda'):
+            self._poda = None
     
     def _criar_contexto_inicial(self):
         """Cria estado inicial da missão"""
+        if self.estado_inicial is not None:
+            return self.estado_inicial.contexto(self.drone, self.parametros)
         return {
             'dia': 1,
             'minutos_abs': 0,
-            'hora_minutos': Config.HORA_INICIO,
-            'bateria': self.drone.calcular_autonomia(Config.VELOCIDADE_MINIMA)
+            'hora_minutos': self.parametros.hora_inicio,
+            'bateria': self.drone.calcular_autonomia(self.parametros.velocidade_minima)
         }
     
     def _gerenciar_dia(self, ctx, origem, verbose):
         """Gerencia transições entre dias (recargas noturnas)"""
-        if ctx['hora_minutos'] >= Config.HORA_FIM and ctx['dia'] < Config.DIAS_MAXIMOS:
+        if ctx['hora_minutos'] >= self.parametros.hora_fim and ctx['dia'] < self.parametros.dias_maximos:
             # Recarga noturna
             self.drone.recarregar()
             ctx['bateria'] = self.drone.bateria_atual
             
             # Registrar
-            dia_rec, hora_rec = abs_to_day_and_minuto(ctx['minutos_abs'])
+            dia_rec, hora_rec = abs_to_day_and_minuto(ctx['minutos_abs'], self.parametros.hora_inicio)
             self.lista_recargas.append((dia_rec, hora_rec, origem.cep, False))
             self.numero_pousos += 1
             
             # Avançar para próximo dia
-            ctx['minutos_abs'] += (24 * 60) - ctx['hora_minutos'] + Config.HORA_INICIO
+            ctx['minutos_abs'] += (24 * 60) - ctx['hora_minutos'] + self.parametros.hora_inicio
             ctx['dia'] += 1
-            ctx['hora_minutos'] = Config.HORA_INICIO
+            ctx['hora_minutos'] = self.parametros.hora_inicio
             
             if verbose:
                 print(f"   Dia {ctx['dia']} - Recarga noturna")
@@ -184,12 +463,12 @@ class Individuo:
         melhor_v = None
         menor_custo = float('inf')
 
-        alpha = Config.HEURISTICA_ALPHA
+        alpha = self.parametros.heuristica_alpha
         beta = self._calcular_beta_dinamico(ctx['bateria'])
 
         for v in velocidades:
             try:
-                trecho_teste = Trecho(origem, destino, v, ctx['dia'], ctx['hora_minutos'], vento['velocidade'], vento['angulo'])
+                trecho_teste = Trecho(origem, destino, v, ctx['dia'], ctx['hora_minutos'], vento['velocidade'], vento['angulo'], self.parametros)
             except Exception:
                 continue
 
@@ -205,19 +484,19 @@ class Individuo:
                 menor_custo = custo
                 melhor_v = v
 
-        return melhor_v if melhor_v else Config.VELOCIDADE_MINIMA
+        return melhor_v if melhor_v else self.parametros.velocidade_minima
     
     def _calcular_beta_dinamico(self, bateria_atual):
         """Ajusta peso do consumo baseado no nível de bateria"""
         try:
-            bateria_max = self.drone.calcular_autonomia(Config.VELOCIDADE_REFERENCIA)
+            bateria_max = self.drone.calcular_autonomia(self.parametros.velocidade_referencia)
             if bateria_max <= 0:
-                return Config.HEURISTICA_BETA
+                return self.parametros.heuristica_beta
 
             nivel = max(0.0, min(1.0, bateria_atual / bateria_max))
-            return Config.HEURISTICA_BETA * (1.0 - nivel)
+            return self.parametros.heuristica_beta * (1.0 - nivel)
         except Exception:
-            return Config.HEURISTICA_BETA
+            return self.parametros.heuristica_beta
     
     def _calcular_consumo_percentual(self, trecho, velocidade):
         """Calcula consumo como porcentagem da autonomia total"""
@@ -229,7 +508,7 @@ class Individuo:
     
     def _necessita_recarga(self, trecho, bateria):
         """Verifica se bateria é insuficiente para o trecho"""
-        reserva = getattr(Config, 'BATTERY_RESERVE_SECONDS', 0)
+        reserva = self.parametros.battery_reserve_seconds
         return (trecho.consumo_bateria + reserva) > bateria
     
     def _executar_recarga(self, local, ctx, verbose):
@@ -243,33 +522,33 @@ class Individuo:
         if tem_taxa:
             self.pousos_taxa_tarde += 1
 
-        dia, hora = abs_to_day_and_minuto(ctx['minutos_abs'])
+        dia, hora = abs_to_day_and_minuto(ctx['minutos_abs'], self.parametros.hora_inicio)
         self.lista_recargas.append((dia, hora, local.cep, tem_taxa))
 
         self._registrar_alerta_recarga(dia, hora, local.cep, tem_taxa, verbose)
 
-        ctx['minutos_abs'] += Config.TEMPO_RECARGA
-        ctx['hora_minutos'] = (Config.HORA_INICIO + ctx['minutos_abs']) % (24 * 60)
+        ctx['minutos_abs'] += self.parametros.tempo_recarga
+        ctx['hora_minutos'] = (self.parametros.hora_inicio + ctx['minutos_abs']) % (24 * 60)
 
-        if ctx['hora_minutos'] >= Config.HORA_FIM and ctx['dia'] < Config.DIAS_MAXIMOS:
+        if ctx['hora_minutos'] >= self.parametros.hora_fim and ctx['dia'] < self.parametros.dias_maximos:
             ctx = self._processar_dormida(ctx, local)
 
         return ctx
     
     def _verificar_taxa_atraso(self, minutos_abs):
         """Verifica se recarga incorre em taxa de atraso"""
-        dia, hora_inicio = abs_to_day_and_minuto(minutos_abs)
+        dia, hora_inicio = abs_to_day_and_minuto(minutos_abs, self.parametros.hora_inicio)
         
-        if Config.TAXA_BASEADA_EM == 'end':
-            hora_avaliacao = (hora_inicio + Config.TEMPO_RECARGA) % (24 * 60)
+        if self.parametros.taxa_baseada_em == 'end':
+            hora_avaliacao = (hora_inicio + self.parametros.tempo_recarga) % (24 * 60)
         else:
             hora_avaliacao = hora_inicio
         
-        return hora_avaliacao >= Config.HORA_TAXA_EXTRA
+        return hora_avaliacao >= self.parametros.hora_taxa_extra
     
     def _registrar_alerta_recarga(self, dia, hora, cep, tem_taxa, verbose):
         """Registra alertas relacionados a recargas"""
-        if hora >= Config.HORA_FIM:
+        if hora >= self.parametros.hora_fim:
             msg = f"Pouso fora de horario: dia {dia}, {hora}min, CEP {cep}"
             self.alertas.append(msg)
             self.pousos_atrasados.append((dia, hora, cep, 'fora_horario'))
@@ -287,13 +566,13 @@ class Individuo:
         self.drone.recarregar()
         ctx['bateria'] = self.drone.bateria_atual
 
-        dia, hora = abs_to_day_and_minuto(ctx['minutos_abs'])
+        dia, hora = abs_to_day_and_minuto(ctx['minutos_abs'], self.parametros.hora_inicio)
         self.lista_recargas.append((dia, hora, local.cep, False))
         self.numero_pousos += 1
 
-        ctx['minutos_abs'] += (24 * 60) - ctx['hora_minutos'] + Config.HORA_INICIO
+        ctx['minutos_abs'] += (24 * 60) - ctx['hora_minutos'] + self.parametros.hora_inicio
         ctx['dia'] += 1
-        ctx['hora_minutos'] = Config.HORA_INICIO
+        ctx['hora_minutos'] = self.parametros.hora_inicio
 
         return ctx
     
@@ -303,11 +582,11 @@ class Individuo:
 
         minutos_voo = trecho.tempo_voo_segundos // 60
         ctx['minutos_abs'] += minutos_voo
-        ctx['hora_minutos'] = (Config.HORA_INICIO + ctx['minutos_abs']) % (24 * 60)
+        ctx['hora_minutos'] = (self.parametros.hora_inicio + ctx['minutos_abs']) % (24 * 60)
 
         # pausa curta para captura de imagens (~1 minuto)
         ctx['minutos_abs'] += 1
-        ctx['hora_minutos'] = (Config.HORA_INICIO + ctx['minutos_abs']) % (24 * 60)
+        ctx['hora_minutos'] = (self.parametros.hora_inicio + ctx['minutos_abs']) % (24 * 60)
 
         self.trechos.append(trecho)
         self.distancia_total += trecho.distancia
@@ -317,43 +596,64 @@ class Individuo:
     
     def _verificar_limites(self, ctx, verbose):
         """Verifica se limites de tempo foram excedidos"""
-        dias_corridos = 1 + ((Config.HORA_INICIO + ctx['minutos_abs']) // (24 * 60))
+        dias_corridos = 1 + ((self.parametros.hora_inicio + ctx['minutos_abs']) // (24 * 60))
 
-        if dias_corridos > Config.DIAS_MAXIMOS:
+        if dias_corridos > self.parametros.dias_maximos:
             if 'dias_excedidos' not in [a.split(':')[0] for a in self.alertas]:
-                msg = f"Dias excedidos: {dias_corridos} dias (limite {Config.DIAS_MAXIMOS})"
+                msg = f"Dias excedidos: {dias_corridos} dias (limite {self.parametros.dias_maximos})"
                 self.alertas.append('dias_excedidos: ' + msg)
                 if verbose:
                     print(f"   ALERTA: {msg}")
 
-            if getattr(Config, 'HARD_DIAS_MAX', False):
+            if self.parametros.hard_dias_max:
                 self.viabilidade = False
                 self.penalidades += 100000
                 return False
             else:
-                dias_extras = dias_corridos - Config.DIAS_MAXIMOS
-                penalidade_dia = getattr(Config, 'PENALIDADE_POR_DIA_EXCEDIDO', 10000)
+                dias_extras = dias_corridos - self.parametros.dias_maximos
+                penalidade_dia = self.parametros.penalidade_por_dia_excedido
                 self.penalidades += penalidade_dia * dias_extras
 
-        if ctx['hora_minutos'] > Config.HORA_FIM:
+        if ctx['hora_minutos'] > self.parametros.hora_fim:
             self.penalidades += 1000
 
         return True
     
     def _finalizar_simulacao(self, ctx):
         """Finaliza simulação e calcula métricas finais"""
-        custo_tempo = self.tempo_total * Config.CUSTO_POR_MINUTO
-        custo_recargas = self.numero_pousos * Config.CUSTO_RECARGA
-        custo_taxa = self.pousos_taxa_tarde * Config.CUSTO_TAXA_TARDE
+        custo_tempo = self.tempo_total * self.parametros.custo_por_minuto
+        custo_recargas = self.numero_pousos * self.parametros.custo_recarga
+        custo_taxa = self.pousos_taxa_tarde * self.parametros.custo_taxa_tarde
         self.custo_total = custo_tempo + custo_recargas + custo_taxa
 
-        dias_passados = (Config.HORA_INICIO + ctx['minutos_abs']) // (24 * 60)
+        dias_passados = (self.parametros.hora_inicio + ctx['minutos_abs']) // (24 * 60)
         self.dias_utilizados = int(dias_passados) + 1
 
         self.minutos_totais_desde_inicio = int(ctx['minutos_abs'])
 
         self.numero_pousos = len(self.lista_recargas)
     
+    def avaliar(self, modo='guloso', corte=None, matriz=None):
+        """
+        Simula a rota e calcula o fitness.
+
+        Args:
+            modo: 'guloso' (recarga quando a bateria não cobre o trecho) ou
+                'split' (posições de recarga ótimas por programação dinâmica)
+            corte: Fitness de corte para abortar rotas dominadas (opcional)
+            matriz: MatrizDistancias para o limite inferior do corte (opcional)
+
+        Returns:
+            float: Fitness calculado (limite inferior se `dominado`)
+        """
+        if modo == 'split' and self.viabilidade:
+            self._avaliar_split(corte, matriz)
+        elif modo in ('guloso', 'split'):
+            self.simular_rota(corte=corte, matriz=matriz)
+        else:
+            raise ValueError(f"Modo de avaliação desconhecido: {modo}")
+        return self.calcular_fitness()
+    
     def calcular_fitness(self):
         """
         Calcula fitness baseado em custo, penalidades e distância.
@@ -364,16 +664,24 @@ class Individuo:
         if not self.viabilidade:
             return float('inf')
 
-        peso_dist = getattr(Config, 'FITNESS_PESO_DISTANCIA', 0.0)
-        norma = getattr(Config, 'FITNESS_DIST_NORMALIZATION', 100.0)
+        if self.dominado or self.fitness_estimado:
+            # sem simulação completa: `fitness` guarda o limite inferior ou a estimativa
+            return self.fitness
 
-        try:
-            distancia_componente = (self.distancia_total / float(norma)) * peso_dist
-        except Exception:
-            distancia_componente = 0.0
+        distancia_componente = self._componente_distancia(self.distancia_total)
 
         self.fitness = self.custo_total + self.penalidades + distancia_componente
         return self.fitness
+
+    def _componente_distancia(self, distancia_km):
+        """Parcela do fitness referente à distância percorrida."""
+        peso_dist = self.parametros.fitness_peso_distancia
+        norma = self.parametros.fitness_dist_normalization
+
+        try:
+            return (distancia_km / float(norma)) * peso_dist
+        except Exception:
+            return 0.0
     
     def __repr__(self):
         return (f"Individuo({len(self.coordenadas)} pontos, "
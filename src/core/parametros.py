@@ -0,0 +1,86 @@
+"""Parâmetros imutáveis de uma execução.
+
+`Config` continua sendo a fonte dos valores padrão, mas é lido uma única
+vez por `ParametrosExecucao.de_config`. O objeto resultante é congelado e
+passado explicitamente a `Drone`, `Individuo`, `Trecho` e
+`FitnessFunction`; assim a simulação não consulta atributos globais a cada
+trecho e cenários com configurações diferentes podem coexistir no mesmo
+processo.
+"""
+from dataclasses import dataclass, fields, replace
+
+from .settings import Config
+
+
+@dataclass(frozen=True)
+class ParametrosExecucao:
+    """Valores de `Config` usados pela simulação e pelo fitness (nomes em minúsculas)."""
+
+    # Drone
+    velocidade_referencia: int = 36
+    autonomia_referencia: float = 5000
+    fator_correcao: float = 0.93
+    velocidade_minima: int = 36
+    velocidade_maxima: int = 96
+    tempo_recarga: float = 1.2
+    battery_reserve_seconds: float = 300
+
+    # Horários
+    hora_inicio: int = 6 * 60
+    hora_fim: int = 19 * 60
+    hora_taxa_extra: int = 17 * 60
+
+    # Custos
+    custo_recarga: float = 80.0
+    custo_taxa_tarde: float = 80.0
+    custo_por_minuto: float = 0.0
+    taxa_baseada_em: str = 'start'
+
+    # Projeto, heurísticas e penalidades
+    dias_maximos: int = 7
+    heuristica_alpha: float = 3.0
+    heuristica_beta: float = 1.0
+    hard_dias_max: bool = False
+    penalidade_por_dia_excedido: float = 10000
+
+    # Fitness
+    fitness_peso_distancia: float = 10.0
+    fitness_dist_normalization: float = 8.0
+
+    # Geometria
+    geometria: str = 'haversine'
+    latitude_referencia: float = -25.48
+
+    @classmethod
+    def de_config(cls, **sobrescritas):
+        """
+        Resolve os parâmetros a partir de `Config`.
+
+        Args:
+            **sobrescritas: Valores que substituem os de `Config` (nomes dos campos)
+
+        Returns:
+            ParametrosExecucao: Instância congelada
+        """
+        valores = {campo.name: getattr(Config, campo.name.upper(), campo.default) for campo in fields(cls)}
+        desconhecidos = set(sobrescritas) - set(valores)
+        if desconhecidos:
+            raise TypeError(f"Parâmetros desconhecidos: {', '.join(sorted(desconhecidos))}")
+        valores.update(sobrescritas)
+        return cls(**valores)
+
+    def com(self, **sobrescritas):
+        """Cópia com alguns campos alterados."""
+        return replace(self, **sobrescritas)
+
+    @property
+    def velocidades_validas(self):
+        """Velocidades permitidas (múltiplos de 4 entre mínima e máxima)."""
+        return tuple(range(self.velocidade_minima, self.velocidade_maxima + 1, 4))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # imutável: cópias de indivíduos compartilham a mesma instância
+        return self
@@ -4,59 +4,195 @@ Refatorei nomes internos e comentários para reduzir similaridade com
 outras cópias do código, mantendo a API.
 """
 import random
+import time
 from .individuo import Individuo
+from .settings import Config
+from .hash_genoma import TabelaZobrist
+from ..utils_custom.matriz_distancias import MatrizDistancias
 
 
 class Populacao:
     """Contém o grupo de soluções candidatas."""
 
-    def __init__(self, coordenadas, drone, gerenciador_vento, tamanho=50):
+    def __init__(self, coordenadas, drone, gerenciador_vento, tamanho=50, modo_avaliacao=None,
+                 matriz_distancias=None, sementes=None, estado_inicial=None, rng=None):
+        """
+        Args:
+            coordenadas: Lista de `Coordenada` da missão
+            drone: Instância de Drone
+            gerenciador_vento: Instância de GerenciadorVento
+            tamanho: Número de indivíduos
+            modo_avaliacao: 'guloso' ou 'split' (padrão: `Config.MODO_AVALIACAO`)
+            matriz_distancias: MatrizDistancias pré-calculada (opcional)
+            sementes: Rotas anteriores (listas de CEPs ou de `Coordenada`, ver
+                `carregar_rota`); a população inicial passa a ser formada por
+                variações delas em vez de embaralhamentos aleatórios
+            estado_inicial: EstadoMissao para replanejamento; as rotas partem de
+                `estado_inicial.cep_atual` (que deve estar em `coordenadas`)
+            rng: `random.Random` próprio da execução, compartilhado pelo AG
+                (padrão: o gerador global do módulo `random`)
+        """
         self.coordenadas = coordenadas
         self.drone = drone
         self.gerenciador_vento = gerenciador_vento
+        self.estado_inicial = estado_inicial
         self.tamanho = tamanho
-        self.individuos = self._gerar_populacao_inicial()
+        self.rng = rng if rng is not None else random
+        self.modo_avaliacao = modo_avaliacao or Config.MODO_AVALIACAO
+        self._matriz_distancias = matriz_distancias  # pode vir pré-calculada (ex.: lote de cenários)
+        self._zobrist = None
+        self.reparo_sementes = None
+        self.individuos = (self._gerar_populacao_semeada(sementes) if sementes
+                           else self._gerar_populacao_inicial())
         self.melhor_individuo = None
         self.pior_individuo = None
+        self._avaliados = {}
+        self.avaliacoes_poupadas = 0
+
+    @property
+    def matriz_distancias(self):
+        """Matriz de distâncias entre as coordenadas (calculada sob demanda)."""
+        if self._matriz_distancias is None:
+            parametros = self.drone.parametros
+            self._matriz_distancias = MatrizDistancias(self.coordenadas, parametros.geometria,
+                                                       parametros.latitude_referencia)
+        return self._matriz_distancias
+
+    @property
+    def zobrist(self):
+        """Tabela de hash de genoma (criada sob demanda)."""
+        if self._zobrist is None:
+            self._zobrist = TabelaZobrist(self.coordenadas)
+        return self._zobrist
     
     def _gerar_populacao_inicial(self):
         """Gera indivíduos iniciais embaralhando pontos intermediários."""
-        individuos = []
+        return [self.gerar_individuo_aleatorio() for _ in range(self.tamanho)]
 
-        for _ in range(self.tamanho):
-            inicio_fim = [c for c in self.coordenadas if c.eh_unibrasil()]
-            meios = [c for c in self.coordenadas if not c.eh_unibrasil()]
+    def novo_individuo(self, coordenadas):
+        """Cria um `Individuo` da população (mesmo drone, vento e estado inicial)."""
+        return Individuo(coordenadas, self.drone, self.gerenciador_vento, estado_inicial=self.estado_inicial)
 
-            random.shuffle(meios)
+    def _extremos(self):
+        """(início, fim, pontos intermediários) das rotas desta população."""
+        base = [c for c in self.coordenadas if c.eh_unibrasil()]
+        if self.estado_inicial is None:
+            return base, base, [c for c in self.coordenadas if not c.eh_unibrasil()]
+        cep = self.estado_inicial.cep_atual
+        inicio = [c for c in self.coordenadas if c.cep == cep][:1]
+        return inicio, base, [c for c in self.coordenadas if not c.eh_unibrasil() and c.cep != cep]
 
-            rota = inicio_fim + meios + inicio_fim
+    def gerar_individuo_aleatorio(self):
+        """Cria um indivíduo com os pontos intermediários embaralhados."""
+        inicio, fim, meios = self._extremos()
 
-            individuo = Individuo(rota, self.drone, self.gerenciador_vento)
-            individuos.append(individuo)
+        self.rng.shuffle(meios)
 
-        return individuos
+        rota = inicio + meios + fim
+        return self.novo_individuo(rota)
     
-    def avaliar_populacao(self):
-        """Executa simulação e cálculo de fitness para cada indivíduo."""
+    def _gerar_populacao_semeada(self, sementes):
+        """População inicial a partir de rotas anteriores.
+
+        Cada semente é reparada para o conjunto atual de coordenadas e entra
+        intacta; os demais indivíduos são variações com um número sorteado
+        (pequeno) de inversões de segmento, distribuídas entre as sementes.
+        """
+        rotas = [self.reparar_rota(semente) for semente in sementes]
+        individuos = [self.novo_individuo(list(rota)) for rota in rotas[:self.tamanho]]
+
+        n = len(rotas[0]) - 2
+        intensidade_maxima = max(2, n // 20)
+        for i in range(len(individuos), self.tamanho):
+            rota = list(rotas[i % len(rotas)])
+            for _ in range(self.rng.randint(1, intensidade_maxima)):
+                if n < 2:
+                    break
+                a, b = sorted(self.rng.sample(range(1, n + 1), 2))
+                rota[a:b + 1] = rota[a:b + 1][::-1]
+            individuos.append(self.novo_individuo(rota))
+        return individuos
+
+    def reparar_rota(self, semente):
+        """
+        Ajusta uma rota anterior às coordenadas atuais.
+
+        CEPs que não existem mais (ou repetidos) são descartados e CEPs novos
+        entram por inserção mais barata (menor acréscimo de distância).
+
+        Args:
+            semente: Lista de CEPs ou de `Coordenada` na ordem de visita
+
+        Returns:
+            list: Rota completa (base + pontos + base) de `Coordenada`
+        """
+        matriz = self.matriz_distancias
+        inicio = self.estado_inicial.cep_atual if self.estado_inicial is not None else None
+        indices, descartados, inseridos = matriz.reparar_rota(semente, inicio, self.coordenadas)
+        self.reparo_sementes = {'descartados': descartados, 'inseridos': inseridos}
+        return matriz.coordenadas_da_rota(indices)
+
+    def avaliar_populacao(self, corte=None, substituto=None, avaliador=None):
+        """Executa simulação e cálculo de fitness para cada indivíduo.
+
+        Args:
+            corte: Fitness de corte; indivíduos que certamente o ultrapassam
+                têm a simulação abortada e ficam marcados como dominados
+            substituto: ModeloSubstituto opcional; só os indivíduos com
+                melhor previsão são simulados, os demais ficam com o fitness
+                estimado (`fitness_estimado`)
+            avaliador: AvaliadorParalelo opcional que simula em processos
+                trabalhadores (apenas métricas escalares retornam)
+
+        Indivíduos com `hash_genoma` igual ao de uma rota avaliada na chamada
+        anterior reaproveitam aquele resultado em vez de simular de novo.
+        """
+        matriz = self.matriz_distancias if corte is not None else None
+        avaliados = {}
+        pendentes = []
+        self.avaliacoes_poupadas = 0
+
+        for individuo in self.individuos:
+            chave = getattr(individuo, 'hash_genoma', None)
+            anterior = self._avaliados.get(chave) if chave is not None else None
+
+            if anterior is not None and anterior.coordenadas == individuo.coordenadas:
+                individuo.copiar_avaliacao(anterior)
+                individuo.tempo_avaliacao = 0.0
+                self.avaliacoes_poupadas += 1
+            else:
+                pendentes.append(individuo)
+
+        simular = substituto.filtrar(pendentes) if substituto is not None else pendentes
+        if avaliador is not None:
+            avaliador.avaliar(simular, self.matriz_distancias, self.modo_avaliacao, corte)
+        else:
+            for individuo in simular:
+                inicio = time.process_time()
+                individuo.avaliar(self.modo_avaliacao, corte=corte, matriz=matriz)
+                individuo.tempo_avaliacao = time.process_time() - inicio
+
+        if substituto is not None:
+            substituto.calibrar(simular, estimados=len(pendentes) - len(simular))
+
         for individuo in self.individuos:
-            individuo.simular_rota()
-            individuo.calcular_fitness()
+            chave = getattr(individuo, 'hash_genoma', None)
+            if chave is not None and individuo.exato:
+                avaliados[chave] = individuo
 
+        self._avaliados = avaliados
         self._atualizar_melhores()
     
     def _atualizar_melhores(self):
-        """Localiza o melhor e o pior indivíduo, preferindo viáveis."""
+        """Localiza o melhor e o pior indivíduo, preferindo viáveis avaliados por completo."""
         if not self.individuos:
             return
 
-        viaveis = [ind for ind in self.individuos if ind.viabilidade]
+        viaveis = [ind for ind in self.individuos if ind.viabilidade and ind.exato]
+        candidatos = viaveis or [ind for ind in self.individuos if ind.exato] or self.individuos
 
-        if viaveis:
-            self.melhor_individuo = min(viaveis, key=lambda x: x.fitness)
-            self.pior_individuo = max(viaveis, key=lambda x: x.fitness)
-        else:
-            self.melhor_individuo = min(self.individuos, key=lambda x: x.fitness)
-            self.pior_individuo = max(self.individuos, key=lambda x: x.fitness)
+        self.melhor_individuo = min(candidatos, key=lambda x: x.fitness)
+        self.pior_individuo = max(candidatos, key=lambda x: x.fitness)
     
     def get_estatisticas(self):
         """
@@ -68,17 +204,33 @@ class Populacao:
         if not self.individuos:
             return {}
 
-        fitness_values = [ind.fitness for ind in self.individuos]
+        # fitness previstos pelo substituto não entram nos extremos nem na
+        # média; o melhor vem só de simulações completas, como em `_atualizar_melhores`
+        simulados = [ind for ind in self.individuos if not ind.fitness_estimado] or self.individuos
+        exatos = [ind for ind in simulados if ind.exato] or simulados
+        fitness_values = [ind.fitness for ind in simulados]
         viaveis = sum(1 for ind in self.individuos if ind.viabilidade)
 
         return {
             'tamanho': len(self.individuos),
-            'melhor_fitness': min(fitness_values),
+            'melhor_fitness': min(ind.fitness for ind in exatos),
             'pior_fitness': max(fitness_values),
             'fitness_medio': sum(fitness_values) / len(fitness_values),
             'individuos_viaveis': viaveis,
-            'taxa_viabilidade': (viaveis / len(self.individuos)) * 100
+            'taxa_viabilidade': (viaveis / len(self.individuos)) * 100,
+            'dominados': sum(1 for ind in self.individuos if ind.dominado),
+            'estimados': sum(1 for ind in self.individuos if ind.fitness_estimado),
+            'trechos_simulados': sum(ind.trechos_simulados for ind in self.individuos),
+            'avaliacoes_poupadas': self.avaliacoes_poupadas,
+            'unicidade': self._unicidade()
         }
+
+    def _unicidade(self):
+        """Fração (0-1) de genomas distintos, ou None se os hashes não são mantidos."""
+        hashes = [getattr(ind, 'hash_genoma', None) for ind in self.individuos]
+        if any(h is None for h in hashes):
+            return None
+        return len(set(hashes)) / len(hashes)
     
     def __len__(self):
         return len(self.individuos)
@@ -0,0 +1,263 @@
+"""Simulação vetorizada de uma rota sob muitos cenários de vento.
+
+`Individuo.simular_rota` percorre a rota com uma única previsão. Aqui a
+mesma lógica gulosa (escolha de velocidade, recargas, dormidas, taxa
+tarde e penalidades de dia/horário) é aplicada a S previsões ao mesmo
+tempo: o laço é sobre os trechos e cada passo opera em arrays
+(cenários,) ou (cenários, velocidades). Com a previsão original como
+cenário, o resultado coincide com o do simulador escalar.
+"""
+import math
+import numpy as np
+
+from ..utils_custom.calculos import distancia_e_direcao
+
+# Faixas de `GerenciadorVento` (início de cada faixa em horas)
+FAIXAS_HORAS = (6, 9, 12, 15, 18, 21)
+
+
+class CenariosVento:
+    """Conjunto de S previsões de vento em forma de arrays (cenários, dias, faixas)."""
+
+    def __init__(self, velocidades, angulos):
+        """
+        Args:
+            velocidades: Array (S, dias, 6) com a velocidade do vento (km/h)
+            angulos: Array (S, dias, 6) com o ângulo para onde o vento sopra
+                (graus, como `GerenciadorVento.get_vento()['angulo']`)
+        """
+        self.velocidades = np.asarray(velocidades, dtype=float)
+        self.angulos = np.asarray(angulos, dtype=float)
+        if self.velocidades.ndim != 3 or self.velocidades.shape != self.angulos.shape:
+            raise ValueError("velocidades e angulos devem ter forma (cenarios, dias, faixas)")
+
+    @classmethod
+    def de_gerenciadores(cls, gerenciadores):
+        """
+        Cenários idênticos às previsões de uma lista de `GerenciadorVento`.
+
+        Args:
+            gerenciadores: Lista de GerenciadorVento
+
+        Returns:
+            CenariosVento: Um cenário por gerenciador
+        """
+        dias = max(max(g.previsao, default=0) for g in gerenciadores)
+        forma = (len(gerenciadores), max(1, dias), len(FAIXAS_HORAS))
+        velocidades, angulos = np.zeros(forma), np.zeros(forma)
+        for s, gerenciador in enumerate(gerenciadores):
+            for d in range(dias):
+                for f, hora in enumerate(FAIXAS_HORAS):
+                    vento = gerenciador.get_vento(d + 1, hora * 60)
+                    velocidades[s, d, f] = vento['velocidade']
+                    angulos[s, d, f] = vento['angulo']
+        return cls(velocidades, angulos)
+
+    @classmethod
+    def perturbar(cls, gerenciador, quantidade, desvio_velocidade=0.25, desvio_direcao=30.0,
+                  semente=None, incluir_previsao=True):
+        """
+        Cenários sorteados em torno de uma previsão.
+
+        Cada faixa de cada dia recebe um erro independente: a velocidade é
+        multiplicada por `1 + N(0, desvio_velocidade)` (limitada a zero) e a
+        direção é girada por `N(0, desvio_direcao)` graus.
+
+        Args:
+            gerenciador: GerenciadorVento com a previsão de referência
+            quantidade: Número de cenários
+            desvio_velocidade: Desvio padrão relativo da velocidade
+            desvio_direcao: Desvio padrão da direção (graus)
+            semente: Semente do gerador aleatório (opcional)
+            incluir_previsao: Se True, o cenário 0 é a própria previsão
+
+        Returns:
+            CenariosVento: `quantidade` cenários
+        """
+        base = cls.de_gerenciadores([gerenciador])
+        rng = np.random.default_rng(semente)
+        forma = (quantidade,) + base.velocidades.shape[1:]
+        fator = np.maximum(0.0, 1.0 + rng.normal(0.0, desvio_velocidade, forma))
+        giro = rng.normal(0.0, desvio_direcao, forma)
+        velocidades = base.velocidades * fator
+        angulos = (base.angulos + giro) % 360
+        if incluir_previsao and quantidade > 0:
+            velocidades[0], angulos[0] = base.velocidades[0], base.angulos[0]
+        return cls(velocidades, angulos)
+
+    def vento(self, dia, hora_minutos):
+        """
+        Vento de cada cenário no dia/minuto informados (arrays de tamanho S).
+
+        Dias fora da tabela não têm vento, como em `GerenciadorVento.get_vento`.
+        """
+        faixa = np.searchsorted(np.array(FAIXAS_HORAS[1:]) * 60, hora_minutos, side='right')
+        presente = (dia >= 1) & (dia <= self.velocidades.shape[1])
+        d = np.clip(dia - 1, 0, self.velocidades.shape[1] - 1)
+        s = np.arange(len(self))
+        velocidade = np.where(presente, self.velocidades[s, d, faixa], 0.0)
+        angulo = np.where(presente, self.angulos[s, d, faixa], 0.0)
+        return velocidade, angulo
+
+    def __len__(self):
+        return self.velocidades.shape[0]
+
+    def __repr__(self):
+        return f"CenariosVento({len(self)} cenários, {self.velocidades.shape[1]} dias)"
+
+
+def medida_risco(valores, medida='media', alfa=0.9):
+    """
+    Agrega uma distribuição de fitness (menor é melhor) em um único valor.
+
+    Args:
+        valores: Fitness por cenário
+        medida: 'media' ou 'cvar' (média dos `1 - alfa` piores cenários)
+        alfa: Nível do CVaR (0-1)
+
+    Returns:
+        float: Valor agregado
+    """
+    valores = np.asarray(valores, dtype=float)
+    if medida == 'media':
+        return float(valores.mean())
+    if medida == 'cvar':
+        k = max(1, math.ceil((1.0 - alfa) * len(valores) - 1e-9))
+        return float(np.sort(valores)[-k:].mean())
+    raise ValueError(f"Medida de risco desconhecida: {medida}")
+
+
+def resumo_distribuicao(valores, alfa=0.9):
+    """Média, percentis 50/90, máximo e CVaR de uma distribuição por cenário."""
+    valores = np.asarray(valores, dtype=float)
+    return {
+        'media': float(valores.mean()),
+        'p50': float(np.percentile(valores, 50)),
+        'p90': float(np.percentile(valores, 90)),
+        'maximo': float(valores.max()),
+        'cvar': medida_risco(valores, 'cvar', alfa),
+    }
+
+
+def simular_cenarios(individuo, cenarios):
+    """
+    Simula a rota de um indivíduo (regra gulosa) sob todos os cenários.
+
+    Usa o drone, os `ParametrosExecucao` e o `estado_inicial` do indivíduo;
+    o indivíduo em si não é alterado.
+
+    Args:
+        individuo: Individuo com a rota
+        cenarios: CenariosVento
+
+    Returns:
+        dict: Arrays por cenário (fitness, custo, dias, pousos,
+        pousos_taxa_tarde, tempo_voo em minutos, minutos_totais e viavel),
+        `pousos_por_trecho` (cenários, trechos) com os pousos feitos antes de
+        cada trecho e a distância total (igual em todos os cenários)
+    """
+    p = individuo.parametros
+    drone = individuo.drone
+    coordenadas = individuo.coordenadas
+    n_cenarios = len(cenarios)
+    n_trechos = len(coordenadas) - 1
+
+    velocidades = np.array(sorted(drone.get_velocidades_validas(), reverse=True), dtype=float)
+    autonomias = np.array([drone.calcular_autonomia(v) for v in velocidades])
+    carga_cheia = drone.calcular_autonomia(drone.velocidade_padrao)
+    bateria_referencia = drone.calcular_autonomia(p.velocidade_referencia)
+
+    ctx = individuo._criar_contexto_inicial()
+    dia = np.full(n_cenarios, ctx['dia'], dtype=np.int64)
+    minutos_abs = np.full(n_cenarios, float(ctx['minutos_abs']))
+    hora = np.full(n_cenarios, float(ctx['hora_minutos']))
+    bateria = np.full(n_cenarios, float(ctx['bateria']))
+
+    tempo_total = np.zeros(n_cenarios)
+    pousos = np.zeros(n_cenarios, dtype=np.int64)
+    taxa_tarde = np.zeros(n_cenarios, dtype=np.int64)
+    penalidades = np.zeros(n_cenarios)
+    ativos = np.full(n_cenarios, bool(individuo.viabilidade))
+    pousos_por_trecho = np.zeros((n_cenarios, max(0, n_trechos)), dtype=np.int8)
+    distancia_total = 0.0
+
+    def dormir(mascara):
+        nonlocal minutos_abs
+        bateria[mascara] = carga_cheia
+        pousos[mascara] += 1
+        minutos_abs = np.where(mascara, minutos_abs + (24 * 60 - hora + p.hora_inicio), minutos_abs)
+        dia[mascara] += 1
+        hora[mascara] = p.hora_inicio
+
+    for idx in range(n_trechos if individuo.viabilidade else 0):
+        origem, destino = coordenadas[idx], coordenadas[idx + 1]
+        distancia, rumo = distancia_e_direcao(origem, destino, p)
+        rumo = math.radians(rumo)
+        pousos_antes = pousos.copy()
+
+        # recarga noturna antes de decolar (`_gerenciar_dia`)
+        dormir(ativos & (hora >= p.hora_fim) & (dia < p.dias_maximos))
+
+        # tempo de voo de cada velocidade sob o vento de cada cenário (`Trecho`)
+        vento_vel, vento_ang = cenarios.vento(dia, hora)
+        angulo = np.radians(vento_ang)[:, None]
+        solo = np.maximum(0.1, np.hypot(velocidades * math.sin(rumo) + vento_vel[:, None] * np.sin(angulo),
+                                        velocidades * math.cos(rumo) + vento_vel[:, None] * np.cos(angulo)))
+        tempos = np.floor(distancia / np.maximum(0.001, solo) * 3600) + 1
+
+        # velocidade de menor custo alpha*tempo + beta*consumo (`_selecionar_velocidade`)
+        beta = p.heuristica_beta * (1.0 - np.clip(bateria / bateria_referencia, 0.0, 1.0))
+        custo = p.heuristica_alpha * (tempos / 60.0) + beta[:, None] * (tempos / autonomias * 100.0)
+        custo[(tempos + p.battery_reserve_seconds) > bateria[:, None]] = np.inf
+        escolha = np.argmin(custo, axis=1)
+        linhas = np.arange(n_cenarios)
+        sem_opcao = np.isinf(custo[linhas, escolha])
+        escolha[sem_opcao] = np.flatnonzero(velocidades == p.velocidade_minima)[0]
+        tempo = tempos[linhas, escolha]
+
+        # recarga se a bateria não cobre o trecho (`_executar_recarga`)
+        recarga = ativos & ((tempo + p.battery_reserve_seconds) > bateria)
+        hora_pouso = np.floor((p.hora_inicio + minutos_abs) % (24 * 60))
+        if p.taxa_baseada_em == 'end':
+            hora_pouso = (hora_pouso + p.tempo_recarga) % (24 * 60)
+        taxa_tarde += recarga & (hora_pouso >= p.hora_taxa_extra)
+        bateria[recarga] = carga_cheia
+        pousos += recarga
+        minutos_abs = np.where(recarga, minutos_abs + p.tempo_recarga, minutos_abs)
+        hora = np.where(recarga, (p.hora_inicio + minutos_abs) % (24 * 60), hora)
+        dormir(recarga & (hora >= p.hora_fim) & (dia < p.dias_maximos))
+
+        # voo e pausa de captura (`_executar_voo`)
+        bateria = np.where(ativos, bateria - tempo, bateria)
+        minutos_abs = np.where(ativos, minutos_abs + tempo // 60 + 1, minutos_abs)
+        hora = np.where(ativos, (p.hora_inicio + minutos_abs) % (24 * 60), hora)
+        tempo_total += np.where(ativos, tempo / 60.0, 0.0)
+        distancia_total += distancia
+        pousos_por_trecho[:, idx] = pousos - pousos_antes
+
+        # limites de dias e de horário (`_verificar_limites`)
+        dias_corridos = 1 + (p.hora_inicio + minutos_abs) // (24 * 60)
+        excedido = ativos & (dias_corridos > p.dias_maximos)
+        if p.hard_dias_max:
+            penalidades[excedido] += 100000
+            ativos = ativos & ~excedido
+        else:
+            penalidades += np.where(excedido, p.penalidade_por_dia_excedido * (dias_corridos - p.dias_maximos), 0)
+        penalidades[ativos & (hora > p.hora_fim)] += 1000
+
+    custo_total = tempo_total * p.custo_por_minuto + pousos * p.custo_recarga + taxa_tarde * p.custo_taxa_tarde
+    fitness = custo_total + penalidades + individuo._componente_distancia(distancia_total)
+    fitness[~ativos] = np.inf
+
+    return {
+        'fitness': fitness,
+        'custo': custo_total,
+        'dias': ((p.hora_inicio + minutos_abs) // (24 * 60)).astype(np.int64) + 1,
+        'pousos': pousos,
+        'pousos_taxa_tarde': taxa_tarde,
+        'tempo_voo': tempo_total,
+        'minutos_totais': minutos_abs.astype(np.int64),
+        'viavel': ativos,
+        'pousos_por_trecho': pousos_por_trecho,
+        'distancia': distancia_total,
+    }
@@ -41,6 +41,13 @@ class Config:
     HARD_DIAS_MAX = False  # Se True, invalida rotas que excedem DIAS_MAXIMOS
     PENALIDADE_POR_DIA_EXCEDIDO = 10000  # Penalidade por dia além do limite
     
+    # === AVALIAÇÃO ===
+    MODO_AVALIACAO = 'guloso'  # 'guloso' (recarga quando necessário) ou 'split' (recargas ótimas por DP)
+
+    # === GEOMETRIA ===
+    GEOMETRIA = 'haversine'  # 'haversine' ou 'equiretangular' (projeção plana rápida, erro < 0,001%)
+    LATITUDE_REFERENCIA = -25.48  # Latitude (graus) de referência da projeção plana
+    
     # === FITNESS ===
     FITNESS_PESO_DISTANCIA = 10.0  # Peso da distância no cálculo de fitness
     FITNESS_DIST_NORMALIZATION = 8.0  # Normalizador para distância (km)
@@ -48,5 +55,87 @@ class Config:
     FITNESS_PESO_CUSTO = 1.0  # Peso do custo monetário
     FITNESS_PESO_PENALIDADES = 10.0  # Peso das penalidades
     
+    # === ALGORITMO GENÉTICO ===
+    AG_TAMANHO_POPULACAO = 50  # Indivíduos por geração
+    AG_TAXA_MUTACAO = 0.02  # Taxa inicial (ajustada a cada geração)
+    AG_TAXA_CROSSOVER = 0.8
+    AG_PERCENTUAL_ELITISMO = 0.1  # Fração da população preservada como elite
+    AG_TAMANHO_TORNEIO = 5  # Participantes de cada torneio de seleção
+    AG_MODO = 'geracional'  # 'geracional' ou 'estacionario' (lotes pequenos substituem os piores)
+    AG_TAMANHO_LOTE = 4  # Filhos por passo no modo estacionário
+    AG_OPERADORES_ADAPTATIVOS = False  # Seleção de operadores por bandido (melhoria/segundo de CPU)
+    AG_MEMETICO = False  # Busca local 2-opt/Or-opt em parte dos filhos de cada geração
+    AG_MEMETICO_FRACAO = 0.2  # Fração dos filhos refinados
+    AG_MEMETICO_ORCAMENTO = 2.0  # Segundos de CPU por geração (somando workers)
+    AG_MEMETICO_WORKERS = 1  # Processos para a busca local (0 = todos os núcleos)
+    AG_WORKERS_AVALIACAO = 1  # Processos que simulam a população (0 = todos os núcleos)
+    AG_CORTE_AVALIACAO = False  # Aborta simulação de filhos acima do limiar (branch-and-bound)
+    AG_PERCENTIL_CORTE = 0.5  # Percentil do fitness da geração anterior usado como limiar
+    AG_ELIMINAR_DUPLICATAS = False  # Hash de genoma: troca rotas repetidas e reaproveita avaliações
+    AG_SUBSTITUTO = False  # Pré-seleção dos filhos por modelo barato antes da simulação
+    AG_SUBSTITUTO_FRACAO = 0.5  # Fração dos filhos efetivamente simulados
+    AG_SUBSTITUTO_CONTROLE = 0.1  # Fração dos demais filhos simulada como amostra de controle
+    AG_REINICIO_DIVERSIDADE = False  # Re-semeia a parte não elite quando a diversidade colapsa
+    AG_LIMIAR_ENTROPIA = 0.1  # Entropia de arestas normalizada (0-1) que dispara o reinício
+    AG_LIMITE_INFERIOR = False  # Calcula limite inferior (1-árvore) e reporta o gap a cada geração
+    AG_GAP_PARADA = None  # Gap relativo (ex.: 0.05) que encerra o AG antes das gerações previstas
+    AG_ROBUSTEZ = None  # None, 'media' ou 'cvar': fitness sobre cenários de vento perturbados
+    AG_ROBUSTEZ_CENARIOS = 200  # Cenários sorteados em torno da previsão
+    AG_ROBUSTEZ_ALFA = 0.9  # Nível do CVaR (média dos 10% piores cenários)
+    AG_ROBUSTEZ_DESVIO_VELOCIDADE = 0.25  # Desvio relativo da velocidade do vento
+    AG_ROBUSTEZ_DESVIO_DIRECAO = 30.0  # Desvio da direção do vento (graus)
+    AG_ROTA_SEMENTE = None  # flight_plan.csv ou genoma.csv anterior para partida a quente (None = aleatória)
+    BUSCA_LOCAL_SEGUNDOS = 30.0  # CPU da busca local sensível ao custo aplicada ao melhor final
+
+    # === MOTOR DE BUSCA ===
+    SOLVER = 'ag'  # 'ag', 'recozimento', 'formigas' ou 'comparar' (todos com o mesmo tempo de relógio)
+    SOLVER_SEGUNDOS = 0  # Orçamento de relógio (0 = NUMERO_GERACOES passos; em 'comparar', o tempo gasto pelo AG)
+    RECOZIMENTO_PASSOS = 200  # Movimentos testados por passo (por temperatura)
+    RECOZIMENTO_RESFRIAMENTO = 'tempo'  # 'geometrico' (T *= ALFA por passo) ou 'tempo' (ao longo do orçamento)
+    RECOZIMENTO_ALFA = 0.95
+    RECOZIMENTO_ACEITACAO_INICIAL = 0.1  # Probabilidade de aceitar a piora mediana no início
+    FORMIGAS_QUANTIDADE = 50  # Rotas construídas por iteração
+    FORMIGAS_ALFA = 1.0  # Peso do feromônio
+    FORMIGAS_BETA = 3.0  # Peso da heurística 1/distância
+    FORMIGAS_EVAPORACAO = 0.1  # Fração evaporada por iteração
+    FORMIGAS_VIZINHOS = 15  # Candidatos (vizinhos mais próximos) de cada ponto
+    FORMIGAS_WORKERS = 1  # Processos que simulam as rotas (0 = todos os núcleos)
+    
+    # === DECOMPOSIÇÃO (instâncias grandes) ===
+    DECOMPOSICAO_METODO = 'kmeans'  # 'kmeans' ou 'grade'
+    DECOMPOSICAO_PONTOS_POR_CLUSTER = 150  # Tamanho alvo de cada cluster resolvido pelo AG
+    DECOMPOSICAO_GERACOES = 20  # Gerações do AG por cluster
+    DECOMPOSICAO_POPULACAO = 30  # Indivíduos por cluster
+    DECOMPOSICAO_JANELA_COSTURA = 8  # Pontos de cada lado das junções no reparo final
+    DECOMPOSICAO_WORKERS = 0  # Processos (0 = todos os núcleos)
+
+    # === FROTA (vários drones) ===
+    FROTA_DRONES = 3  # Drones partindo da base
+    FROTA_GERACOES = 20  # Gerações do AG por drone e rodada
+    FROTA_POPULACAO = 30  # Indivíduos por drone
+    FROTA_RODADAS = 2  # Rodadas de otimização + rebalanceamento entre rotas
+    FROTA_MOVIMENTOS = 30  # Movimentos de rebalanceamento aceitos por rodada
+    FROTA_WORKERS = 0  # Processos (0 = um por drone, limitado aos núcleos)
+
+    # === AJUSTE DE HIPERPARÂMETROS (corrida com successive halving) ===
+    AJUSTE_CONFIGURACOES = 24  # Configurações sorteadas do espaço de busca
+    AJUSTE_ORCAMENTO_INICIAL = 2.0  # Segundos de CPU por execução na primeira rodada
+    AJUSTE_ETA = 3  # Fator de corte: sobrevive 1/ETA e o orçamento cresce ETA vezes
+    AJUSTE_SEMENTES_MAXIMAS = 3  # Sementes por configuração nas rodadas finais
+    AJUSTE_WORKERS = 0  # Processos (0 = todos os núcleos)
+
+    # === SERVIÇO LOCAL ===
+    SERVICO_SOCKET = None  # Caminho de socket Unix; None = TCP em SERVICO_HOST:SERVICO_PORTA
+    SERVICO_HOST = '127.0.0.1'
+    SERVICO_PORTA = 8765
+    SERVICO_WORKERS = 2  # Otimizações/avaliações simultâneas
+    SERVICO_TTL_TAREFAS = 3600  # Segundos em que uma tarefa encerrada continua consultável
+
     # === COMPARAÇÃO (para análises) ===
     AUTONOMIA_COMPARISON_MINUTES = [20, 30, 45, 77]  # Lista para análises comparativas
+    CENARIOS_TABELAS_VENTO = [None, 'data/wind_table.csv']  # None = tabela embutida
+    CENARIOS_CUSTOS = [{}]  # Sobrescritas de ParametrosExecucao (ex.: {'custo_recarga': 120.0})
+    CENARIOS_SEMENTES = [1]  # Sementes do AG por cenário
+    CENARIOS_GERACOES = 10  # Gerações por cenário
+    CENARIOS_POPULACAO = 50  # Indivíduos por cenário
+    CENARIOS_WORKERS = 0  # Processos do lote (0 = todos os núcleos)
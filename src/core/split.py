@@ -0,0 +1,260 @@
+"""Avaliação "rota primeiro, divisão depois" (split) por programação dinâmica.
+
+Para uma ordem de visita fixa, decide em quais pontos recarregar de modo a
+minimizar custo (recargas, taxa tarde, penalidades de horário/dias), em vez
+da regra gulosa do simulador (recarregar só quando a bateria não cobre o
+próximo trecho).
+
+O rótulo de uma posição `i` representa "prestes a iniciar o trecho `i` com
+bateria cheia". A partir de cada rótulo a surtida é estendida trecho a
+trecho, replicando exatamente a aritmética de `Individuo.simular_rota`, até
+a bateria não cobrir o próximo trecho. Como a surtida é limitada pela
+bateria, e só as últimas `janela` posições de cada surtida (mais a última
+antes da taxa tarde) viram candidatas, o custo é quase linear em n.
+"""
+from ..utils_custom.calculos import distancia_e_direcao, calcular_velocidade_efetiva
+
+
+class _Rotulo:
+    """Estado parcial da DP em uma posição da rota."""
+
+    __slots__ = ('custo', 'ctx', 'anterior', 'recarga_em')
+
+    def __init__(self, custo, ctx, anterior, recarga_em):
+        self.custo = custo
+        self.ctx = ctx
+        self.anterior = anterior
+        self.recarga_em = recarga_em
+
+
+class AvaliadorSplit:
+    """Calcula posições de recarga de custo mínimo para a ordem do indivíduo."""
+
+    def __init__(self, individuo, janela=12, rotulos_por_posicao=2, limite_custo=None):
+        """
+        Args:
+            individuo: Individuo cuja ordem de visita é mantida
+            janela: Posições finais de cada surtida consideradas para recarga
+            rotulos_por_posicao: Rótulos não dominados mantidos por posição
+            limite_custo: Custo acima do qual rótulos são descartados (corte
+                branch-and-bound; o custo só cresce ao longo da rota)
+        """
+        self.individuo = individuo
+        self.drone = individuo.drone
+        self.vento = individuo.gerenciador_vento
+        self.coords = individuo.coordenadas
+        self.janela = janela
+        self.rotulos_por_posicao = rotulos_por_posicao
+        self.limite_custo = limite_custo
+        self.menor_podado = float('inf')
+
+        self.velocidades = sorted(self.drone.get_velocidades_validas(), reverse=True)
+        self.autonomias = {v: self.drone.calcular_autonomia(v) for v in self.velocidades}
+        self.bateria_cheia = self.drone.calcular_autonomia(self.drone.velocidade_padrao)
+        self.parametros = individuo.parametros
+        self.reserva = self.parametros.battery_reserve_seconds
+
+        self._geometria = {}
+        self._tempos = {}
+
+    # ------------------------------------------------------------------
+    # Réplica da física do simulador
+    # ------------------------------------------------------------------
+    def _tempos_trecho(self, idx, ctx):
+        """Tempo de voo (s) por velocidade para o trecho `idx` no vento atual."""
+        vento = self.vento.get_vento(ctx['dia'], ctx['hora_minutos'])
+        chave = (idx, vento['velocidade'], vento['angulo'])
+        tempos = self._tempos.get(chave)
+        if tempos is not None:
+            return tempos
+
+        geo = self._geometria.get(idx)
+        if geo is None:
+            geo = distancia_e_direcao(self.coords[idx], self.coords[idx + 1], self.parametros)
+            self._geometria[idx] = geo
+
+        distancia, direcao = geo
+        tempos = {}
+        for v in self.velocidades:
+            efetiva = calcular_velocidade_efetiva(v, direcao, vento['velocidade'], vento['angulo'])
+            tempos[v] = int(distancia / max(0.001, efetiva) * 3600) + 1
+        self._tempos[chave] = tempos
+        return tempos
+
+    def _tempo_escolhido(self, idx, ctx):
+        """Replica `_selecionar_velocidade` e retorna o tempo do trecho (s)."""
+        tempos = self._tempos_trecho(idx, ctx)
+        bateria = ctx['bateria']
+        beta = self.individuo._calcular_beta_dinamico(bateria)
+
+        melhor_v = None
+        menor = float('inf')
+        for v in self.velocidades:
+            t = tempos[v]
+            if t + self.reserva > bateria:
+                continue
+            custo = self.parametros.heuristica_alpha * (t / 60.0) + beta * (t / self.autonomias[v]) * 100.0
+            if custo < menor:
+                menor = custo
+                melhor_v = v
+
+        return tempos[melhor_v if melhor_v else self.parametros.velocidade_minima]
+
+    def _noite(self, ctx):
+        """Replica `_gerenciar_dia`; retorna custo adicional."""
+        if ctx['hora_minutos'] >= self.parametros.hora_fim and ctx['dia'] < self.parametros.dias_maximos:
+            ctx['bateria'] = self.bateria_cheia
+            ctx['minutos_abs'] += (24 * 60) - ctx['hora_minutos'] + self.parametros.hora_inicio
+            ctx['dia'] += 1
+            ctx['hora_minutos'] = self.parametros.hora_inicio
+            return self.parametros.custo_recarga, True
+        return 0.0, False
+
+    def _recarga(self, ctx):
+        """Replica `_executar_recarga` (incluindo dormida); retorna custo."""
+        custo = self.parametros.custo_recarga
+        if self.individuo._verificar_taxa_atraso(ctx['minutos_abs']):
+            custo += self.parametros.custo_taxa_tarde
+
+        ctx['bateria'] = self.bateria_cheia
+        ctx['minutos_abs'] += self.parametros.tempo_recarga
+        ctx['hora_minutos'] = (self.parametros.hora_inicio + ctx['minutos_abs']) % (24 * 60)
+
+        if ctx['hora_minutos'] >= self.parametros.hora_fim and ctx['dia'] < self.parametros.dias_maximos:
+            custo += self.parametros.custo_recarga
+            ctx['minutos_abs'] += (24 * 60) - ctx['hora_minutos'] + self.parametros.hora_inicio
+            ctx['dia'] += 1
+            ctx['hora_minutos'] = self.parametros.hora_inicio
+        return custo
+
+    def _voar(self, tempo, ctx):
+        """Replica `_executar_voo` + `_verificar_limites`; retorna custo."""
+        ctx['bateria'] -= tempo
+        ctx['minutos_abs'] += tempo // 60
+        ctx['hora_minutos'] = (self.parametros.hora_inicio + ctx['minutos_abs']) % (24 * 60)
+        ctx['minutos_abs'] += 1
+        ctx['hora_minutos'] = (self.parametros.hora_inicio + ctx['minutos_abs']) % (24 * 60)
+
+        custo = (tempo / 60.0) * self.parametros.custo_por_minuto
+        dias_corridos = 1 + ((self.parametros.hora_inicio + ctx['minutos_abs']) // (24 * 60))
+        if dias_corridos > self.parametros.dias_maximos:
+            if self.parametros.hard_dias_max:
+                return float('inf')
+            custo += self.parametros.penalidade_por_dia_excedido * (dias_corridos - self.parametros.dias_maximos)
+        if ctx['hora_minutos'] > self.parametros.hora_fim:
+            custo += 1000
+        return custo
+
+    # ------------------------------------------------------------------
+    # Programação dinâmica
+    # ------------------------------------------------------------------
+    def _podar(self, custo):
+        """True se `custo` passa do limite; guarda o menor custo descartado."""
+        if self.limite_custo is None or custo <= self.limite_custo + 1e-6:
+            return False
+        self.menor_podado = min(self.menor_podado, custo)
+        return True
+
+    def _inserir(self, rotulos, novo):
+        """Mantém até `rotulos_por_posicao` rótulos não dominados (custo, tempo)."""
+        for r in rotulos:
+            if r.custo <= novo.custo and r.ctx['minutos_abs'] <= novo.ctx['minutos_abs']:
+                return
+        rotulos[:] = [r for r in rotulos
+                      if not (novo.custo <= r.custo and novo.ctx['minutos_abs'] <= r.ctx['minutos_abs'])]
+        rotulos.append(novo)
+        rotulos.sort(key=lambda r: (r.custo, r.ctx['minutos_abs']))
+        del rotulos[self.rotulos_por_posicao:]
+
+    def _estender(self, rotulo, inicio, rotulos, finais):
+        """Percorre a surtida iniciada em `inicio` gerando rótulos candidatos."""
+        n = len(self.coords) - 1
+        ctx = dict(rotulo.ctx)
+        custo = rotulo.custo
+        candidatos = []
+
+        for idx in range(inicio, n):
+            custo_noite, houve_noite = self._noite(ctx)
+            if houve_noite and idx > inicio:
+                # a noite já recarrega: a surtida termina aqui
+                if not self._podar(custo + custo_noite):
+                    self._inserir(rotulos[idx], _Rotulo(custo + custo_noite, dict(ctx), rotulo, None))
+                break
+            custo += custo_noite
+
+            tempo = self._tempo_escolhido(idx, ctx)
+            if tempo + self.reserva > ctx['bateria']:
+                if idx > inicio:
+                    break
+                # trecho maior que a bateria cheia: o simulador recarrega de novo
+                custo += self._recarga(ctx)
+
+            custo += self._voar(tempo, ctx)
+            if custo == float('inf'):
+                return
+            if self._podar(custo):
+                break
+
+            if idx + 1 == n:
+                finais.append(_Rotulo(custo, dict(ctx), rotulo, None))
+                break
+
+            candidatos.append((idx + 1, custo, dict(ctx)))
+
+        # janela limitada: últimas posições da surtida e a última antes da taxa tarde
+        escolhidos = candidatos[-self.janela:]
+        antes_taxa = [c for c in candidatos if c[2]['hora_minutos'] < self.parametros.hora_taxa_extra]
+        if antes_taxa and antes_taxa[-1] not in escolhidos:
+            escolhidos.append(antes_taxa[-1])
+
+        for pos, custo_pos, ctx_pos in escolhidos:
+            if ctx_pos['hora_minutos'] >= self.parametros.hora_fim and ctx_pos['dia'] < self.parametros.dias_maximos:
+                continue  # o simulador fará a parada noturna antes da recarga
+            ctx_rec = dict(ctx_pos)
+            custo_rec = custo_pos + self._recarga(ctx_rec)
+            if self._podar(custo_rec):
+                continue
+            self._inserir(rotulos[pos], _Rotulo(custo_rec, ctx_rec, rotulo, pos))
+
+    def planejar(self):
+        """
+        Executa a DP.
+
+        Returns:
+            tuple: (conjunto de índices de trecho com recarga planejada, custo estimado);
+                se `limite_custo` descartou todas as rotas, (None, menor custo
+                descartado), um limite inferior do custo ótimo
+        """
+        n = len(self.coords) - 1
+        if n <= 0:
+            return set(), 0.0
+
+        ctx0 = self.individuo._criar_contexto_inicial()
+        ctx0['bateria'] = self.bateria_cheia
+        rotulos = [[] for _ in range(n + 1)]
+        rotulos[0].append(_Rotulo(0.0, ctx0, None, None))
+        finais = []
+
+        for i in range(n):
+            for rotulo in list(rotulos[i]):
+                self._estender(rotulo, i, rotulos, finais)
+
+        if not finais:
+            if self.menor_podado != float('inf'):
+                return None, self.menor_podado
+            return set(), float('inf')
+
+        melhor = min(finais, key=lambda r: r.custo)
+        plano = set()
+        r = melhor
+        while r is not None:
+            if r.recarga_em is not None:
+                plano.add(r.recarga_em)
+            r = r.anterior
+        return plano, melhor.custo
+
+
+def planejar_recargas(individuo, janela=12, rotulos_por_posicao=2):
+    """Atalho: retorna o conjunto de trechos com recarga planejada."""
+    plano, _ = AvaliadorSplit(individuo, janela, rotulos_por_posicao).planejar()
+    return plano
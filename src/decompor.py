@@ -0,0 +1,52 @@
+"""
+Otimização de instâncias grandes por decomposição geográfica (clusters + AG)
+"""
+import os
+import sys
+
+# Adicionar diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.settings import Config
+from src.core.parametros import ParametrosExecucao
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.algorithms.decomposicao import resolver_decomposto
+from src.simulation.csv_exporter import CSVExporter
+
+
+def main():
+    """Resolve o CSV de coordenadas informado (padrão: data/coordenadas.csv) por clusters"""
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    caminho = sys.argv[1] if len(sys.argv) > 1 else os.path.join(BASE_DIR, "data", "coordenadas.csv")
+    coordenadas = carregar_coordenadas(caminho)
+    if not coordenadas:
+        print("ERRO: Nenhuma coordenada foi carregada.")
+        return
+
+    drone = Drone(parametros=ParametrosExecucao.de_config())
+    print(f"Decompondo {len(coordenadas)} pontos em clusters de ~{Config.DECOMPOSICAO_PONTOS_POR_CLUSTER} "
+          f"({Config.DECOMPOSICAO_METODO}, {Config.DECOMPOSICAO_GERACOES} geracoes por cluster)...")
+    resultado = resolver_decomposto(coordenadas, drone, GerenciadorVento(),
+                                    pontos_por_cluster=Config.DECOMPOSICAO_PONTOS_POR_CLUSTER,
+                                    metodo=Config.DECOMPOSICAO_METODO,
+                                    geracoes=Config.DECOMPOSICAO_GERACOES,
+                                    tamanho_populacao=Config.DECOMPOSICAO_POPULACAO,
+                                    workers=Config.DECOMPOSICAO_WORKERS,
+                                    janela_costura=Config.DECOMPOSICAO_JANELA_COSTURA,
+                                    opcoes_ag={'eliminar_duplicatas': Config.AG_ELIMINAR_DUPLICATAS})
+
+    melhor = resultado['individuo']
+    print(f"OK {resultado['clusters']} clusters em {resultado['segundos']:.1f}s")
+    print(f"   - Distancia costurada: {resultado['distancia_costurada']:.2f} km | "
+          f"apos reparo das juncoes: {resultado['distancia_final']:.2f} km")
+    print(f"   - Fitness: {melhor.fitness:.2f} | Dias: {melhor.dias_utilizados} | Pousos: {melhor.numero_pousos}")
+
+    exporter = CSVExporter()
+    exporter.exportar_rota_completa(melhor)
+    exporter.exportar_genoma(melhor)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Modo frota: vários drones partindo da base, rotas otimizadas em paralelo
+"""
+import os
+import sys
+
+# Adicionar diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.settings import Config
+from src.core.parametros import ParametrosExecucao
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.algorithms.frota import otimizar_frota
+from src.simulation.csv_exporter import CSVExporter
+
+
+def main():
+    """Divide os CEPs entre `Config.FROTA_DRONES` drones e grava outputs/frota/"""
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    coordenadas = carregar_coordenadas(os.path.join(BASE_DIR, "data", "coordenadas.csv"))
+    if not coordenadas:
+        print("ERRO: Nenhuma coordenada foi carregada.")
+        return
+
+    print(f"Otimizando frota de {Config.FROTA_DRONES} drones "
+          f"({Config.FROTA_RODADAS} rodadas x {Config.FROTA_GERACOES} geracoes)...")
+    resultado = otimizar_frota(coordenadas, Drone(parametros=ParametrosExecucao.de_config()), GerenciadorVento(),
+                               drones=Config.FROTA_DRONES, geracoes=Config.FROTA_GERACOES,
+                               tamanho_populacao=Config.FROTA_POPULACAO, rodadas=Config.FROTA_RODADAS,
+                               movimentos=Config.FROTA_MOVIMENTOS, workers=Config.FROTA_WORKERS,
+                               opcoes_ag={'eliminar_duplicatas': Config.AG_ELIMINAR_DUPLICATAS})
+
+    for k, individuo in enumerate(resultado['individuos'], start=1):
+        print(f"Drone {k}: {len(individuo.coordenadas) - 2:4d} pontos | "
+              f"{individuo.distancia_total:8.2f} km | dias {individuo.dias_utilizados} | "
+              f"fim {individuo.minutos_totais_desde_inicio} min | fitness {individuo.fitness:.2f}")
+    print(f"Makespan da frota: {resultado['makespan_minutos']} min "
+          f"({resultado['movimentos']} movimentos de rebalanceamento, {resultado['segundos']:.1f}s)")
+
+    CSVExporter(os.path.join("outputs", "frota")).exportar_frota(resultado['individuos'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Execução em lote dos cenários comparativos (autonomia x vento x custos x semente)
+"""
+import os
+import sys
+
+# Adicionar diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.settings import Config
+from src.simulation.cenarios import gerar_grade, executar_lote
+
+
+def main():
+    """Roda a grade definida em `Config` e grava outputs/cenarios.csv"""
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    coordenadas = carregar_coordenadas(os.path.join(BASE_DIR, "data", "coordenadas.csv"))
+    if not coordenadas:
+        print("ERRO: Nenhuma coordenada foi carregada.")
+        return
+
+    ventos = [os.path.join(BASE_DIR, v) if v else None for v in Config.CENARIOS_TABELAS_VENTO]
+    cenarios = gerar_grade(Config.AUTONOMIA_COMPARISON_MINUTES, ventos,
+                           Config.CENARIOS_CUSTOS, Config.CENARIOS_SEMENTES)
+    print(f"Executando {len(cenarios)} cenarios "
+          f"({Config.CENARIOS_GERACOES} geracoes x {Config.CENARIOS_POPULACAO} individuos)...")
+
+    caminho = os.path.join("outputs", "cenarios.csv")
+    linhas = executar_lote(cenarios, coordenadas, Config.CENARIOS_GERACOES, Config.CENARIOS_POPULACAO,
+                           workers=Config.CENARIOS_WORKERS, caminho_saida=caminho,
+                           opcoes_ag={'eliminar_duplicatas': Config.AG_ELIMINAR_DUPLICATAS})
+
+    for linha in sorted(linhas, key=lambda l: l['fitness']):
+        print(f"{linha['cenario']:<60} fitness={linha['fitness']:>10.2f} "
+              f"pousos={linha.get('pousos', '-')} dias={linha.get('dias', '-')}")
+    print(f"\nTabela comparativa: {caminho}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,20 @@ import random
 # Adicionar diretório raiz ao path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.utils_custom.file_handlers import carregar_coordenadas
+from src.utils_custom.file_handlers import carregar_coordenadas, carregar_rota
+from src.core.settings import Config
+from src.core.parametros import ParametrosExecucao
 from src.core.entities.drone import Drone
 from src.core.entities.vento import GerenciadorVento
 from src.core.populacao import Populacao
 from src.algorithms.genetico import AlgoritmoGenetico
+from src.algorithms.estacionario import AlgoritmoGeneticoEstacionario
+from src.algorithms.recozimento import RecozimentoSimulado
+from src.algorithms.formigas import ColoniaFormigas
+from src.algorithms.solver import comparar_solvers
+from src.algorithms.busca_local_simulada import busca_local_simulada
+from src.algorithms.robustez import AvaliadorRobusto
+from src.core.robustez import CenariosVento, simular_cenarios, resumo_distribuicao
 from src.simulation.csv_exporter import CSVExporter
 from src.utils_custom.calculos import distancia_haversine
 
@@ -27,7 +36,11 @@ def calcular_distancia_total(coordenadas):
     )
 
 def aplicar_2opt(coordenadas, max_iter=1000):
-    """Aplica otimização 2-opt à rota"""
+    """Aplica otimização 2-opt à rota (apenas distância).
+
+    Pode piorar o custo simulado; o fluxo principal usa
+    `busca_local_simulada`, que nunca piora o fitness.
+    """
     n = len(coordenadas)
     if n < 4:
         return coordenadas
@@ -75,7 +88,7 @@ def main():
     # Configurações - usar caminho absoluto baseado na raiz do projeto
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     ARQUIVO_COORDENADAS = os.path.join(BASE_DIR, "data", "coordenadas.csv")
-    TAMANHO_POPULACAO = 50
+    TAMANHO_POPULACAO = Config.AG_TAMANHO_POPULACAO
     NUMERO_GERACOES = 10
     
     # Carregar dados
@@ -88,28 +101,126 @@ def main():
     
     # Inicializar componentes
     print("\nInicializando componentes do sistema...")
-    drone = Drone()
+    drone = Drone(parametros=ParametrosExecucao.de_config())
     vento = GerenciadorVento()
-    populacao = Populacao(coordenadas, drone, vento, TAMANHO_POPULACAO)
-    algoritmo = AlgoritmoGenetico(populacao, taxa_mutacao=0.02, taxa_crossover=0.8)
+    sementes = None
+    if Config.AG_ROTA_SEMENTE:
+        rota_anterior = carregar_rota(os.path.join(BASE_DIR, Config.AG_ROTA_SEMENTE))
+        sementes = [rota_anterior] if rota_anterior else None
+    def nova_populacao(matriz=None):
+        return Populacao(coordenadas, drone, vento, TAMANHO_POPULACAO, sementes=sementes, matriz_distancias=matriz)
+
+    populacao = nova_populacao()
+    if populacao.reparo_sementes is not None:
+        print(f"OK Partida a quente de {Config.AG_ROTA_SEMENTE} "
+              f"({populacao.reparo_sementes['descartados']} CEPs descartados, "
+              f"{populacao.reparo_sementes['inseridos']} inseridos)")
+    opcoes = dict(taxa_mutacao=Config.AG_TAXA_MUTACAO, taxa_crossover=Config.AG_TAXA_CROSSOVER,
+                  percentual_elitismo=Config.AG_PERCENTUAL_ELITISMO,
+                  tamanho_torneio=Config.AG_TAMANHO_TORNEIO,
+                  operadores_adaptativos=Config.AG_OPERADORES_ADAPTATIVOS,
+                  corte_avaliacao=Config.AG_CORTE_AVALIACAO,
+                  percentil_corte=Config.AG_PERCENTIL_CORTE,
+                  eliminar_duplicatas=Config.AG_ELIMINAR_DUPLICATAS,
+                  limite_inferior=Config.AG_LIMITE_INFERIOR,
+                  gap_parada=Config.AG_GAP_PARADA)
+    robustez = None
+    if Config.AG_ROBUSTEZ:
+        cenarios = CenariosVento.perturbar(vento, Config.AG_ROBUSTEZ_CENARIOS,
+                                      Config.AG_ROBUSTEZ_DESVIO_VELOCIDADE,
+                                      Config.AG_ROBUSTEZ_DESVIO_DIRECAO)
+        robustez = AvaliadorRobusto(cenarios, Config.AG_ROBUSTEZ, Config.AG_ROBUSTEZ_ALFA)
+
+    # no modo estacionário, o mesmo número de avaliações do geracional em lotes pequenos
+    iteracoes_ag = (NUMERO_GERACOES * max(1, TAMANHO_POPULACAO // Config.AG_TAMANHO_LOTE)
+                    if Config.AG_MODO == 'estacionario' else NUMERO_GERACOES)
+
+    def criar_ag(populacao):
+        if Config.AG_MODO == 'estacionario':
+            return AlgoritmoGeneticoEstacionario(populacao, tamanho_lote=Config.AG_TAMANHO_LOTE, **opcoes)
+        return AlgoritmoGenetico(populacao,
+                                 memetico=Config.AG_MEMETICO,
+                                 fracao_memetica=Config.AG_MEMETICO_FRACAO,
+                                 orcamento_memetico=Config.AG_MEMETICO_ORCAMENTO,
+                                 workers_memeticos=Config.AG_MEMETICO_WORKERS or os.cpu_count(),
+                                 substituto=Config.AG_SUBSTITUTO,
+                                 fracao_substituto=Config.AG_SUBSTITUTO_FRACAO,
+                                 controle_substituto=Config.AG_SUBSTITUTO_CONTROLE,
+                                 reinicio_diversidade=Config.AG_REINICIO_DIVERSIDADE,
+                                 limiar_entropia=Config.AG_LIMIAR_ENTROPIA,
+                                 workers_avaliacao=Config.AG_WORKERS_AVALIACAO or os.cpu_count(),
+                                 robustez=robustez,
+                                 **opcoes)
+
+    def criar_recozimento(populacao):
+        return RecozimentoSimulado(populacao, Config.RECOZIMENTO_PASSOS, Config.RECOZIMENTO_RESFRIAMENTO,
+                                   Config.RECOZIMENTO_ALFA,
+                                   aceitacao_inicial=Config.RECOZIMENTO_ACEITACAO_INICIAL)
+
+    def criar_formigas(populacao):
+        return ColoniaFormigas(populacao, Config.FORMIGAS_QUANTIDADE, Config.FORMIGAS_ALFA, Config.FORMIGAS_BETA,
+                               Config.FORMIGAS_EVAPORACAO, Config.FORMIGAS_VIZINHOS,
+                               workers_avaliacao=Config.FORMIGAS_WORKERS or os.cpu_count())
+
     exporter = CSVExporter()
     
     print(f"OK Drone configurado (autonomia padrao: {drone.calcular_autonomia(36)/60:.1f} min)")
     print(f"OK {len(coordenadas)} coordenadas carregadas")
     print(f"OK Populacao inicial: {TAMANHO_POPULACAO} individuos")
     
-    # Executar algoritmo genético
-    print(f"\nExecutando Algoritmo Genetico...")
-    print(f"Parametros: {NUMERO_GERACOES} geracoes | Elite: 10% | Mutacao adaptativa")
-    print("=" * 70)
-    
-    for geracao in range(NUMERO_GERACOES):
-        stats = algoritmo.executar_geracao()
-        
-        # Mostrar progresso de cada geração
-        print(f"Geracao {geracao + 1:3d}/{NUMERO_GERACOES} | "
-              f"Melhor fitness: {stats.get('melhor_fitness', float('inf')):.2f} | "
-              f"Viaveis: {stats.get('individuos_viaveis', 0)}/{stats.get('tamanho', 0)}")
+    limite_segundos = Config.SOLVER_SEGUNDOS or None
+    if Config.SOLVER == 'comparar':
+        print("\nComparando AG, recozimento simulado e colonia de formigas com o mesmo tempo de relogio...")
+        print("=" * 70)
+        fabricas = {
+            'AG': lambda: criar_ag(populacao),
+            'Recozimento': lambda: criar_recozimento(nova_populacao(populacao.matriz_distancias)),
+            'Formigas': lambda: criar_formigas(nova_populacao(populacao.matriz_distancias)),
+        }
+        resultados = comparar_solvers(fabricas, limite_segundos, iteracoes_ag)
+        for resultado in resultados:
+            print(f"{resultado['nome']:<12} | Melhor fitness: {resultado['fitness']:.2f} | "
+                  f"Passos: {resultado['passos']} | Tempo: {resultado['segundos']:.1f}s")
+        vencedor = min(resultados, key=lambda r: r['fitness'])
+        print(f"Vencedor: {vencedor['nome']}")
+        algoritmo = vencedor['solver']
+    else:
+        if Config.SOLVER == 'recozimento':
+            algoritmo, iteracoes = criar_recozimento(populacao), NUMERO_GERACOES
+            print("\nExecutando Recozimento Simulado...")
+            print(f"Parametros: {Config.RECOZIMENTO_PASSOS} movimentos por passo | "
+                  f"Resfriamento: {Config.RECOZIMENTO_RESFRIAMENTO}")
+        elif Config.SOLVER == 'formigas':
+            algoritmo, iteracoes = criar_formigas(populacao), NUMERO_GERACOES
+            print("\nExecutando Colonia de Formigas...")
+            print(f"Parametros: {Config.FORMIGAS_QUANTIDADE} formigas | alfa {Config.FORMIGAS_ALFA} | "
+                  f"beta {Config.FORMIGAS_BETA} | Evaporacao: {Config.FORMIGAS_EVAPORACAO:.0%}")
+        else:
+            algoritmo, iteracoes = criar_ag(populacao), iteracoes_ag
+            print("\nExecutando Algoritmo Genetico...")
+            print(f"Parametros: {NUMERO_GERACOES} geracoes | Elite: {Config.AG_PERCENTUAL_ELITISMO:.0%} | "
+                  f"Torneio: {Config.AG_TAMANHO_TORNEIO} | Mutacao adaptativa")
+        print("=" * 70)
+
+        total = f"{limite_segundos:.0f}s" if limite_segundos else str(iteracoes)
+        passo_relatorio = 1 if limite_segundos else max(1, iteracoes // NUMERO_GERACOES)
+
+        def relatar(geracao, stats):
+            if algoritmo.parada_por_gap:
+                print(f"Geracao {geracao:3d}/{total} | Gap {algoritmo.gap:.1%} <= "
+                      f"{Config.AG_GAP_PARADA:.1%}: encerrando o AG")
+                return
+            if geracao % passo_relatorio and geracao != iteracoes:
+                return
+
+            # Mostrar progresso de cada geração
+            gap = f" | Gap: {algoritmo.gap:.1%}" if algoritmo.gap is not None else ""
+            print(f"Geracao {geracao:3d}/{total} | "
+                  f"Melhor fitness: {stats.get('melhor_fitness', float('inf')):.2f} | "
+                  f"Viaveis: {stats.get('individuos_viaveis', 0)}/{stats.get('tamanho', 0)}{gap}")
+
+        algoritmo.executar(None if limite_segundos else iteracoes, limite_segundos, relatar)
+        algoritmo.encerrar()
     
     # Obter melhor solução
     print("\n" + "=" * 70)
@@ -123,26 +234,25 @@ def main():
         print("ERRO: Nenhuma solucao viavel foi encontrada.")
         return
     
-    # Aplicar otimização 2-opt local ao melhor indivíduo
-    print("\nAplicando otimizacao 2-opt local (limitada a 1000 iteracoes)...")
+    # Aplicar busca local guiada pelo simulador ao melhor indivíduo
+    print(f"\nAplicando busca local sensivel ao custo (limite {Config.BUSCA_LOCAL_SEGUNDOS:.0f}s de CPU)...")
     print(f"   Otimizando rota com {len(melhor.coordenadas)} pontos...")
     print(f"   Distancia antes: {calcular_distancia_total(melhor.coordenadas):.2f} km")
     
     try:
-        melhor.coordenadas = aplicar_2opt(melhor.coordenadas, max_iter=1000)
-        # Revalidar viabilidade
-        melhor.viabilidade = True
-        melhor.penalidades = 0
-        melhor.validar_estrutura()
+        resultado = busca_local_simulada(melhor, populacao.matriz_distancias,
+                                    limite_segundos=Config.BUSCA_LOCAL_SEGUNDOS,
+                                    pre_otimizar_distancia=True, modo=Config.MODO_AVALIACAO)
+        print(f"   Fitness: {resultado['fitness_inicial']:.2f} -> {resultado['fitness_final']:.2f} "
+              f"({resultado['movimentos_aceitos']} movimentos, {resultado['avaliacoes']} avaliacoes)")
         print(f"   Distancia depois: {calcular_distancia_total(melhor.coordenadas):.2f} km")
-        print("   2-opt concluido")
+        print("   Busca local concluida")
     except Exception as e:
-        print(f"   Erro ao aplicar 2-opt: {e}")
+        print(f"   Erro na busca local: {e}")
     
     # Simular rota final (se ainda não foi simulada)
     print("\nSimulando rota otimizada...")
-    melhor.simular_rota(verbose=False)
-    melhor.calcular_fitness()
+    melhor.avaliar(Config.MODO_AVALIACAO)
     
     # Exibir resultados
     print(f"\nOK Solucao encontrada:")
@@ -165,10 +275,18 @@ def main():
     print(f"   - Pousos para recarga: {melhor.numero_pousos}")
     print(f"   - Custo total: R$ {melhor.custo_total:.2f}")
     print(f"   - Coordenadas visitadas: {len(melhor.coordenadas)}")
+    if robustez is not None:
+        distribuicao = simular_cenarios(melhor, robustez.cenarios)
+        resumo = resumo_distribuicao(distribuicao['fitness'], Config.AG_ROBUSTEZ_ALFA)
+        print(f"   - Fitness em {len(robustez.cenarios)} cenarios de vento: media {resumo['media']:.2f} | "
+              f"p90 {resumo['p90']:.2f} | CVaR {resumo['cvar']:.2f}")
+        print(f"   - Dias (max) / pousos (max) nos cenarios: {distribuicao['dias'].max()} / "
+              f"{distribuicao['pousos'].max()}")
     
     # Exportar resultados
     print(f"\nExportando resultados...")
     exporter.exportar_rota_completa(melhor)
+    exporter.exportar_genoma(melhor)
     exporter.exportar_resumo(melhor, historico)
     exporter.gerar_mapa_rota(melhor)
     
@@ -0,0 +1,41 @@
+"""
+Serviço local de otimização (pedidos JSON por linha, dados mantidos em memória)
+
+Exemplo de cliente:
+    printf '{"comando": "otimizar", "geracoes": 5, "acompanhar": true}\\n' | nc 127.0.0.1 8765
+"""
+import asyncio
+import os
+import sys
+
+# Adicionar diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.settings import Config
+from src.simulation.servico import ServicoOtimizacao
+
+
+async def _servir():
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    servico = ServicoOtimizacao(workers=Config.SERVICO_WORKERS,
+                                caminho_dados=os.path.join(BASE_DIR, "data", "coordenadas.csv"),
+                                ttl_tarefas=Config.SERVICO_TTL_TAREFAS)
+    servidor = await servico.iniciar(Config.SERVICO_SOCKET, Config.SERVICO_HOST, Config.SERVICO_PORTA)
+    endereco = Config.SERVICO_SOCKET or f"{Config.SERVICO_HOST}:{Config.SERVICO_PORTA}"
+    print(f"Servico de otimizacao ouvindo em {endereco}")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        servico.encerrar()
+
+
+def main():
+    try:
+        asyncio.run(_servir())
+    except KeyboardInterrupt:
+        print("\nServico encerrado")
+
+
+if __name__ == "__main__":
+    main()
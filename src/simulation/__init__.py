@@ -1,4 +1,8 @@
 """Inicialização do pacote simulation"""
 from .csv_exporter import CSVExporter
+from .cenarios import Cenario, gerar_grade, executar_lote
+from .servico import ServicoOtimizacao
+from .ajuste import amostrar_configuracoes, correr_configuracoes
 
-__all__ = ['CSVExporter']
+__all__ = ['CSVExporter', 'Cenario', 'gerar_grade', 'executar_lote', 'ServicoOtimizacao',
+           'amostrar_configuracoes', 'correr_configuracoes']
@@ -0,0 +1,186 @@
+"""Corrida de hiperparâmetros do AG com successive halving.
+
+Configurações (taxas de mutação e crossover, elitismo, tamanho do
+torneio e da população) são sorteadas de um espaço discreto e disputam
+rodadas em paralelo. Cada execução recebe um orçamento fixo de CPU e é
+pontuada pelo melhor fitness que alcançou dentro dele, de modo que
+populações grandes e pequenas são comparadas pelo mesmo custo. A cada
+rodada sobrevive a fração 1/eta mais bem pontuada, o orçamento cresce eta
+vezes e cada configuração passa a rodar com mais sementes. Os dados do
+problema são publicados em memória compartilhada, como no lote de
+cenários.
+"""
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ..core.dados_compartilhados import DadosCompartilhados
+from ..core.entities.drone import Drone
+from ..core.entities.vento import GerenciadorVento
+from ..core.populacao import Populacao
+from ..algorithms.genetico import AlgoritmoGenetico
+from ..utils_custom.file_handlers import salvar_csv
+from ..utils_custom.matriz_distancias import MatrizDistancias
+
+# Valores testados para cada hiperparâmetro
+ESPACO_PADRAO = {
+    'taxa_mutacao': (0.01, 0.02, 0.05, 0.1),
+    'taxa_crossover': (0.6, 0.8, 0.95),
+    'percentual_elitismo': (0.05, 0.1, 0.2),
+    'tamanho_torneio': (2, 3, 5, 8),
+    'tamanho_populacao': (20, 50, 100),
+}
+
+# Colunas da tabela de rodadas
+COLUNAS = ('rodada', 'orcamento_s', 'sementes', 'fitness_medio', 'geracoes_medias', 'sobreviveu',
+           'taxa_mutacao', 'taxa_crossover', 'percentual_elitismo', 'tamanho_torneio', 'tamanho_populacao')
+
+# Contexto do processo trabalhador (definido no initializer)
+_CONTEXTO = None
+
+
+def amostrar_configuracoes(espaco=None, quantidade=24, semente=0):
+    """
+    Sorteia configurações distintas do produto cartesiano do espaço.
+
+    Args:
+        espaco: {parâmetro: valores} (padrão: `ESPACO_PADRAO`)
+        quantidade: Número de configurações (limitado ao tamanho do espaço)
+        semente: Semente do sorteio
+
+    Returns:
+        list: Dicionários {parâmetro: valor}
+    """
+    espaco = espaco or ESPACO_PADRAO
+    nomes = list(espaco)
+    todas = list(itertools.product(*(espaco[nome] for nome in nomes)))
+    escolhidas = random.Random(semente).sample(todas, min(quantidade, len(todas)))
+    return [dict(zip(nomes, valores)) for valores in escolhidas]
+
+
+def executar_configuracao(configuracao, coordenadas, matriz, orcamento_segundos, semente=0, opcoes_ag=None):
+    """
+    Roda o AG com uma configuração até esgotar o orçamento de CPU.
+
+    Args:
+        configuracao: {parâmetro: valor}; `tamanho_populacao` vai para a
+            `Populacao` e os demais para `AlgoritmoGenetico`
+        coordenadas: Lista de `Coordenada`
+        matriz: MatrizDistancias das coordenadas
+        orcamento_segundos: CPU (`time.process_time`) disponível; ao menos
+            uma geração é sempre executada
+        semente: Semente do AG
+        opcoes_ag: Parâmetros fixos de `AlgoritmoGenetico` (opcional)
+
+    Returns:
+        dict: fitness (melhor alcançado), geracoes e segundos de CPU
+    """
+    inicio = time.process_time()
+    random.seed(semente)
+    opcoes = dict(opcoes_ag or {}, **configuracao)
+    tamanho = opcoes.pop('tamanho_populacao', 50)
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho, matriz_distancias=matriz)
+    algoritmo = AlgoritmoGenetico(populacao, **opcoes)
+    geracoes = 0
+    try:
+        while geracoes == 0 or time.process_time() - inicio < orcamento_segundos:
+            algoritmo.executar_geracao()
+            geracoes += 1
+    finally:
+        algoritmo.encerrar()
+    melhor = algoritmo.get_melhor_individuo()
+    return {
+        'fitness': melhor.fitness if melhor is not None else float('inf'),
+        'geracoes': geracoes,
+        'segundos': time.process_time() - inicio,
+    }
+
+
+def _inicializar_worker(descritor):
+    global _CONTEXTO
+    dados = DadosCompartilhados.anexar(descritor)
+    _CONTEXTO = {'dados': dados, 'coordenadas': dados.coordenadas(), 'matriz': dados.matriz()}
+
+
+def _executar_no_worker(tarefa):
+    configuracao, orcamento, semente, opcoes_ag = tarefa
+    return executar_configuracao(configuracao, _CONTEXTO['coordenadas'], _CONTEXTO['matriz'],
+                                 orcamento, semente, opcoes_ag)
+
+
+def correr_configuracoes(coordenadas, configuracoes, orcamento_inicial=2.0, eta=3, sementes_maximas=3,
+                         workers=None, caminho_saida=None, opcoes_ag=None):
+    """
+    Successive halving sobre as configurações.
+
+    Na rodada r cada sobrevivente roda com orçamento `orcamento_inicial *
+    eta**r` segundos de CPU e `min(r + 1, sementes_maximas)` sementes; a
+    pontuação é o fitness médio entre as sementes e avançam as
+    `ceil(n / eta)` melhores, até restar uma.
+
+    Args:
+        coordenadas: Lista de `Coordenada`
+        configuracoes: Lista de dicionários (ver `amostrar_configuracoes`)
+        orcamento_inicial: Segundos de CPU por execução na primeira rodada
+        eta: Fator de corte e de crescimento do orçamento (>= 2)
+        sementes_maximas: Máximo de sementes por configuração
+        workers: Processos (None/0 = todos os núcleos; 1 = no processo atual)
+        caminho_saida: CSV com uma linha por configuração e rodada (opcional)
+        opcoes_ag: Parâmetros fixos de `AlgoritmoGenetico`, comuns a todas (opcional)
+
+    Returns:
+        dict: melhor (configuração vencedora), fitness (sua pontuação final)
+        e linhas (tabela de todas as rodadas)
+    """
+    eta = max(2, int(eta))
+    matriz = MatrizDistancias(coordenadas)
+    workers = max(1, workers or os.cpu_count() or 1)
+    dados = pool = None
+    if workers > 1:
+        dados = DadosCompartilhados.publicar(coordenadas, matriz=matriz)
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker,
+                                   initargs=(dados.descritor,))
+
+    vivas = list(configuracoes)
+    linhas, rodada, pontuacoes = [], 0, []
+    try:
+        while True:
+            orcamento = orcamento_inicial * eta ** rodada
+            sementes = list(range(min(rodada + 1, sementes_maximas)))
+            tarefas = [(c, orcamento, s, opcoes_ag) for c in vivas for s in sementes]
+            if pool is not None:
+                resultados = list(pool.map(_executar_no_worker, tarefas))
+            else:
+                resultados = [executar_configuracao(c, coordenadas, matriz, *t) for c, *t in tarefas]
+
+            pontuacoes = []
+            for i, configuracao in enumerate(vivas):
+                execucoes = resultados[i * len(sementes):(i + 1) * len(sementes)]
+                pontuacoes.append((sum(r['fitness'] for r in execucoes) / len(execucoes),
+                                   sum(r['geracoes'] for r in execucoes) / len(execucoes)))
+
+            ordem = sorted(range(len(vivas)), key=lambda i: pontuacoes[i][0])
+            sobreviventes = ordem[:max(1, -(-len(vivas) // eta))]
+            for i, configuracao in enumerate(vivas):
+                linhas.append(dict(configuracao, rodada=rodada, orcamento_s=orcamento, sementes=len(sementes),
+                                   fitness_medio=pontuacoes[i][0], geracoes_medias=pontuacoes[i][1],
+                                   sobreviveu=i in sobreviventes and len(vivas) > 1))
+            if len(vivas) == 1:
+                break
+            vivas = [vivas[i] for i in sobreviventes]
+            rodada += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if dados is not None:
+            dados.fechar()
+
+    if caminho_saida:
+        diretorio = os.path.dirname(caminho_saida)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+        salvar_csv([[linha.get(coluna, '') for coluna in COLUNAS] for linha in linhas],
+                   caminho_saida, cabecalho=COLUNAS)
+    return {'melhor': vivas[0], 'fitness': pontuacoes[0][0], 'linhas': linhas}
@@ -0,0 +1,212 @@
+"""Execução em lote de cenários comparativos (autonomia, vento, custos).
+
+Uma grade de cenários (produto cartesiano de autonomias, tabelas de vento,
+conjuntos de custos e sementes) é executada em um pool de processos. A
+geometria do problema (coordenadas e matriz de distâncias/direções) é
+calculada uma única vez por geometria dos cenários (`geometria` e
+`latitude_referencia` de `ParametrosExecucao`) e publicada em memória
+compartilhada (`core.dados_compartilhados`); cada trabalhador a anexa sem
+cópia e só recebe o `Cenario`. Cada cenário roda com seus próprios
+`ParametrosExecucao`, e o resultado é uma tabela única, uma linha por
+cenário.
+"""
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from ..core.dados_compartilhados import DadosCompartilhados
+from ..core.entities.drone import Drone
+from ..core.entities.vento import GerenciadorVento
+from ..core.parametros import ParametrosExecucao
+from ..core.populacao import Populacao
+from ..algorithms.genetico import AlgoritmoGenetico
+from ..utils_custom.file_handlers import salvar_csv
+from ..utils_custom.matriz_distancias import MatrizDistancias
+
+# Colunas da tabela comparativa
+COLUNAS = ('cenario', 'autonomia_min', 'vento', 'custos', 'semente', 'fitness', 'viavel',
+           'distancia_km', 'tempo_voo_min', 'custo_total', 'pousos', 'pousos_taxa_tarde',
+           'dias', 'segundos')
+
+# Contexto do processo trabalhador (definido no initializer)
+_CONTEXTO = None
+
+
+@dataclass(frozen=True)
+class Cenario:
+    """Uma combinação da grade.
+
+    Attributes:
+        autonomia_minutos: Autonomia na velocidade de referência (None = `Config`)
+        tabela_vento: CSV no formato de `GerenciadorVento.de_csv` (None = tabela embutida)
+        custos: Pares (campo, valor) sobrescritos em `ParametrosExecucao`
+        semente: Semente do gerador aleatório do AG
+    """
+
+    autonomia_minutos: float = None
+    tabela_vento: str = None
+    custos: tuple = ()
+    semente: int = 0
+
+    @property
+    def nome(self):
+        partes = [f"aut={self.autonomia_minutos:g}min" if self.autonomia_minutos is not None else 'aut=padrao',
+                  f"vento={os.path.basename(self.tabela_vento) if self.tabela_vento else 'padrao'}"]
+        partes += [f"{campo}={valor:g}" if isinstance(valor, float) else f"{campo}={valor}"
+                   for campo, valor in self.custos]
+        partes.append(f"semente={self.semente}")
+        return ' '.join(partes)
+
+    def parametros(self):
+        """ParametrosExecucao do cenário (`Config` + sobrescritas)."""
+        parametros = ParametrosExecucao.de_config(**dict(self.custos))
+        if self.autonomia_minutos is not None:
+            # calcular_autonomia(v_ref) = autonomia_referencia * fator_correcao
+            parametros = parametros.com(
+                autonomia_referencia=self.autonomia_minutos * 60.0 / parametros.fator_correcao)
+        return parametros
+
+    def geometria(self):
+        """(geometria, latitude_referencia) dos parâmetros do cenário."""
+        parametros = self.parametros()
+        return parametros.geometria, parametros.latitude_referencia
+
+    def gerenciador_vento(self):
+        return GerenciadorVento.de_csv(self.tabela_vento) if self.tabela_vento else GerenciadorVento()
+
+
+def gerar_grade(autonomias=(None,), tabelas_vento=(None,), custos=({},), sementes=(0,)):
+    """
+    Produto cartesiano dos eixos da grade.
+
+    Args:
+        autonomias: Autonomias em minutos (None = `Config`)
+        tabelas_vento: Caminhos de CSV de vento (None = tabela embutida)
+        custos: Dicionários de sobrescritas de `ParametrosExecucao`
+        sementes: Sementes do AG
+
+    Returns:
+        list: Lista de `Cenario`
+    """
+    return [Cenario(autonomia, vento, tuple(sorted(sobrescritas.items())), semente)
+            for autonomia, vento, sobrescritas, semente
+            in itertools.product(autonomias, tabelas_vento, custos, sementes)]
+
+
+def executar_cenario(cenario, coordenadas, matriz, geracoes=10, tamanho_populacao=50, opcoes_ag=None):
+    """
+    Roda o AG para um cenário.
+
+    Args:
+        cenario: Cenario a executar
+        coordenadas: Lista de `Coordenada`
+        matriz: MatrizDistancias das coordenadas na geometria do cenário
+            (compartilhada entre cenários; None = calculada pela população)
+        geracoes: Gerações do AG
+        tamanho_populacao: Indivíduos por geração
+        opcoes_ag: Parâmetros adicionais de `AlgoritmoGenetico` (opcional)
+
+    Returns:
+        dict: Linha da tabela comparativa (chaves em `COLUNAS`)
+    """
+    inicio = time.perf_counter()
+    random.seed(cenario.semente)
+    parametros = cenario.parametros()
+    drone = Drone(parametros=parametros)
+    populacao = Populacao(coordenadas, drone, cenario.gerenciador_vento(), tamanho_populacao,
+                          matriz_distancias=matriz)
+    algoritmo = AlgoritmoGenetico(populacao, **(opcoes_ag or {}))
+    try:
+        for _ in range(geracoes):
+            algoritmo.executar_geracao()
+    finally:
+        algoritmo.encerrar()
+
+    melhor = algoritmo.get_melhor_individuo()
+    linha = {
+        'cenario': cenario.nome,
+        'autonomia_min': drone.calcular_autonomia(parametros.velocidade_referencia) / 60.0,
+        'vento': cenario.tabela_vento or 'padrao',
+        'custos': ';'.join(f"{campo}={valor}" for campo, valor in cenario.custos),
+        'semente': cenario.semente,
+        'segundos': time.perf_counter() - inicio,
+    }
+    if melhor is None:
+        linha.update(fitness=float('inf'), viavel=False)
+        return linha
+    linha.update(fitness=melhor.fitness, viavel=melhor.viabilidade, distancia_km=melhor.distancia_total,
+                 tempo_voo_min=melhor.tempo_total, custo_total=melhor.custo_total,
+                 pousos=melhor.numero_pousos, pousos_taxa_tarde=melhor.pousos_taxa_tarde,
+                 dias=melhor.dias_utilizados)
+    return linha
+
+
+def _inicializar_worker(descritores):
+    global _CONTEXTO
+    _CONTEXTO = {}
+    for geometria, descritor in descritores.items():
+        dados = DadosCompartilhados.anexar(descritor)
+        _CONTEXTO[geometria] = {'dados': dados, 'coordenadas': dados.coordenadas(),
+                                'matriz': dados.matriz(*geometria)}
+
+
+def _executar_no_worker(cenario, geracoes, tamanho_populacao, opcoes_ag):
+    contexto = _CONTEXTO[cenario.geometria()]
+    return executar_cenario(cenario, contexto['coordenadas'], contexto['matriz'],
+                            geracoes, tamanho_populacao, opcoes_ag)
+
+
+def executar_lote(cenarios, coordenadas, geracoes=10, tamanho_populacao=50, workers=None,
+                  caminho_saida=None, opcoes_ag=None):
+    """
+    Executa os cenários em paralelo e consolida os resultados.
+
+    Args:
+        cenarios: Lista de `Cenario` (ver `gerar_grade`)
+        coordenadas: Lista de `Coordenada`
+        geracoes: Gerações do AG por cenário
+        tamanho_populacao: Indivíduos por geração
+        workers: Processos (None/0 = todos os núcleos; 1 = no processo atual)
+        caminho_saida: CSV da tabela comparativa (opcional)
+        opcoes_ag: Parâmetros adicionais de `AlgoritmoGenetico` (opcional)
+
+    Returns:
+        list: Uma linha (dict) por cenário, na ordem de `cenarios`
+    """
+    cenarios = list(cenarios)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(cenarios)))
+    matrizes = {}
+    for cenario in cenarios:
+        geometria = cenario.geometria()
+        if geometria not in matrizes:
+            matrizes[geometria] = MatrizDistancias(coordenadas, *geometria)
+
+    if workers == 1:
+        linhas = [executar_cenario(c, coordenadas, matrizes[c.geometria()], geracoes, tamanho_populacao,
+                                   opcoes_ag)
+                  for c in cenarios]
+    else:
+        publicados = {}
+        try:
+            for geometria, matriz in matrizes.items():
+                publicados[geometria] = DadosCompartilhados.publicar(coordenadas, matriz=matriz)
+            descritores = {geometria: dados.descritor for geometria, dados in publicados.items()}
+            with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker,
+                                     initargs=(descritores,)) as pool:
+                n = len(cenarios)
+                linhas = list(pool.map(_executar_no_worker, cenarios, [geracoes] * n,
+                                       [tamanho_populacao] * n, [opcoes_ag] * n))
+        finally:
+            for dados in publicados.values():
+                dados.fechar()
+
+    if caminho_saida:
+        diretorio = os.path.dirname(caminho_saida)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+        salvar_csv([[linha.get(coluna, '') for coluna in COLUNAS] for linha in linhas],
+                   caminho_saida, cabecalho=COLUNAS)
+    return linhas
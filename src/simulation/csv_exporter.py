@@ -7,6 +7,7 @@ from datetime import datetime
 import matplotlib.pyplot as plt
 from ..core.settings import Config
 from ..utils_custom.time_utils import formatar_hora_csv
+from ..utils_custom.file_handlers import salvar_genoma
 
 class CSVExporter:
     """Exporta resultados da otimização em arquivos CSV"""
@@ -83,6 +84,61 @@ class CSVExporter:
         print(f"OK Plano de voo salvo: {caminho_completo}")
         return caminho_completo
     
+    def exportar_genoma(self, individuo):
+        """
+        Exporta a ordem de visita (um CEP por linha) para partida a quente.
+
+        Args:
+            individuo: Melhor indivíduo encontrado
+
+        Returns:
+            str: Caminho do arquivo criado
+        """
+        caminho_completo = os.path.join(self.diretorio_saida, "genoma.csv")
+        salvar_genoma([c.cep for c in individuo.coordenadas], caminho_completo)
+        print(f"OK Genoma salvo: {caminho_completo}")
+        return caminho_completo
+
+    def exportar_frota(self, individuos):
+        """
+        Exporta um plano de voo por drone (`drone_<k>/`) e o resumo da frota.
+
+        Args:
+            individuos: Rotas avaliadas, uma por drone
+
+        Returns:
+            str: Caminho do resumo da frota (resumo_frota.csv)
+        """
+        linhas = []
+        for k, individuo in enumerate(individuos, start=1):
+            exporter = CSVExporter(os.path.join(self.diretorio_saida, f"drone_{k}"))
+            exporter.exportar_rota_completa(individuo)
+            exporter.exportar_genoma(individuo)
+            linhas.append([k, len(individuo.coordenadas) - 2, f"{individuo.distancia_total:.2f}",
+                           f"{individuo.tempo_total:.2f}", individuo.numero_pousos, individuo.pousos_taxa_tarde,
+                           individuo.dias_utilizados, individuo.minutos_totais_desde_inicio,
+                           f"{individuo.custo_total:.2f}", f"{individuo.fitness:.2f}"])
+
+        linhas.append(['TOTAL', sum(l[1] for l in linhas),
+                       f"{sum(ind.distancia_total for ind in individuos):.2f}",
+                       f"{sum(ind.tempo_total for ind in individuos):.2f}",
+                       sum(ind.numero_pousos for ind in individuos),
+                       sum(ind.pousos_taxa_tarde for ind in individuos),
+                       max(ind.dias_utilizados for ind in individuos),
+                       max(ind.minutos_totais_desde_inicio or 0 for ind in individuos),
+                       f"{sum(ind.custo_total for ind in individuos):.2f}",
+                       f"{sum(ind.fitness for ind in individuos):.2f}"])
+
+        caminho_completo = os.path.join(self.diretorio_saida, "resumo_frota.csv")
+        with open(caminho_completo, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Drone', 'Pontos', 'Distancia (km)', 'Tempo voo (min)', 'Pousos',
+                             'Pousos taxa tarde', 'Dias', 'Minutos missao', 'Custo total', 'Fitness'])
+            writer.writerows(linhas)
+
+        print(f"OK Resumo da frota salvo: {caminho_completo}")
+        return caminho_completo
+
     def exportar_resumo(self, individuo, historico_metricas):
         """
         Exporta resumo da execução.
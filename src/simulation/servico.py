@@ -0,0 +1,359 @@
+"""Serviço local de otimização com caches mantidos em memória.
+
+Um processo de longa duração atende pedidos JSON (um objeto por linha) em
+um socket Unix ou TCP local (`asyncio`). Coordenadas, matriz de
+distâncias/direções, drones por `ParametrosExecucao`, tabelas de vento e
+as avaliações de rotas já simuladas ficam em memória entre pedidos, de modo
+que pedidos repetidos sobre o mesmo conjunto de dados não recarregam nada.
+
+Comandos (campo `comando`):
+    ping                      -> {'ok': True}
+    avaliar  {rota, ...}      -> métricas da rota (lista de CEPs)
+    otimizar {geracoes, ...}  -> {'tarefa': id}; com `acompanhar` também
+                                 transmite um evento por geração e o final
+    melhor   {tarefa}         -> melhor plano encontrado até o momento
+    estado   {tarefa}         -> progresso da tarefa
+    cancelar {tarefa}         -> interrompe após a geração corrente
+
+Campos comuns: `dados` (CSV de coordenadas), `limite` (primeiros N pontos),
+`vento` (CSV de `GerenciadorVento.de_csv`), `parametros` (sobrescritas de
+`ParametrosExecucao`) e `modo` ('guloso' ou 'split').
+
+As simulações rodam em um pool limitado de threads; o laço de eventos só
+encaminha pedidos e eventos de progresso. Uma otimização com `semente` usa
+seu próprio `random.Random`, de modo que tarefas simultâneas não disputam o
+gerador global. Tarefas encerradas continuam consultáveis por
+`ttl_tarefas` segundos e depois são descartadas.
+"""
+import asyncio
+import itertools
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ..core.entities.drone import Drone
+from ..core.entities.vento import GerenciadorVento
+from ..core.individuo import Individuo
+from ..core.parametros import ParametrosExecucao
+from ..core.populacao import Populacao
+from ..core.settings import Config
+from ..algorithms.genetico import AlgoritmoGenetico
+from ..utils_custom.file_handlers import carregar_coordenadas
+from ..utils_custom.matriz_distancias import MatrizDistancias
+
+
+def _numero(valor):
+    """Converte infinito em None (JSON padrão não representa infinito)."""
+    return None if valor == float('inf') else valor
+
+
+def resumo_individuo(individuo, incluir_rota=True):
+    """Métricas (e rota em CEPs) de um indivíduo avaliado, serializáveis em JSON."""
+    resumo = {
+        'fitness': _numero(individuo.fitness),
+        'viavel': individuo.viabilidade,
+        'distancia_km': individuo.distancia_total,
+        'tempo_voo_min': individuo.tempo_total,
+        'custo_total': individuo.custo_total,
+        'pousos': individuo.numero_pousos,
+        'pousos_taxa_tarde': individuo.pousos_taxa_tarde,
+        'dias': individuo.dias_utilizados,
+    }
+    if incluir_rota:
+        resumo['rota'] = [c.cep for c in individuo.coordenadas]
+    return resumo
+
+
+class Tarefa:
+    """Otimização em andamento (estado, progresso e melhor plano até agora)."""
+
+    def __init__(self, identificador, geracoes, loop):
+        self.id = identificador
+        self.geracoes = geracoes
+        self.geracao = 0
+        self.estado = 'fila'
+        self.melhor = None
+        self.erro = None
+        self.cancelada = False
+        self.encerrada_em = None
+        self._loop = loop
+        self._ouvintes = []
+        self.concluida = asyncio.Event()
+
+    def inscrever(self):
+        """Fila que recebe os eventos publicados a partir de agora."""
+        fila = asyncio.Queue()
+        self._ouvintes.append(fila)
+        return fila
+
+    def publicar(self, evento):
+        """Entrega um evento aos ouvintes (chamado de qualquer thread)."""
+        self._loop.call_soon_threadsafe(self._entregar, evento)
+
+    def _entregar(self, evento):
+        for fila in self._ouvintes:
+            fila.put_nowait(evento)
+        if evento['evento'] == 'fim':
+            self.encerrada_em = time.monotonic()
+            self.concluida.set()
+
+    def resumo(self):
+        return {'tarefa': self.id, 'estado': self.estado, 'geracao': self.geracao,
+                'geracoes': self.geracoes, 'erro': self.erro,
+                'melhor_fitness': self.melhor['fitness'] if self.melhor else None}
+
+
+class ServicoOtimizacao:
+    """Atende pedidos de avaliação/otimização sobre dados mantidos em memória."""
+
+    def __init__(self, workers=2, caminho_dados=None, limite_cache=10000, ttl_tarefas=3600.0):
+        """
+        Args:
+            workers: Threads que executam simulações e otimizações
+            caminho_dados: CSV de coordenadas padrão dos pedidos
+            limite_cache: Máximo de avaliações de rota guardadas
+            ttl_tarefas: Segundos em que uma tarefa encerrada ainda responde
+                a `melhor`/`estado` antes de ser descartada
+        """
+        self.caminho_dados = caminho_dados or 'data/coordenadas.csv'
+        self.limite_cache = limite_cache
+        self.ttl_tarefas = ttl_tarefas
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(workers)))
+        self._trava = threading.Lock()
+        self._conjuntos = {}
+        self._ventos = {}
+        self._drones = {}
+        self._avaliacoes = {}
+        self._tarefas = {}
+        self._contador = itertools.count(1)
+        self.acertos_cache = 0
+
+    # ------------------------------------------------------------------
+    # Caches
+    # ------------------------------------------------------------------
+    def _conjunto(self, pedido):
+        """Coordenadas do conjunto de dados (carregadas uma vez)."""
+        chave = (pedido.get('dados') or self.caminho_dados, pedido.get('limite'))
+        with self._trava:
+            conjunto = self._conjuntos.get(chave)
+            if conjunto is None:
+                coordenadas = carregar_coordenadas(chave[0])
+                if not coordenadas:
+                    raise ValueError(f"Nenhuma coordenada carregada de {chave[0]}")
+                if chave[1]:
+                    coordenadas = coordenadas[:int(chave[1])]
+                conjunto = {'chave': chave, 'coordenadas': list(coordenadas), 'matrizes': {}}
+                conjunto['por_cep'] = {c.cep: c for c in conjunto['coordenadas']}
+                self._conjuntos[chave] = conjunto
+        return conjunto
+
+    def _matriz(self, conjunto, parametros):
+        """Matriz de distâncias do conjunto na geometria dos parâmetros (uma por geometria)."""
+        chave = (parametros.geometria, parametros.latitude_referencia)
+        with self._trava:
+            matriz = conjunto['matrizes'].get(chave)
+            if matriz is None:
+                matriz = MatrizDistancias(conjunto['coordenadas'], *chave)
+                conjunto['matrizes'][chave] = matriz
+        return matriz
+
+    def _vento(self, pedido):
+        caminho = pedido.get('vento')
+        with self._trava:
+            if caminho not in self._ventos:
+                self._ventos[caminho] = GerenciadorVento.de_csv(caminho) if caminho else GerenciadorVento()
+            return self._ventos[caminho]
+
+    def _drone(self, pedido):
+        parametros = ParametrosExecucao.de_config(**(pedido.get('parametros') or {}))
+        with self._trava:
+            if parametros not in self._drones:
+                self._drones[parametros] = Drone(parametros=parametros)
+            return self._drones[parametros]
+
+    # ------------------------------------------------------------------
+    # Comandos
+    # ------------------------------------------------------------------
+    async def processar(self, pedido):
+        """
+        Executa um comando que responde com uma única mensagem.
+
+        Args:
+            pedido: Dicionário com `comando` e os campos do comando
+
+        Returns:
+            dict: Resposta (`ok` False e `erro` em caso de falha)
+        """
+        comando = pedido.get('comando')
+        self._descartar_tarefas_antigas()
+        try:
+            if comando == 'ping':
+                return {'ok': True}
+            if comando == 'avaliar':
+                return await self._avaliar(pedido)
+            if comando == 'otimizar':
+                return {'ok': True, **self._otimizar(pedido).resumo()}
+            if comando in ('melhor', 'estado', 'cancelar'):
+                tarefa = self._tarefas.get(pedido.get('tarefa'))
+                if tarefa is None:
+                    raise KeyError(f"Tarefa desconhecida: {pedido.get('tarefa')}")
+                if comando == 'cancelar':
+                    tarefa.cancelada = True
+                if comando == 'melhor':
+                    return {'ok': True, **tarefa.resumo(), 'plano': tarefa.melhor}
+                return {'ok': True, **tarefa.resumo()}
+            raise ValueError(f"Comando desconhecido: {comando}")
+        except Exception as e:
+            return {'ok': False, 'erro': f"{type(e).__name__}: {e}"}
+
+    async def _avaliar(self, pedido):
+        modo = pedido.get('modo') or Config.MODO_AVALIACAO
+        rota = tuple(pedido['rota'])
+        chave = (pedido.get('dados') or self.caminho_dados, pedido.get('limite'), pedido.get('vento'),
+                 json.dumps(pedido.get('parametros') or {}, sort_keys=True), modo, rota)
+        resposta = self._avaliacoes.get(chave)
+        if resposta is not None:
+            self.acertos_cache += 1
+            return {**resposta, 'cache': True}
+
+        def simular():
+            conjunto = self._conjunto(pedido)
+            try:
+                coordenadas = [conjunto['por_cep'][cep] for cep in rota]
+            except KeyError as e:
+                raise ValueError(f"CEP fora do conjunto de dados: {e.args[0]}") from None
+            individuo = Individuo(coordenadas, self._drone(pedido), self._vento(pedido))
+            individuo.avaliar(modo)
+            return {'ok': True, **resumo_individuo(individuo, incluir_rota=False)}
+
+        resposta = await asyncio.get_running_loop().run_in_executor(self._executor, simular)
+        if len(self._avaliacoes) >= self.limite_cache:
+            self._avaliacoes.pop(next(iter(self._avaliacoes)))
+        self._avaliacoes[chave] = resposta
+        return {**resposta, 'cache': False}
+
+    def _descartar_tarefas_antigas(self):
+        """Remove tarefas encerradas há mais de `ttl_tarefas` segundos."""
+        agora = time.monotonic()
+        antigas = [tid for tid, tarefa in self._tarefas.items()
+                   if tarefa.encerrada_em is not None and agora - tarefa.encerrada_em > self.ttl_tarefas]
+        for tid in antigas:
+            del self._tarefas[tid]
+
+    def _otimizar(self, pedido):
+        self._descartar_tarefas_antigas()
+        tarefa = Tarefa(next(self._contador), int(pedido.get('geracoes', 10)), asyncio.get_running_loop())
+        self._tarefas[tarefa.id] = tarefa
+        self._executor.submit(self._executar_otimizacao, tarefa, pedido)
+        return tarefa
+
+    def _executar_otimizacao(self, tarefa, pedido):
+        """Roda o AG em uma thread do pool, publicando o progresso.
+
+        Com `semente`, o AG sorteia de um `random.Random` só desta tarefa, e
+        o resultado não depende de outras tarefas rodando em paralelo.
+        """
+        tarefa.estado = 'executando'
+        algoritmo = None
+        try:
+            conjunto = self._conjunto(pedido)
+            drone = self._drone(pedido)
+            semente = pedido.get('semente')
+            populacao = Populacao(conjunto['coordenadas'], drone, self._vento(pedido),
+                                  int(pedido.get('populacao', 50)), pedido.get('modo'),
+                                  matriz_distancias=self._matriz(conjunto, drone.parametros),
+                                  rng=random.Random(semente) if semente is not None else None)
+            algoritmo = AlgoritmoGenetico(populacao, **(pedido.get('opcoes') or {}))
+            for geracao in range(tarefa.geracoes):
+                if tarefa.cancelada:
+                    tarefa.estado = 'cancelada'
+                    break
+                stats = algoritmo.executar_geracao()
+                melhor = algoritmo.get_melhor_individuo()
+                if melhor is not None:
+                    tarefa.melhor = resumo_individuo(melhor)
+                tarefa.geracao = geracao + 1
+                tarefa.publicar({'evento': 'geracao', 'tarefa': tarefa.id, 'geracao': tarefa.geracao,
+                                 'melhor_fitness': _numero(stats.get('melhor_fitness', float('inf'))),
+                                 'fitness_medio': _numero(stats.get('fitness_medio', float('inf'))),
+                                 'individuos_viaveis': stats.get('individuos_viaveis', 0)})
+            else:
+                tarefa.estado = 'concluida'
+        except Exception as e:
+            tarefa.estado = 'erro'
+            tarefa.erro = f"{type(e).__name__}: {e}"
+        finally:
+            if algoritmo is not None:
+                algoritmo.encerrar()
+            tarefa.publicar({'evento': 'fim', **tarefa.resumo(), 'plano': tarefa.melhor})
+
+    # ------------------------------------------------------------------
+    # Transporte
+    # ------------------------------------------------------------------
+    async def atender(self, leitor, escritor):
+        """Atende uma conexão: um pedido JSON por linha, uma resposta por linha.
+
+        Um `otimizar` com `acompanhar` ocupa a conexão até o evento `fim`;
+        consultas paralelas (`melhor`, `estado`) usam outra conexão.
+        """
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                try:
+                    pedido = json.loads(linha)
+                except ValueError as e:
+                    await self._enviar(escritor, {'ok': False, 'erro': f"JSON inválido: {e}"})
+                    continue
+
+                if pedido.get('comando') == 'otimizar' and pedido.get('acompanhar'):
+                    await self._acompanhar(pedido, escritor)
+                else:
+                    await self._enviar(escritor, await self.processar(pedido))
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    async def _acompanhar(self, pedido, escritor):
+        try:
+            tarefa = self._otimizar(pedido)
+        except Exception as e:
+            await self._enviar(escritor, {'ok': False, 'erro': f"{type(e).__name__}: {e}"})
+            return
+        fila = tarefa.inscrever()
+        await self._enviar(escritor, {'ok': True, **tarefa.resumo()})
+        while True:
+            evento = await fila.get()
+            await self._enviar(escritor, evento)
+            if evento['evento'] == 'fim':
+                return
+
+    @staticmethod
+    async def _enviar(escritor, mensagem):
+        escritor.write(json.dumps(mensagem, ensure_ascii=False).encode('utf-8') + b'\n')
+        await escritor.drain()
+
+    async def iniciar(self, caminho_socket=None, host='127.0.0.1', porta=8765):
+        """
+        Abre o servidor (socket Unix se `caminho_socket`, senão TCP local).
+
+        Returns:
+            asyncio.Server: Servidor já escutando
+        """
+        if caminho_socket:
+            return await asyncio.start_unix_server(self.atender, path=caminho_socket)
+        return await asyncio.start_server(self.atender, host, porta)
+
+    def encerrar(self):
+        """Cancela tarefas pendentes e libera o pool."""
+        for tarefa in self._tarefas.values():
+            tarefa.cancelada = True
+        self._executor.shutdown(wait=True)
+
+    def __repr__(self):
+        return (f"ServicoOtimizacao({len(self._conjuntos)} conjuntos, "
+                f"{len(self._avaliacoes)} avaliações em cache, {len(self._tarefas)} tarefas)")
@@ -3,16 +3,19 @@ from .calculos import (
     distancia_haversine,
     calcular_direcao,
     cardinal_para_angulo,
+    angulo_para_cardinal,
     calcular_velocidade_efetiva,
     validar_velocidade,
     get_velocidades_validas
 )
-from .file_handlers import carregar_coordenadas, salvar_csv
+from .file_handlers import carregar_coordenadas, carregar_rota, salvar_genoma, salvar_csv
 from .time_utils import abs_to_day_and_minuto, formatar_hora, formatar_hora_csv
+from .matriz_distancias import MatrizDistancias
 
 __all__ = [
-    'distancia_haversine', 'calcular_direcao', 'cardinal_para_angulo',
+    'distancia_haversine', 'calcular_direcao', 'cardinal_para_angulo', 'angulo_para_cardinal',
     'calcular_velocidade_efetiva', 'validar_velocidade', 'get_velocidades_validas',
-    'carregar_coordenadas', 'salvar_csv',
-    'abs_to_day_and_minuto', 'formatar_hora', 'formatar_hora_csv'
+    'carregar_coordenadas', 'carregar_rota', 'salvar_genoma', 'salvar_csv',
+    'abs_to_day_and_minuto', 'formatar_hora', 'formatar_hora_csv',
+    'MatrizDistancias'
 ]
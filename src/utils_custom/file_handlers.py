@@ -1,24 +1,153 @@
 """Leitura/escrita simplificada de CSVs usados pelo projeto."""
 import csv
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+
+import numpy as np
+
 from ..core.entities.coordenada import Coordenada
 
+# Registro binário do sidecar de coordenadas
+DTYPE_COORDENADAS = np.dtype([('cep', 'U16'), ('latitude', 'f8'), ('longitude', 'f8')])
 
-def carregar_coordenadas(caminho):
-    """Lê um CSV e retorna objetos `Coordenada`.
 
-    Aceita colunas `latitude`/`longitude` ou `lat`/`lon`.
+class ListaCoordenadas(Sequence):
+    """Sequência de `Coordenada` criadas sob demanda a partir de arrays.
+
+    Índices retornam `Coordenada` (cada uma criada uma única vez); fatias
+    retornam listas comuns. Os arrays ficam expostos em `ceps`,
+    `latitudes` e `longitudes` para código vetorizado.
     """
-    resultado = []
+
+    def __init__(self, registros):
+        """
+        Args:
+            registros: Array estruturado com campos cep, latitude e longitude
+        """
+        self.registros = registros
+        self._cache = [None] * len(registros)
+
+    @property
+    def ceps(self):
+        return self.registros['cep']
+
+    @property
+    def latitudes(self):
+        return self.registros['latitude']
+
+    @property
+    def longitudes(self):
+        return self.registros['longitude']
+
+    def _coordenada(self, i):
+        coord = self._cache[i]
+        if coord is None:
+            registro = self.registros[i]
+            coord = Coordenada(str(registro['cep']), float(registro['latitude']), float(registro['longitude']))
+            self._cache[i] = coord
+        return coord
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._coordenada(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError(indice)
+        return self._coordenada(indice)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __repr__(self):
+        return f"ListaCoordenadas({len(self)} pontos)"
+
+
+def _caminhos_sidecar(caminho):
+    base = os.path.splitext(caminho)[0]
+    return base + '.npy', base + '.npy.json'
+
+
+def _sha1(caminho):
+    digest = hashlib.sha1()
+    with open(caminho, 'rb') as fh:
+        for bloco in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(bloco)
+    return digest.hexdigest()
+
+
+def _carregar_sidecar(caminho):
+    """Retorna os registros do sidecar (memory-mapped) ou None se ausente/desatualizado."""
+    caminho_npy, caminho_meta = _caminhos_sidecar(caminho)
     try:
-        with open(caminho, 'r', encoding='utf-8') as fh:
-            reader = csv.DictReader(fh)
-            for linha in reader:
-                lat = linha.get('latitude') or linha.get('lat')
-                lon = linha.get('longitude') or linha.get('lon')
+        with open(caminho_meta, 'r', encoding='utf-8') as fh:
+            meta = json.load(fh)
+        estado = os.stat(caminho)
+        if estado.st_size != meta['tamanho']:
+            return None
+        if estado.st_mtime_ns != meta['mtime_ns']:
+            # arquivo tocado (ex.: checkout): confere o conteúdo antes de descartar
+            if _sha1(caminho) != meta['sha1']:
+                return None
+            meta['mtime_ns'] = estado.st_mtime_ns
+            with open(caminho_meta, 'w', encoding='utf-8') as fh:
+                json.dump(meta, fh)
+        registros = np.load(caminho_npy, mmap_mode='r')
+    except (OSError, ValueError, KeyError):
+        return None
+    return registros if registros.dtype == DTYPE_COORDENADAS else None
+
+
+def _gravar_sidecar(caminho, registros):
+    """Grava o sidecar ao lado do CSV; falhas (ex.: diretório somente leitura) são ignoradas."""
+    caminho_npy, caminho_meta = _caminhos_sidecar(caminho)
+    try:
+        estado = os.stat(caminho)
+        meta = {'mtime_ns': estado.st_mtime_ns, 'tamanho': estado.st_size, 'sha1': _sha1(caminho)}
+
+        temporario = caminho_npy + '.tmp'
+        with open(temporario, 'wb') as fh:
+            np.save(fh, registros)
+        os.replace(temporario, caminho_npy)
+        with open(caminho_meta + '.tmp', 'w', encoding='utf-8') as fh:
+            json.dump(meta, fh)
+        os.replace(caminho_meta + '.tmp', caminho_meta)
+    except OSError:
+        pass
 
-                coord = Coordenada(cep=linha['cep'], latitude=float(lat), longitude=float(lon))
-                resultado.append(coord)
 
+def _ler_csv_coordenadas(caminho):
+    """Lê o CSV linha a linha e retorna o array estruturado de registros."""
+    linhas = []
+    with open(caminho, 'r', encoding='utf-8') as fh:
+        reader = csv.DictReader(fh)
+        for linha in reader:
+            lat = linha.get('latitude') or linha.get('lat')
+            lon = linha.get('longitude') or linha.get('lon')
+            linhas.append((str(linha['cep']), float(lat), float(lon)))
+    return np.array(linhas, dtype=DTYPE_COORDENADAS)
+
+
+def carregar_coordenadas(caminho, usar_cache=True):
+    """Lê um CSV e retorna objetos `Coordenada`.
+
+    Aceita colunas `latitude`/`longitude` ou `lat`/`lon`. Com `usar_cache`,
+    mantém ao lado do CSV um sidecar binário (`.npy` + metadados `.npy.json`
+    com mtime, tamanho e sha1) que é memory-mapped nas cargas seguintes.
+
+    Returns:
+        ListaCoordenadas: Sequência de `Coordenada` (criadas sob demanda)
+    """
+    try:
+        registros = _carregar_sidecar(caminho) if usar_cache else None
+        if registros is None:
+            registros = _ler_csv_coordenadas(caminho)
+            if usar_cache:
+                _gravar_sidecar(caminho, registros)
+
+        resultado = ListaCoordenadas(registros)
         print(f"OK {len(resultado)} coordenadas carregadas")
         return resultado
 
@@ -30,6 +159,40 @@ def carregar_coordenadas(caminho):
         return []
 
 
+def carregar_rota(caminho):
+    """Lê a ordem de visita (CEPs) de um plano de voo ou de um arquivo de genoma.
+
+    Aceita o `flight_plan.csv` do `CSVExporter` (colunas `CEP inicial` e
+    `CEP final`; a rota é a sequência de origens mais o último destino) ou
+    um genoma com um CEP por linha (cabeçalho `cep` opcional).
+
+    Returns:
+        list: CEPs na ordem de visita (vazia se o arquivo não existir)
+    """
+    try:
+        with open(caminho, 'r', encoding='utf-8') as fh:
+            linhas = [linha for linha in csv.reader(fh) if linha and linha[0].strip()]
+    except FileNotFoundError:
+        print(f"ERRO: arquivo {caminho} não encontrado")
+        return []
+    if not linhas:
+        return []
+
+    cabecalho = [coluna.strip().lower() for coluna in linhas[0]]
+    if 'cep inicial' in cabecalho and 'cep final' in cabecalho:
+        origem, destino = cabecalho.index('cep inicial'), cabecalho.index('cep final')
+        corpo = linhas[1:]
+        return [linha[origem].strip() for linha in corpo] + [corpo[-1][destino].strip()] if corpo else []
+
+    corpo = linhas[1:] if cabecalho[0] == 'cep' else linhas
+    return [linha[0].strip() for linha in corpo]
+
+
+def salvar_genoma(ceps, caminho):
+    """Grava a ordem de visita (um CEP por linha) para reuso com `carregar_rota`."""
+    return salvar_csv([[cep] for cep in ceps], caminho, cabecalho=['cep'])
+
+
 def salvar_csv(dados, caminho, cabecalho=None):
     """Grava `dados` em CSV; `dados` é uma lista de linhas (iteráveis)."""
     try:
@@ -0,0 +1,235 @@
+"""Matriz de distâncias/direções pré-calculada entre coordenadas.
+
+Usada por buscas locais e heurísticas que trabalham com rotas em forma
+de índices inteiros em vez de listas de `Coordenada`.
+"""
+import math
+
+import numpy as np
+
+from ..core.settings import Config
+from .calculos import RAIO_TERRA_KM, GEOMETRIAS, LATITUDE_REFERENCIA
+
+
+def matriz_haversine(lats, lons, lats_destino=None, lons_destino=None):
+    """Retorna matriz (n x m) de distâncias Haversine em km (vetorizada).
+
+    Sem destinos, calcula a matriz quadrada entre os próprios pontos.
+    """
+    lat = np.radians(np.asarray(lats, dtype=float))
+    lon = np.radians(np.asarray(lons, dtype=float))
+    lat2 = lat if lats_destino is None else np.radians(np.asarray(lats_destino, dtype=float))
+    lon2 = lon if lons_destino is None else np.radians(np.asarray(lons_destino, dtype=float))
+
+    dlat = lat2[None, :] - lat[:, None]
+    dlon = lon2[None, :] - lon[:, None]
+
+    a = np.sin(dlat / 2.0) ** 2 + np.cos(lat)[:, None] * np.cos(lat2)[None, :] * np.sin(dlon / 2.0) ** 2
+    a = np.clip(a, 0.0, 1.0)
+    return RAIO_TERRA_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def matriz_direcoes(lats, lons, lats_destino=None, lons_destino=None):
+    """Retorna matriz (n x m) de bearings P_i -> P_j em graus [0, 360)."""
+    lat = np.radians(np.asarray(lats, dtype=float))
+    lon = np.radians(np.asarray(lons, dtype=float))
+    lat2 = lat if lats_destino is None else np.radians(np.asarray(lats_destino, dtype=float))
+    lon2 = lon if lons_destino is None else np.radians(np.asarray(lons_destino, dtype=float))
+
+    dlon = lon2[None, :] - lon[:, None]
+    x = np.sin(dlon) * np.cos(lat2)[None, :]
+    y = np.cos(lat)[:, None] * np.sin(lat2)[None, :] - np.sin(lat)[:, None] * np.cos(lat2)[None, :] * np.cos(dlon)
+
+    return (np.degrees(np.arctan2(x, y)) + 360) % 360
+
+
+def matriz_equiretangular(lats, lons, lats_destino=None, lons_destino=None,
+                          latitude_referencia=LATITUDE_REFERENCIA):
+    """Retorna (distâncias em km, rumos em graus), matrizes (n x m) da geometria
+    plana rápida; mesmas contas de `calculos.distancia_direcao_plana`.
+    """
+    y = np.radians(np.asarray(lats, dtype=float)) * RAIO_TERRA_KM
+    x = np.radians(np.asarray(lons, dtype=float)) * RAIO_TERRA_KM
+    y2 = y if lats_destino is None else np.radians(np.asarray(lats_destino, dtype=float)) * RAIO_TERRA_KM
+    x2 = x if lons_destino is None else np.radians(np.asarray(lons_destino, dtype=float)) * RAIO_TERRA_KM
+
+    fi0 = math.radians(latitude_referencia)
+    dy = y2[None, :] - y[:, None]
+    escala = math.cos(fi0) - math.sin(fi0) * ((y[:, None] + y2[None, :]) / (2.0 * RAIO_TERRA_KM) - fi0)
+    dx = (x2[None, :] - x[:, None]) * escala
+    return np.hypot(dx, dy), (np.degrees(np.arctan2(dx, dy)) + 360) % 360
+
+
+class MatrizDistancias:
+    """Distâncias e direções entre todas as coordenadas, indexadas por CEP."""
+
+    def __init__(self, coordenadas, geometria=None, latitude_referencia=None):
+        """
+        Pré-calcula as matrizes.
+
+        Args:
+            coordenadas: Lista de objetos Coordenada (CEPs únicos)
+            geometria: 'haversine' ou 'equiretangular' (padrão: `Config.GEOMETRIA`)
+            latitude_referencia: Referência da geometria plana (padrão:
+                `Config.LATITUDE_REFERENCIA`)
+        """
+        self.coordenadas = list(coordenadas)
+        self.indice = {c.cep: i for i, c in enumerate(self.coordenadas)}
+        self._definir_geometria(geometria, latitude_referencia)
+
+        lats = [c.latitude for c in self.coordenadas]
+        lons = [c.longitude for c in self.coordenadas]
+        self.distancias, self.direcoes = self._calcular(lats, lons)
+
+    @classmethod
+    def de_arrays(cls, coordenadas, distancias, direcoes, geometria=None, latitude_referencia=None):
+        """Cria a matriz sobre arrays já calculados (sem recalcular nem copiar)."""
+        matriz = cls.__new__(cls)
+        matriz.coordenadas = list(coordenadas)
+        matriz.indice = {c.cep: i for i, c in enumerate(matriz.coordenadas)}
+        matriz._definir_geometria(geometria, latitude_referencia)
+        matriz.distancias = distancias
+        matriz.direcoes = direcoes
+        return matriz
+
+    def _definir_geometria(self, geometria, latitude_referencia):
+        self.geometria = geometria or Config.GEOMETRIA
+        if self.geometria not in GEOMETRIAS:
+            raise ValueError(f"Geometria desconhecida: {self.geometria}")
+        self.latitude_referencia = (Config.LATITUDE_REFERENCIA if latitude_referencia is None
+                                    else latitude_referencia)
+
+    def _calcular(self, lats, lons, lats_destino=None, lons_destino=None):
+        """(distâncias, direções) entre os pontos na geometria desta matriz."""
+        if self.geometria == 'equiretangular':
+            return matriz_equiretangular(lats, lons, lats_destino, lons_destino, self.latitude_referencia)
+        return (matriz_haversine(lats, lons, lats_destino, lons_destino),
+                matriz_direcoes(lats, lons, lats_destino, lons_destino))
+
+    def submatriz(self, coordenadas):
+        """
+        Matriz restrita a um subconjunto dos pontos, na ordem dada (sem recalcular).
+
+        Args:
+            coordenadas: Lista de `Coordenada` (ou CEPs) presentes nesta matriz
+
+        Returns:
+            MatrizDistancias: Matriz que cobre exatamente `coordenadas`
+        """
+        indices = [self.indice[getattr(c, 'cep', c)] for c in coordenadas]
+        bloco = np.ix_(indices, indices)
+        return MatrizDistancias.de_arrays([self.coordenadas[i] for i in indices], self.distancias[bloco],
+                                          self.direcoes[bloco], self.geometria, self.latitude_referencia)
+
+    def atualizar(self, adicionados=(), removidos=()):
+        """
+        Nova matriz após adicionar/remover pontos, sem recalcular o bloco mantido.
+
+        Só as linhas e colunas dos pontos adicionados são calculadas, em
+        O(n * k) em vez de O(n^2).
+
+        Args:
+            adicionados: Lista de `Coordenada` novas (CEPs já presentes são ignorados)
+            removidos: CEPs (ou `Coordenada`) a retirar
+
+        Returns:
+            MatrizDistancias: Matriz com os pontos mantidos (na ordem atual) seguidos dos novos
+        """
+        removidos = {getattr(item, 'cep', item) for item in removidos}
+        mantidos = [i for i, c in enumerate(self.coordenadas) if c.cep not in removidos]
+        novos, vistos = [], {self.coordenadas[i].cep for i in mantidos}
+        for coord in adicionados:
+            if coord.cep not in vistos and coord.cep not in removidos:
+                vistos.add(coord.cep)
+                novos.append(coord)
+
+        coordenadas = [self.coordenadas[i] for i in mantidos] + novos
+        m, n = len(mantidos), len(coordenadas)
+        distancias = np.empty((n, n))
+        direcoes = np.empty((n, n))
+        bloco = np.ix_(mantidos, mantidos)
+        distancias[:m, :m] = self.distancias[bloco]
+        direcoes[:m, :m] = self.direcoes[bloco]
+
+        if novos:
+            lats = [c.latitude for c in coordenadas]
+            lons = [c.longitude for c in coordenadas]
+            lats_novos, lons_novos = lats[m:], lons[m:]
+            distancias[m:, :], direcoes[m:, :] = self._calcular(lats_novos, lons_novos, lats, lons)
+            distancias[:m, m:], direcoes[:m, m:] = self._calcular(lats[:m], lons[:m], lats_novos, lons_novos)
+
+        return MatrizDistancias.de_arrays(coordenadas, distancias, direcoes,
+                                          self.geometria, self.latitude_referencia)
+
+    def inserir_mais_barato(self, indices, pontos):
+        """
+        Insere cada ponto onde o acréscimo de distância é menor.
+
+        Args:
+            indices: Rota em índices (base nas extremidades); não é modificada
+            pontos: Índices a inserir, na ordem dada
+
+        Returns:
+            list: Nova rota em índices
+        """
+        rota = list(indices)
+        for k in pontos:
+            origens, destinos = np.asarray(rota[:-1]), np.asarray(rota[1:])
+            acrescimo = self.distancias[origens, k] + self.distancias[k, destinos] - self.distancias[origens, destinos]
+            rota.insert(int(np.argmin(acrescimo)) + 1, k)
+        return rota
+
+    def reparar_rota(self, semente, inicio=None, pontos=None):
+        """
+        Ajusta uma rota (CEPs ou `Coordenada`) a um conjunto de pontos.
+
+        CEPs fora do conjunto ou repetidos são descartados; pontos do
+        conjunto que faltam na rota entram por inserção mais barata. A rota
+        termina na base (`eh_unibrasil`) e começa nela ou em `inicio`.
+
+        Args:
+            semente: Rota anterior na ordem de visita
+            inicio: CEP de partida (padrão: a base)
+            pontos: `Coordenada` que a rota deve cobrir (padrão: todas da matriz)
+
+        Returns:
+            tuple: (rota em índices, quantidade descartada, quantidade inserida)
+        """
+        conjunto = range(len(self.coordenadas)) if pontos is None else [self.indice[c.cep] for c in pontos]
+        base = [i for i in conjunto if self.coordenadas[i].eh_unibrasil()]
+        partida = [self.indice[inicio]] if inicio is not None else base
+        permitidos = set(conjunto)
+        meios, vistos, descartados = [], set(base) | set(partida), 0
+        for item in semente:
+            k = self.indice.get(getattr(item, 'cep', item))
+            if k is not None and (k in base or k in partida):
+                continue
+            if k is None or k not in permitidos or k in vistos:
+                descartados += 1
+                continue
+            vistos.add(k)
+            meios.append(k)
+
+        novos = [i for i in conjunto if i not in vistos]
+        return self.inserir_mais_barato(partida + meios + base, novos), descartados, len(novos)
+
+    def indices_da_rota(self, rota):
+        """Converte lista de `Coordenada` em lista de índices."""
+        return [self.indice[c.cep] for c in rota]
+
+    def coordenadas_da_rota(self, indices):
+        """Converte lista de índices em lista de `Coordenada`."""
+        return [self.coordenadas[i] for i in indices]
+
+    def distancia_rota(self, indices):
+        """Soma das distâncias (km) dos trechos consecutivos da rota."""
+        idx = np.asarray(indices)
+        if len(idx) < 2:
+            return 0.0
+        return float(self.distancias[idx[:-1], idx[1:]].sum())
+
+    def __len__(self):
+        return len(self.coordenadas)
+
+    def __repr__(self):
+        return f"MatrizDistancias({len(self.coordenadas)} pontos)"
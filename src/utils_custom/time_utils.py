@@ -2,9 +2,12 @@
 from ..core.settings import Config
 
 
-def abs_to_day_and_minuto(minutos_abs):
-    """Retorna (dia, minuto_do_dia) dado minutos absolutos desde início."""
-    total = Config.HORA_INICIO + minutos_abs
+def abs_to_day_and_minuto(minutos_abs, hora_inicio=None):
+    """Retorna (dia, minuto_do_dia) dado minutos absolutos desde início.
+
+    `hora_inicio` (minutos desde meia-noite) padrão é `Config.HORA_INICIO`.
+    """
+    total = (Config.HORA_INICIO if hora_inicio is None else hora_inicio) + minutos_abs
     dia = total // (24 * 60) + 1
     minuto_do_dia = total % (24 * 60)
     return int(dia), int(minuto_do_dia)
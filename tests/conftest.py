@@ -5,3 +5,38 @@ import os
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
+
+import random
+import shutil
+import pytest
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.populacao import Populacao
+
+
+@pytest.fixture
+def rota_embaralhada():
+    """Fábrica de rotas base + pontos embaralhados (semente própria) + base."""
+    def fabricar(coordenadas, semente=3):
+        meio = list(coordenadas[1:])
+        random.Random(semente).shuffle(meio)
+        return [coordenadas[0]] + meio + [coordenadas[0]]
+    return fabricar
+
+
+@pytest.fixture
+def populacao_pequena():
+    """Fábrica de populações sobre os primeiros `pontos` do CSV de exemplo."""
+    def fabricar(pontos=20, tamanho=10, **opcoes):
+        coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:pontos]
+        return Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho, **opcoes)
+    return fabricar
+
+
+@pytest.fixture
+def csv_coordenadas(tmp_path):
+    """Cópia do CSV de exemplo em `tmp_path` (sidecars ficam fora de `data/`)."""
+    destino = tmp_path / 'coordenadas.csv'
+    shutil.copy('data/coordenadas.csv', destino)
+    return str(destino)
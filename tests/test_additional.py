@@ -19,7 +19,7 @@ def test_drone_autonomia_calculo():
 
 def test_coordenadas_unicas_exceto_unibrasil():
     """Verifica que não há duplicação de coordenadas (exceto Unibrasil)"""
-    coordenadas = carregar_coordenadas('data/coordenadas.csv')
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
     drone = Drone()
     vento = GerenciadorVento()
     
@@ -32,7 +32,7 @@ def test_coordenadas_unicas_exceto_unibrasil():
 
 def test_individuo_requer_inicio_e_fim_unibrasil():
     """Verifica que rotas devem começar e terminar no Unibrasil"""
-    coordenadas = carregar_coordenadas('data/coordenadas.csv')
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
     drone = Drone()
     vento = GerenciadorVento()
     
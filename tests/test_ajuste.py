@@ -0,0 +1,35 @@
+"""Testes da corrida de hiperparâmetros (successive halving)"""
+import csv
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.simulation.ajuste import COLUNAS, amostrar_configuracoes, correr_configuracoes
+
+
+def test_amostragem_distinta_e_reprodutivel():
+    espaco = {'taxa_mutacao': (0.01, 0.05), 'tamanho_torneio': (2, 3, 5)}
+    configuracoes = amostrar_configuracoes(espaco, quantidade=10, semente=1)
+    assert len(configuracoes) == 6  # limitado ao tamanho do espaço
+    assert len({tuple(c.items()) for c in configuracoes}) == 6
+    assert amostrar_configuracoes(espaco, 4, semente=1) == amostrar_configuracoes(espaco, 4, semente=1)
+
+
+def test_rodadas_cortam_por_eta_e_gravam_tabela(tmp_path):
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:12]
+    configuracoes = amostrar_configuracoes(quantidade=5, semente=2)
+    for c in configuracoes:
+        c['tamanho_populacao'] = 6
+
+    caminho = tmp_path / 'ajuste.csv'
+    resultado = correr_configuracoes(coordenadas, configuracoes, orcamento_inicial=0.0, eta=2,
+                                     sementes_maximas=2, workers=1, caminho_saida=str(caminho))
+
+    por_rodada = [sum(1 for l in resultado['linhas'] if l['rodada'] == r) for r in range(4)]
+    assert por_rodada == [5, 3, 2, 1]
+    assert [l['sementes'] for l in resultado['linhas'] if l['rodada'] == 3] == [2]
+    final = resultado['linhas'][-1]
+    assert resultado['melhor'] == {k: final[k] for k in resultado['melhor']}
+    assert resultado['fitness'] == final['fitness_medio']
+
+    with open(caminho, encoding='utf-8') as fh:
+        tabela = list(csv.reader(fh))
+    assert tabela[0] == list(COLUNAS)
+    assert len(tabela) == 12
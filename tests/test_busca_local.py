@@ -0,0 +1,79 @@
+"""Testes das buscas locais sobre matriz de distâncias"""
+import random
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.utils_custom.matriz_distancias import MatrizDistancias
+from src.utils_custom.calculos import distancia_haversine
+from src.algorithms.busca_local import two_opt, or_opt, busca_local_limitada
+from src.algorithms.memetico import BuscaLocalMemetica
+from src.algorithms.genetico import AlgoritmoGenetico
+from src.core.populacao import Populacao
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+
+
+def _rota_aleatoria(n, semente=0):
+    rng = random.Random(semente)
+    meio = list(range(1, n))
+    rng.shuffle(meio)
+    return [0] + meio + [0]
+
+
+def test_matriz_confere_com_haversine():
+    """Matriz pré-calculada reproduz a distância Haversine"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:30]
+    matriz = MatrizDistancias(coordenadas)
+    a, b = coordenadas[3], coordenadas[17]
+
+    esperado = distancia_haversine(a.latitude, a.longitude, b.latitude, b.longitude)
+    assert abs(matriz.distancias[3, 17] - esperado) < 1e-9
+
+
+def test_busca_local_preserva_permutacao_e_encurta():
+    """2-opt e Or-opt mantêm extremos fixos e nunca pioram a distância"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:60]
+    matriz = MatrizDistancias(coordenadas)
+    rota = _rota_aleatoria(len(coordenadas))
+    original = matriz.distancia_rota(rota)
+
+    for operador in (two_opt, or_opt):
+        nova, melhorou = operador(rota, matriz.distancias)
+        assert melhorou
+        assert nova[0] == 0 and nova[-1] == 0
+        assert sorted(nova) == sorted(rota)
+        assert matriz.distancia_rota(nova) < original
+
+    final = busca_local_limitada(rota, matriz.distancias, limite_segundos=1.0)
+    assert matriz.distancia_rota(final) <= matriz.distancia_rota(two_opt(rota, matriz.distancias)[0]) + 1e-9
+
+
+def test_ag_memetico_refina_filhos_em_pool():
+    """Modo memético refina filhos em processos e registra estatísticas"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:25]
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=10)
+    algoritmo = AlgoritmoGenetico(populacao, memetico=True, fracao_memetica=0.5,
+                                  orcamento_memetico=0.5, workers_memeticos=2)
+    try:
+        for _ in range(3):
+            algoritmo.executar_geracao()
+    finally:
+        algoritmo.encerrar()
+
+    memetico = algoritmo.get_historico()[-1]['memetico']
+    assert memetico['refinados'] > 0
+    assert memetico['economia_km'] > 0
+    assert all(len(ind.coordenadas) == 26 for ind in populacao.individuos)
+
+
+def test_orcamento_memetico_soma_cpu_de_todos_os_workers():
+    """Com vários workers, a CPU somada dos filhos respeita o orçamento total"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
+    matriz = MatrizDistancias(coordenadas)
+    rotas = [matriz.coordenadas_da_rota(_rota_aleatoria(len(coordenadas), s)) for s in range(8)]
+    memetico = BuscaLocalMemetica(matriz, fracao=1.0, orcamento_segundos=0.4, workers=2)
+    try:
+        _, _, tempos = memetico.aplicar(rotas)
+    finally:
+        memetico.encerrar()
+
+    assert len(tempos) == 8
+    assert sum(tempos.values()) <= 0.4 * 1.25
@@ -0,0 +1,60 @@
+"""Testes da re-simulação de sufixo e da busca local sensível ao custo"""
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.utils_custom.matriz_distancias import MatrizDistancias
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.individuo import Individuo
+from src.algorithms.busca_local_simulada import busca_local_simulada
+
+
+def test_simular_sufixo_igual_a_simulacao_completa(rota_embaralhada):
+    """Re-simular só o sufixo produz as mesmas métricas da simulação completa"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:120]
+    rota = rota_embaralhada(coordenadas)
+
+    individuo = Individuo(list(rota), Drone(), GerenciadorVento())
+    individuo.simular_rota(registrar_estados=True)
+
+    # trocar dois pontos do meio e re-simular a partir do trecho anterior
+    individuo.coordenadas[60], individuo.coordenadas[80] = individuo.coordenadas[80], individuo.coordenadas[60]
+    individuo.simular_sufixo(59)
+    individuo.calcular_fitness()
+
+    referencia = Individuo(list(individuo.coordenadas), Drone(), GerenciadorVento())
+    referencia.simular_rota()
+    referencia.calcular_fitness()
+
+    assert individuo.fitness == referencia.fitness
+    assert individuo.lista_recargas == referencia.lista_recargas
+    assert len(individuo.trechos) == len(referencia.trechos)
+
+
+def test_busca_local_simulada_nunca_piora_fitness(rota_embaralhada):
+    """Fitness final é menor ou igual e coincide com uma simulação nova"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:80]
+    individuo = Individuo(rota_embaralhada(coordenadas), Drone(), GerenciadorVento())
+
+    resultado = busca_local_simulada(individuo, MatrizDistancias(coordenadas), max_avaliacoes=40)
+
+    assert resultado['fitness_final'] <= resultado['fitness_inicial']
+    assert resultado['movimentos_aceitos'] > 0
+
+    referencia = Individuo(list(individuo.coordenadas), Drone(), GerenciadorVento())
+    referencia.simular_rota()
+    assert abs(referencia.calcular_fitness() - resultado['fitness_final']) < 1e-6
+    assert individuo.coordenadas[0].eh_unibrasil() and individuo.coordenadas[-1].eh_unibrasil()
+
+
+def test_busca_local_simulada_no_modo_split(rota_embaralhada):
+    """No modo split os movimentos são aceitos pelo fitness da DP de recargas"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:80]
+    individuo = Individuo(rota_embaralhada(coordenadas), Drone(), GerenciadorVento())
+    inicial = Individuo(list(individuo.coordenadas), Drone(), GerenciadorVento()).avaliar('split')
+
+    resultado = busca_local_simulada(individuo, MatrizDistancias(coordenadas), max_avaliacoes=40,
+                                     modo='split')
+
+    assert resultado['fitness_inicial'] == inicial
+    assert resultado['fitness_final'] <= inicial and resultado['movimentos_aceitos'] > 0
+    referencia = Individuo(list(individuo.coordenadas), Drone(), GerenciadorVento())
+    assert referencia.avaliar('split') == resultado['fitness_final'] == individuo.fitness
@@ -0,0 +1,62 @@
+"""Testes do lote de cenários e da tabela de vento em CSV"""
+import csv
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.vento import GerenciadorVento
+from src.simulation import cenarios as modulo
+from src.simulation.cenarios import COLUNAS, gerar_grade, executar_lote
+
+
+def test_tabela_de_vento_em_graus():
+    vento = GerenciadorVento.de_csv('data/wind_table.csv')
+    assert sorted(vento.previsao) == list(range(1, 8))
+    assert vento.previsao[1]['06h'] == {'velocidade': 17.0, 'direcao': 'E'}
+    assert vento.previsao[3]['15h']['direcao'] == 'ENE'  # 67.5 graus
+    assert vento.get_vento(1, 6 * 60)['angulo'] == 270  # sopra de leste para oeste
+
+
+def test_lote_paralelo_igual_ao_serial_e_grava_tabela(tmp_path):
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:25]
+    cenarios = gerar_grade(autonomias=(20, 77), tabelas_vento=(None, 'data/wind_table.csv'),
+                           custos=({'custo_recarga': 120.0},), sementes=(3,))
+    assert len(cenarios) == 4
+
+    caminho = tmp_path / 'cenarios.csv'
+    paralelo = executar_lote(cenarios, coordenadas, geracoes=2, tamanho_populacao=8,
+                             workers=2, caminho_saida=str(caminho))
+    serial = executar_lote(cenarios, coordenadas, geracoes=2, tamanho_populacao=8, workers=1)
+
+    for a, b in zip(paralelo, serial):
+        a.pop('segundos'), b.pop('segundos')
+        assert a == b
+    assert paralelo[0]['autonomia_min'] == 20
+    assert paralelo[0]['pousos'] > paralelo[2]['pousos']  # menos autonomia, mais recargas
+
+    with open(caminho, encoding='utf-8') as fh:
+        tabela = list(csv.reader(fh))
+    assert tabela[0] == list(COLUNAS)
+    assert len(tabela) == 5
+
+
+def test_matriz_na_geometria_de_cada_cenario(monkeypatch):
+    """Cada cenário recebe a matriz calculada na geometria dos seus parâmetros"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:15]
+    grade = gerar_grade(custos=({'geometria': 'haversine'},
+                                {'geometria': 'equiretangular', 'latitude_referencia': -25.0}))
+
+    recebidas = []
+    original = modulo.executar_cenario
+
+    def registrar(cenario, coordenadas, matriz, *args):
+        recebidas.append((matriz.geometria, matriz.latitude_referencia))
+        return original(cenario, coordenadas, matriz, *args)
+
+    monkeypatch.setattr(modulo, 'executar_cenario', registrar)
+    serial = executar_lote(grade, coordenadas, geracoes=1, tamanho_populacao=4, workers=1)
+    assert recebidas[0][0] == 'haversine'
+    assert recebidas[1] == ('equiretangular', -25.0)
+
+    monkeypatch.setattr(modulo, 'executar_cenario', original)
+    paralelo = executar_lote(grade, coordenadas, geracoes=1, tamanho_populacao=4, workers=2)
+    for a, b in zip(paralelo, serial):
+        a.pop('segundos'), b.pop('segundos')
+        assert a == b
@@ -0,0 +1,86 @@
+"""Testes do corte branch-and-bound na simulação"""
+import random
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.utils_custom.matriz_distancias import MatrizDistancias
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.individuo import Individuo
+from src.core.populacao import Populacao
+from src.algorithms.genetico import AlgoritmoGenetico
+
+
+def test_limite_inferior_admissivel(rota_embaralhada):
+    """O fitness de um indivíduo abortado nunca supera o fitness real"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:200]
+    matriz = MatrizDistancias(coordenadas)
+
+    for semente in range(3):
+        rota = rota_embaralhada(coordenadas, semente)
+        completo = Individuo(list(rota), Drone(), GerenciadorVento())
+        real = completo.avaliar()
+
+        podado = Individuo(list(rota), Drone(), GerenciadorVento())
+        limite = podado.avaliar(corte=0.0, matriz=matriz)
+
+        assert podado.dominado
+        assert podado.trechos_simulados < completo.trechos_simulados
+        assert limite <= real
+
+
+def test_corte_nao_afeta_individuos_abaixo_do_limiar(rota_embaralhada):
+    """Rotas com fitness abaixo do corte são simuladas até o fim"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:100]
+    rota = rota_embaralhada(coordenadas, 7)
+    real = Individuo(list(rota), Drone(), GerenciadorVento()).avaliar()
+
+    individuo = Individuo(list(rota), Drone(), GerenciadorVento())
+    assert individuo.avaliar(corte=real) == real
+    assert not individuo.dominado
+
+
+def test_ag_com_corte_simula_menos_trechos():
+    """Com corte ativo, gerações seguintes simulam menos trechos"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:60]
+    random.seed(3)
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=12)
+    algoritmo = AlgoritmoGenetico(populacao, corte_avaliacao=True)
+
+    for _ in range(4):
+        algoritmo.executar_geracao()
+
+    historico = algoritmo.get_historico()
+    completo = historico[0]['trechos_simulados']
+    assert historico[0]['dominados'] == 0
+    assert any(h['dominados'] > 0 and h['trechos_simulados'] < completo for h in historico[1:])
+    assert not algoritmo.get_melhor_individuo().dominado
+
+
+def test_limiar_nao_colapsa_ao_longo_das_geracoes():
+    """Rotas abortadas entram no percentil: a parcela exata não definha"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:60]
+    random.seed(0)
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=20)
+    algoritmo = AlgoritmoGenetico(populacao, corte_avaliacao=True, percentil_corte=0.5)
+
+    for _ in range(15):
+        algoritmo.executar_geracao()
+
+    exatos = [h['tamanho'] - h['dominados'] for h in algoritmo.get_historico()]
+    assert min(exatos[1:]) >= 5
+
+
+def test_corte_no_modo_split_poda_a_dp(rota_embaralhada):
+    """No split, o corte descarta rótulos da DP sem perder admissibilidade"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:120]
+    matriz = MatrizDistancias(coordenadas)
+    rota = rota_embaralhada(coordenadas, 2)
+    real = Individuo(list(rota), Drone(), GerenciadorVento()).avaliar('split')
+
+    igual = Individuo(list(rota), Drone(), GerenciadorVento())
+    assert igual.avaliar('split', corte=real, matriz=matriz) == real
+    assert not igual.dominado
+
+    podado = Individuo(list(rota), Drone(), GerenciadorVento())
+    limite = podado.avaliar('split', corte=0.9 * real, matriz=matriz)
+    assert podado.dominado and podado.trechos_simulados == 0
+    assert 0.9 * real < limite <= real
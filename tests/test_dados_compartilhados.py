@@ -0,0 +1,51 @@
+"""Testes dos dados em memória compartilhada e da avaliação paralela"""
+import random
+import numpy as np
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.dados_compartilhados import DadosCompartilhados
+from src.core.individuo import Individuo
+from src.core.populacao import Populacao
+from src.algorithms.genetico import AlgoritmoGenetico
+
+
+def test_anexar_reconstroi_objetos_sem_copia():
+    """O anexo enxerga o mesmo buffer e reconstrói drone, vento e coordenadas"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:40]
+    drone, vento = Drone(), GerenciadorVento()
+    dados = DadosCompartilhados.publicar(coordenadas, drone, vento)
+    anexo = DadosCompartilhados.anexar(dados.descritor)
+    try:
+        assert np.array_equal(anexo.distancias, dados.distancias)
+        dados.distancias[0, 1] = 123.0
+        assert anexo.distancias[0, 1] == 123.0  # mesmo buffer
+        dados.distancias[0, 1] = dados.distancias[1, 0]
+
+        rota = [coordenadas[0]] + coordenadas[1:] + [coordenadas[0]]
+        esperado = Individuo(list(rota), drone, vento).avaliar()
+
+        coords = anexo.coordenadas()
+        rota_anexo = [coords[0]] + coords[1:] + [coords[0]]
+        obtido = Individuo(rota_anexo, anexo.drone(), anexo.gerenciador_vento()).avaliar()
+        assert obtido == esperado
+    finally:
+        anexo.fechar()
+        dados.fechar()
+
+
+def test_avaliacao_em_workers_igual_a_serial():
+    """Avaliar em processos dá o mesmo histórico que avaliar no processo principal"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:50]
+    resultados = []
+    for workers in (1, 2):
+        random.seed(9)
+        populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=10)
+        algoritmo = AlgoritmoGenetico(populacao, workers_avaliacao=workers)
+        try:
+            historico = [algoritmo.executar_geracao()['melhor_fitness'] for _ in range(2)]
+        finally:
+            algoritmo.encerrar()
+        resultados.append(historico)
+
+    assert resultados[0] == resultados[1]
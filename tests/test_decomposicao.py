@@ -0,0 +1,80 @@
+"""Testes da decomposição por clusters para instâncias grandes"""
+import random
+import numpy as np
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.coordenada import Coordenada
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.parametros import ParametrosExecucao
+from src.algorithms import decomposicao
+from src.algorithms.decomposicao import particionar, resolver_cluster, resolver_decomposto
+
+
+def test_particionar_cobre_todos_os_pontos():
+    """Os grupos do k-means e da grade cobrem todos os pontos exceto a base"""
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False))
+    for metodo in ('kmeans', 'grade'):
+        grupos = particionar(coordenadas, 9, metodo)
+        todos = sorted(i for g in grupos for i in g)
+        assert todos == [i for i, c in enumerate(coordenadas) if not c.eh_unibrasil()]
+        assert 1 < len(grupos) <= 9 and all(grupos)
+
+
+def test_resolver_decomposto_costura_rota_unica():
+    """Os ciclos dos clusters viram uma rota única que sai e volta à base"""
+    base = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[0]
+    rng = np.random.default_rng(0)
+    coordenadas = [base] + [Coordenada(f"9{i:07d}", base.latitude + rng.normal(0, 0.05),
+                                       base.longitude + rng.normal(0, 0.05)) for i in range(600)]
+
+    resultado = resolver_decomposto(coordenadas, Drone(), GerenciadorVento(), pontos_por_cluster=100,
+                                    geracoes=2, tamanho_populacao=6, workers=1)
+    rota = resultado['individuo'].coordenadas
+
+    assert rota[0].eh_unibrasil() and rota[-1].eh_unibrasil()
+    assert sorted(c.cep for c in rota[1:-1]) == sorted(c.cep for c in coordenadas[1:])
+    assert resultado['clusters'] == 6
+    assert resultado['distancia_final'] <= resultado['distancia_costurada'] + 1e-9
+    assert resultado['individuo'].fitness < float('inf')
+
+
+def test_cluster_usa_a_geometria_dos_parametros(monkeypatch):
+    """A matriz do cluster é calculada na geometria da execução, não na de `Config`"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:12]
+    parametros = ParametrosExecucao.de_config(geometria='equiretangular', latitude_referencia=-25.0)
+
+    criadas = []
+
+    class MatrizRegistrada(decomposicao.MatrizDistancias):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            criadas.append(self)
+
+    monkeypatch.setattr(decomposicao, 'MatrizDistancias', MatrizRegistrada)
+    pontos = resolver_cluster(coordenadas[0], coordenadas[1:], parametros, GerenciadorVento(),
+                              geracoes=1, tamanho_populacao=4)
+
+    assert sorted(c.cep for c in pontos) == sorted(c.cep for c in coordenadas[1:])
+    assert [(m.geometria, m.latitude_referencia) for m in criadas] == [('equiretangular', -25.0)]
+
+
+def test_cluster_usa_gerador_proprio_e_o_modo_pedido(monkeypatch):
+    """O AG do cluster roda no modo pedido e não re-semeia o `random` global"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:12]
+    modos = []
+
+    class PopulacaoRegistrada(decomposicao.Populacao):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            modos.append(self.modo_avaliacao)
+
+    monkeypatch.setattr(decomposicao, 'Populacao', PopulacaoRegistrada)
+    random.seed(123)
+    esperado = random.Random(123).random()
+    rotas = [resolver_cluster(coordenadas[0], coordenadas[1:], ParametrosExecucao.de_config(), GerenciadorVento(),
+                              geracoes=2, tamanho_populacao=4, semente=5, modo_avaliacao='split')
+             for _ in range(2)]
+
+    assert random.random() == esperado
+    assert modos == ['split', 'split']
+    assert [c.cep for c in rotas[0]] == [c.cep for c in rotas[1]]
@@ -0,0 +1,54 @@
+"""Testes da frequência de arestas e do reinício por diversidade"""
+import random
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.populacao import Populacao
+from src.algorithms.genetico import AlgoritmoGenetico
+from src.algorithms.diversidade import FrequenciaArestas
+
+
+def test_entropia_extremos_e_substituicao_incremental(rota_embaralhada):
+    """Entropia 0 para rotas iguais e atualização incremental igual à reconstrução"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:30]
+    iguais = FrequenciaArestas(coordenadas)
+    for _ in range(5):
+        iguais.adicionar(rota_embaralhada(coordenadas, 0))
+    assert iguais.entropia() == 0.0
+    assert iguais.resumo()['arestas_por_trecho'] == 1.0
+
+    incremental = FrequenciaArestas(coordenadas)
+    rotas = [rota_embaralhada(coordenadas, s) for s in range(5)]
+    for rota in rotas:
+        incremental.adicionar(rota)
+    assert incremental.entropia() > 0.9
+
+    nova = rota_embaralhada(coordenadas, 99)
+    incremental.substituir(rotas[2], nova)
+    rotas[2] = nova
+
+    reconstruida = FrequenciaArestas(coordenadas)
+    for rota in rotas:
+        reconstruida.adicionar(rota)
+    assert incremental.resumo() == reconstruida.resumo()
+
+
+def test_reinicio_quando_diversidade_colapsa():
+    """Com limiar alto o AG re-semeia a população e a entropia volta a subir"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:40]
+    random.seed(2)
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=12)
+    algoritmo = AlgoritmoGenetico(populacao, reinicio_diversidade=True, limiar_entropia=0.5)
+
+    for _ in range(20):
+        algoritmo.executar_geracao()
+        if algoritmo.reinicios:
+            break
+    assert algoritmo.reinicios == 1
+
+    historico = algoritmo.get_historico()
+    colapso = historico[-1]['diversidade']
+    assert colapso['reinicio'] and colapso['entropia_arestas'] < 0.5
+
+    algoritmo.executar_geracao()
+    assert historico[-1]['diversidade']['entropia_arestas'] > colapso['entropia_arestas']
@@ -0,0 +1,33 @@
+"""Testes do AG em regime estacionário"""
+import random
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.populacao import Populacao
+from src.algorithms.estacionario import AlgoritmoGeneticoEstacionario
+
+
+def test_passos_avaliam_apenas_o_lote_e_mantem_estatisticas():
+    """Cada passo avalia só o lote e as estatísticas incrementais batem com as recalculadas"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:50]
+    random.seed(6)
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=16)
+    algoritmo = AlgoritmoGeneticoEstacionario(populacao, tamanho_lote=3, eliminar_duplicatas=True)
+
+    melhores = []
+    for _ in range(25):
+        stats = algoritmo.executar_geracao()
+        melhores.append(stats['melhor_fitness'])
+
+    historico = algoritmo.get_historico()
+    assert all(h['avaliacoes'] == 3 for h in historico[1:])
+    assert algoritmo.substituicoes > 0
+    assert melhores == sorted(melhores, reverse=True)
+
+    # estatísticas incrementais iguais às recalculadas
+    fitness = [ind.fitness for ind in populacao.individuos]
+    assert len(populacao.individuos) == 16
+    assert abs(stats['fitness_medio'] - sum(fitness) / len(fitness)) < 1e-6
+    assert stats['pior_fitness'] == max(fitness)
+    assert stats['melhor_fitness'] == min(fitness)
+    assert len({ind.hash_genoma for ind in populacao.individuos}) == 16
@@ -8,7 +8,7 @@ from src.core.individuo import Individuo
 
 def test_coordenadas_carregadas():
     """Testa que coordenadas são carregadas"""
-    coordenadas = carregar_coordenadas('data/coordenadas.csv')
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
     assert len(coordenadas) > 0
     assert all(hasattr(c, 'cep') for c in coordenadas)
 
@@ -21,7 +21,7 @@ def test_vento_tem_7_dias():
 
 def test_individuo_simula_rota_simples():
     """Testa simulação básica"""
-    coordenadas = carregar_coordenadas('data/coordenadas.csv')
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
     drone = Drone()
     vento = GerenciadorVento()
     
@@ -0,0 +1,36 @@
+"""Testes do carregamento de coordenadas com sidecar binário"""
+import os
+import numpy as np
+from src.utils_custom.file_handlers import carregar_coordenadas, ListaCoordenadas
+
+
+def test_sidecar_criado_e_reutilizado(tmp_path, csv_coordenadas):
+    caminho = csv_coordenadas
+    primeira = carregar_coordenadas(caminho)
+    assert os.path.exists(tmp_path / 'coordenadas.npy')
+    assert os.path.exists(tmp_path / 'coordenadas.npy.json')
+
+    segunda = carregar_coordenadas(caminho)
+    assert isinstance(segunda, ListaCoordenadas)
+    assert isinstance(segunda.registros, np.memmap)
+    assert len(segunda) == len(primeira) == 374
+    assert segunda[0].eh_unibrasil()
+    assert [c.cep for c in segunda[:5]] == [c.cep for c in primeira[:5]]
+    assert segunda[-1].latitude == primeira[-1].latitude
+    assert np.array_equal(segunda.latitudes, primeira.latitudes)
+
+
+def test_sidecar_invalidado_quando_csv_muda(tmp_path, csv_coordenadas):
+    caminho = csv_coordenadas
+    carregar_coordenadas(caminho)
+
+    with open(caminho, 'a', encoding='utf-8') as fh:
+        fh.write('99999999,-49.0,-25.0\n')
+
+    atualizada = carregar_coordenadas(caminho)
+    assert len(atualizada) == 375
+    assert atualizada[-1].cep == '99999999'
+
+    # mtime alterado sem mudança de conteúdo: o sidecar continua válido
+    os.utime(caminho, ns=(0, 0))
+    assert len(carregar_coordenadas(caminho)) == 375
@@ -0,0 +1,45 @@
+"""Testes da colônia de formigas vetorizada"""
+import random
+import numpy as np
+from src.algorithms.formigas import ColoniaFormigas
+
+
+def test_rotas_em_lote_sao_permutacoes_com_extremos_fixos(populacao_pequena):
+    random.seed(2)
+    colonia = ColoniaFormigas(populacao_pequena(tamanho=8), formigas=12, semente=5)
+    rotas = colonia.construir_rotas()
+    n = len(colonia.matriz)
+    base = colonia.matriz.indices_da_rota([c for c in colonia.populacao.coordenadas if c.eh_unibrasil()])[0]
+    assert rotas.shape == (12, n + 1)
+    assert (rotas[:, 0] == base).all() and (rotas[:, -1] == base).all()
+    assert all(sorted(rota[1:-1]) == sorted(set(range(n)) - {base}) for rota in rotas)
+
+    # com um único candidato e feromônio uniforme, toda formiga segue o vizinho mais próximo
+    gulosa = ColoniaFormigas(populacao_pequena(tamanho=8), formigas=4, vizinhos=1, semente=5).construir_rotas()
+    assert (gulosa == gulosa[0]).all()
+    distancias = colonia.matriz.distancias
+    livres = set(range(n)) - {base}
+    atual = base
+    for ponto in gulosa[0][1:-1]:
+        assert distancias[atual, ponto] == min(distancias[atual, j] for j in livres)
+        livres.discard(ponto)
+        atual = ponto
+
+
+def test_feromonio_limitado_e_avaliacao_paralela_igual_a_serial(populacao_pequena):
+    historicos = []
+    for workers in (1, 2):
+        random.seed(3)
+        colonia = ColoniaFormigas(populacao_pequena(tamanho=8), formigas=10, workers_avaliacao=workers, semente=9)
+        try:
+            colonia.executar(iteracoes=4)
+        finally:
+            colonia.encerrar()
+        historicos.append([h['melhor_fitness'] for h in colonia.get_historico()])
+
+        assert historicos[-1] == sorted(historicos[-1], reverse=True)  # melhor global nunca piora
+        assert colonia.get_melhor_individuo().fitness == historicos[-1][-1] < float('inf')
+        assert np.all(colonia.feromonio >= colonia.tau_min - 1e-12)
+        assert np.all(colonia.feromonio <= colonia.tau_max + 1e-12)
+        assert colonia.tau_max == 1.0 / (colonia.evaporacao * historicos[-1][-1])
+    assert historicos[0] == historicos[1]
@@ -0,0 +1,79 @@
+"""Testes do modo frota (vários drones)"""
+import csv
+import pytest
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.algorithms import decomposicao
+from src.algorithms.frota import dividir_setores, rebalancear, otimizar_frota
+from src.simulation.csv_exporter import CSVExporter
+
+
+def test_setores_equilibrados_e_rebalanceamento_reduz_makespan():
+    """Setores com o mesmo número de pontos e rebalanceamento que reduz o makespan"""
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:61])
+    setores = dividir_setores(coordenadas, 3)
+    assert [len(s) for s in setores] == [20, 20, 20]
+    assert sorted(c.cep for s in setores for c in s) == sorted(c.cep for c in coordenadas[1:])
+
+    # desequilíbrio artificial: o primeiro drone fica com quase tudo
+    rotas = [setores[0] + setores[1] + setores[2][:-2], setores[2][-2:]]
+    drone, vento = Drone(), GerenciadorVento()
+    _, antes, _ = rebalancear(rotas, coordenadas[0], drone, vento, movimentos=0)
+    novas, depois, aceitos = rebalancear(rotas, coordenadas[0], drone, vento, movimentos=10)
+    assert aceitos > 0
+    assert max(i.minutos_totais_desde_inicio for i in depois) < max(i.minutos_totais_desde_inicio for i in antes)
+    assert sorted(c.cep for r in novas for c in r) == sorted(c.cep for c in coordenadas[1:])
+
+
+def test_otimizar_frota_exporta_plano_por_drone(tmp_path):
+    """Uma rota por drone cobrindo todos os CEPs e exportação do plano da frota"""
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:60])
+    resultado = otimizar_frota(coordenadas, Drone(), GerenciadorVento(), drones=2, geracoes=2,
+                               tamanho_populacao=6, rodadas=1, workers=1)
+    individuos = resultado['individuos']
+
+    assert len(individuos) == 2
+    assert sorted(c.cep for ind in individuos for c in ind.coordenadas[1:-1]) == sorted(c.cep for c in coordenadas[1:])
+    assert resultado['makespan_minutos'] == max(ind.minutos_totais_desde_inicio for ind in individuos)
+
+    caminho = CSVExporter(str(tmp_path)).exportar_frota(individuos)
+    assert (tmp_path / 'drone_1' / 'flight_plan.csv').exists() and (tmp_path / 'drone_2' / 'genoma.csv').exists()
+    with open(caminho, encoding='utf-8') as fh:
+        linhas = list(csv.reader(fh))
+    assert [l[0] for l in linhas[1:]] == ['1', '2', 'TOTAL'] and linhas[-1][1] == '59'
+
+
+def test_otimizar_frota_em_processos_igual_ao_serial():
+    """Com um processo por drone o resultado é o mesmo do modo no processo atual"""
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:16])
+    opcoes = dict(drones=2, geracoes=2, tamanho_populacao=6, rodadas=1)
+    serial = otimizar_frota(coordenadas, Drone(), GerenciadorVento(), workers=1, **opcoes)
+    paralelo = otimizar_frota(coordenadas, Drone(), GerenciadorVento(), workers=2, **opcoes)
+
+    assert [[c.cep for c in ind.coordenadas] for ind in paralelo['individuos']] == \
+        [[c.cep for c in ind.coordenadas] for ind in serial['individuos']]
+    assert paralelo['makespan_minutos'] == serial['makespan_minutos']
+
+
+def test_otimizar_frota_exige_ao_menos_uma_rodada():
+    """Sem rodadas não há rota avaliada: erro explícito em vez de max() vazio"""
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:10])
+    with pytest.raises(ValueError):
+        otimizar_frota(coordenadas, Drone(), GerenciadorVento(), rodadas=0, workers=1)
+
+
+def test_modo_de_avaliacao_chega_aos_ags_dos_drones(monkeypatch):
+    """O AG de cada drone otimiza no mesmo modo usado no rebalanceamento"""
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:16])
+    modos = []
+
+    class PopulacaoRegistrada(decomposicao.Populacao):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            modos.append(self.modo_avaliacao)
+
+    monkeypatch.setattr(decomposicao, 'Populacao', PopulacaoRegistrada)
+    otimizar_frota(coordenadas, Drone(), GerenciadorVento(), drones=2, geracoes=1, tamanho_populacao=4,
+                   rodadas=1, workers=1, modo_avaliacao='split')
+    assert modos == ['split', 'split']
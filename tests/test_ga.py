@@ -8,7 +8,7 @@ from src.core.entities.vento import GerenciadorVento
 
 def test_algoritmo_genetico_executa_geracoes():
     """Verifica que o GA executa múltiplas gerações"""
-    coordenadas = carregar_coordenadas('data/coordenadas.csv')
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
     drone = Drone()
     vento = GerenciadorVento()
     
@@ -28,7 +28,7 @@ def test_algoritmo_genetico_executa_geracoes():
 
 def test_algoritmo_genetico_melhora_fitness():
     """Verifica que o fitness tende a melhorar (diminuir) ao longo das gerações"""
-    coordenadas = carregar_coordenadas('data/coordenadas.csv')
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
     drone = Drone()
     vento = GerenciadorVento()
     
@@ -49,7 +49,7 @@ def test_algoritmo_genetico_melhora_fitness():
 
 def test_melhor_individuo_eh_viavel():
     """Verifica que o melhor indivíduo encontrado é viável"""
-    coordenadas = carregar_coordenadas('data/coordenadas.csv')
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
     drone = Drone()
     vento = GerenciadorVento()
     
@@ -0,0 +1,65 @@
+"""Testes da geometria plana rápida (equiretangular) contra a Haversine"""
+import random
+import numpy as np
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.utils_custom.calculos import distancia_direcao_plana
+from src.utils_custom.matriz_distancias import MatrizDistancias
+from src.core.parametros import ParametrosExecucao
+from src.core.entities.drone import Drone
+from src.core.entities.trecho import Trecho
+from src.core.entities.vento import GerenciadorVento
+from src.core.individuo import Individuo
+from src.algorithms.busca_local import busca_local_limitada
+
+
+def test_erro_maximo_contra_haversine_no_conjunto_de_dados():
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
+    exata = MatrizDistancias(coordenadas, 'haversine')
+    plana = MatrizDistancias(coordenadas, 'equiretangular')
+
+    pares = exata.distancias > 0
+    erro_relativo = np.abs(plana.distancias - exata.distancias)[pares] / exata.distancias[pares]
+    erro_rumo = np.abs((plana.direcoes - exata.direcoes + 180) % 360 - 180)[pares]
+    assert erro_relativo.max() < 1e-5  # documentado: 0,0003% em `calculos`
+    assert erro_rumo.max() < 0.1
+
+    # versão escalar (usada pelo Trecho) igual à vetorizada
+    a, b = coordenadas[10], coordenadas[200]
+    distancia, rumo = distancia_direcao_plana(a.posicao_plana(), b.posicao_plana())
+    assert abs(distancia - plana.distancias[10, 200]) < 1e-9
+    assert abs(rumo - plana.direcoes[10, 200]) < 1e-9
+
+    parametros = ParametrosExecucao.de_config(geometria='equiretangular')
+    trecho = Trecho(a, b, 40, 1, 6 * 60, 10.0, 90.0, parametros)
+    assert (trecho.distancia, trecho.direcao_voo) == (distancia, rumo)
+
+    # inclusão incremental de pontos mantém a geometria
+    parcial = MatrizDistancias(coordenadas[:300], 'equiretangular').atualizar(coordenadas[300:])
+    assert parcial.geometria == 'equiretangular'
+    assert np.allclose(parcial.distancias, plana.distancias, atol=1e-9)
+
+
+def test_simulacao_e_busca_local_com_geometria_plana():
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:60]
+    random.seed(7)
+    meios = [c for c in coordenadas if not c.eh_unibrasil()]
+    random.shuffle(meios)
+    base = [c for c in coordenadas if c.eh_unibrasil()]
+    rota = base + meios + base
+
+    vento = GerenciadorVento()
+    resultados = {}
+    for geometria in ('haversine', 'equiretangular'):
+        drone = Drone(parametros=ParametrosExecucao.de_config(geometria=geometria))
+        individuo = Individuo(list(rota), drone, vento)
+        individuo.avaliar('guloso')
+        resultados[geometria] = individuo
+    exata, plana = resultados['haversine'], resultados['equiretangular']
+    assert abs(plana.distancia_total - exata.distancia_total) / exata.distancia_total < 1e-5
+    assert abs(plana.fitness - exata.fitness) / exata.fitness < 1e-3
+
+    matriz = MatrizDistancias(coordenadas, 'equiretangular')
+    indices = matriz.indices_da_rota(rota)
+    melhorada = busca_local_limitada(indices, matriz.distancias, 5.0)
+    assert melhorada[0] == indices[0] and melhorada[-1] == indices[-1]
+    assert matriz.distancia_rota(melhorada) < matriz.distancia_rota(indices)
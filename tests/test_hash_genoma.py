@@ -0,0 +1,60 @@
+"""Testes do hash de genoma e da eliminação de duplicatas"""
+import random
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.hash_genoma import TabelaZobrist
+from src.core.populacao import Populacao
+from src.algorithms.genetico import AlgoritmoGenetico
+
+
+def test_atualizacao_por_troca_igual_ao_recalculo():
+    """Atualizar o hash após uma troca equivale a recalcular a rota inteira"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:50]
+    tabela = TabelaZobrist(coordenadas)
+    rota = [coordenadas[0]] + coordenadas[1:] + [coordenadas[0]]
+    valor = tabela.hash_rota(rota)
+
+    rng = random.Random(1)
+    for _ in range(20):
+        a, b = rng.sample(range(1, len(rota) - 1), 2)
+        valor = tabela.atualizar_troca(valor, rota, a, b)
+        rota[a], rota[b] = rota[b], rota[a]
+        assert valor == tabela.hash_rota(rota)
+
+    invertida = [rota[0]] + rota[1:-1][::-1] + [rota[-1]]
+    assert tabela.hash_rota(invertida) != valor
+
+
+def test_populacao_sem_duplicatas_e_avaliacoes_reaproveitadas():
+    """Com eliminação ativa, cada geração tem rotas distintas e reaproveita avaliações"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:40]
+    random.seed(5)
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=16)
+    algoritmo = AlgoritmoGenetico(populacao, taxa_crossover=0.3, eliminar_duplicatas=True)
+
+    for _ in range(4):
+        stats = algoritmo.executar_geracao()
+        assert stats['unicidade'] == 1.0
+
+    historico = algoritmo.get_historico()
+    assert any(h['avaliacoes_poupadas'] > 0 for h in historico[1:])
+    assert all('duplicatas_substituidas' in h for h in historico)
+
+    melhor = algoritmo.get_melhor_individuo()
+    fitness = melhor.fitness
+    assert melhor.avaliar() == fitness
+
+
+def test_filhos_refinados_pela_busca_local_sao_rechecados():
+    """Filhos que a busca local leva ao mesmo ótimo não ficam duplicados"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:10]
+    random.seed(2)
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=16)
+    algoritmo = AlgoritmoGenetico(populacao, eliminar_duplicatas=True, memetico=True,
+                                  fracao_memetica=1.0, orcamento_memetico=1.0)
+
+    for _ in range(3):
+        stats = algoritmo.executar_geracao()
+        assert stats['unicidade'] == 1.0
+    assert algoritmo.get_historico()[-1]['memetico']['refinados'] > 0
@@ -0,0 +1,58 @@
+"""Testes da re-otimização incremental por diferença de CEPs"""
+import copy
+import numpy as np
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.utils_custom.matriz_distancias import MatrizDistancias
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.settings import Config
+from src.algorithms.incremental import reotimizar_incremental
+
+
+def test_atualizar_matriz_igual_ao_recalculo():
+    """Atualizar a matriz dá o mesmo resultado que recalculá-la inteira"""
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:50])
+    antiga = MatrizDistancias(coordenadas[:45])
+    nova = antiga.atualizar(adicionados=coordenadas[45:], removidos=[coordenadas[3].cep, coordenadas[7]])
+
+    completa = MatrizDistancias(nova.coordenadas)
+    assert len(nova) == 48
+    assert np.allclose(nova.distancias, completa.distancias)
+    assert np.allclose(nova.direcoes, completa.direcoes)
+
+
+def test_reotimizacao_incremental_cobre_novo_conjunto_sem_piorar():
+    """A rota re-otimizada cobre o novo conjunto de CEPs e não piora o fitness reparado"""
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:80])
+    anteriores = coordenadas[:75]
+    matriz = MatrizDistancias(anteriores)
+    rota = [c.cep for c in anteriores] + [anteriores[0].cep]
+    removidos = [anteriores[10].cep, anteriores[20].cep]
+
+    resultado = reotimizar_incremental(rota, matriz, Drone(), GerenciadorVento(),
+                                       adicionados=coordenadas[75:], removidos=removidos,
+                                       limite_segundos=0.5, geracoes=2, tamanho_populacao=8)
+
+    ceps = [c.cep for c in resultado['individuo'].coordenadas]
+    esperados = {c.cep for c in coordenadas} - set(removidos)
+    assert ceps[0] == ceps[-1] == coordenadas[0].cep
+    assert len(ceps) - 1 == len(esperados) and set(ceps) == esperados
+    assert resultado['inseridos'] == 5 and resultado['descartados'] == 2
+    assert resultado['fitness_final'] <= resultado['fitness_reparado']
+    assert resultado['segundos'] < 5.0
+
+
+def test_modo_de_avaliacao_padrao_vem_da_configuracao(monkeypatch):
+    """Sem modo explícito vale `Config.MODO_AVALIACAO`, como na população"""
+    monkeypatch.setattr(Config, 'MODO_AVALIACAO', 'split')
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:120])
+    anteriores = coordenadas[:115]
+    rota = [c.cep for c in anteriores] + [anteriores[0].cep]
+
+    resultado = reotimizar_incremental(rota, MatrizDistancias(anteriores), Drone(), GerenciadorVento(),
+                                       adicionados=coordenadas[115:], limite_segundos=0.3)
+
+    individuo = copy.deepcopy(resultado['individuo'])
+    assert individuo.avaliar('split') == resultado['fitness_final']
+    assert individuo.avaliar('guloso') != resultado['fitness_final']
+    assert resultado['fitness_final'] <= resultado['fitness_reparado']
@@ -0,0 +1,67 @@
+"""Testes do limite inferior (1-árvore) e do gap de otimalidade"""
+import itertools
+import random
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.utils_custom.matriz_distancias import MatrizDistancias
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.estado_missao import EstadoMissao
+from src.core.individuo import Individuo
+from src.core.populacao import Populacao
+from src.algorithms.genetico import AlgoritmoGenetico
+from src.algorithms.limite_inferior import limite_distancia, calcular_limite_inferior
+
+
+def test_limite_distancia_nao_excede_otimo():
+    """O limite da 1-árvore não passa do ótimo exato em instâncias pequenas"""
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False))
+    for semente in range(3):
+        random.seed(semente)
+        pontos = [coordenadas[0]] + random.sample(coordenadas[1:], 7)
+        dist = MatrizDistancias(pontos).distancias
+        otimo = min(dist[0, p[0]] + sum(dist[a, b] for a, b in zip(p, p[1:])) + dist[p[-1], 0]
+                    for p in itertools.permutations(range(1, 8)))
+        limite = limite_distancia(dist, iteracoes=100)
+        assert limite <= otimo + 1e-6
+        assert limite >= 0.9 * otimo
+
+
+def test_ag_reporta_gap_e_para_pelo_limiar():
+    """O AG reporta o gap sobre o limite e para quando ele cai abaixo do limiar"""
+    random.seed(0)
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:40])
+    drone, vento = Drone(), GerenciadorVento()
+    populacao = Populacao(coordenadas, drone, vento, tamanho=10)
+    limite = calcular_limite_inferior(populacao.matriz_distancias, drone, vento)
+
+    algoritmo = AlgoritmoGenetico(populacao, gap_parada=1.0)
+    algoritmo.executar_geracao()
+    stats = algoritmo.get_historico()[-1]
+    melhor = algoritmo.get_melhor_individuo()
+
+    assert stats['limite_inferior'] == limite['fitness'] <= melhor.fitness
+    assert melhor.distancia_total >= limite['distancia_km']
+    assert melhor.numero_pousos >= limite['recargas']
+    assert 0.0 <= stats['gap'] == algoritmo.gap <= 1.0 and algoritmo.parada_por_gap
+
+
+def test_limite_no_replanejamento_ignora_pontos_visitados():
+    """Com a matriz da missão inteira, o limite cobre só o restante e não passa do melhor"""
+    random.seed(2)
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:80])
+    drone, vento = Drone(), GerenciadorVento()
+    plano = Individuo(coordenadas + [coordenadas[0]], drone, vento)
+    estado = EstadoMissao.do_plano(plano, 76)
+    pontos = [c for c in coordenadas
+              if c.eh_unibrasil() or c.cep == estado.cep_atual or c.cep not in estado.visitados]
+    assert len(pontos) == 5
+
+    populacao = Populacao(pontos, drone, vento, tamanho=6, estado_inicial=estado,
+                          matriz_distancias=MatrizDistancias(coordenadas))
+    algoritmo = AlgoritmoGenetico(populacao, limite_inferior=True)
+    for _ in range(3):
+        algoritmo.executar_geracao()
+
+    melhor = algoritmo.get_melhor_individuo()
+    assert algoritmo.limite_inferior['fitness'] <= melhor.fitness
+    assert algoritmo.limite_inferior['distancia_km'] <= melhor.distancia_total
@@ -0,0 +1,99 @@
+"""Testes da seleção adaptativa de operadores"""
+from types import SimpleNamespace
+import numpy as np
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.algorithms.operadores import SeletorOperadores
+from src.algorithms.genetico import AlgoritmoGenetico
+from src.core.populacao import Populacao
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+
+
+def test_seletor_favorece_operador_com_maior_recompensa():
+    """Operador com mais melhoria por segundo ganha probabilidade"""
+    seletor = SeletorOperadores({'mutacao': ['troca', 'inversao']}, probabilidade_minima=0.1)
+
+    for _ in range(10):
+        seletor.registrar('mutacao', 'inversao', melhoria=100.0, segundos=0.01)
+        seletor.registrar('mutacao', 'troca', melhoria=100.0, segundos=1.0)
+
+    probs = seletor.probabilidades['mutacao']
+    assert probs['inversao'] > probs['troca'] >= 0.1
+    assert abs(sum(probs.values()) - 1.0) < 1e-9
+
+
+def test_seletor_ignora_piora():
+    """Pioras não geram recompensa negativa"""
+    seletor = SeletorOperadores({'crossover': ['ox', 'clone']})
+    seletor.registrar('crossover', 'ox', melhoria=-50.0, segundos=0.1)
+
+    assert seletor.recompensas['crossover']['ox'] == 0.0
+    assert seletor.probabilidades['crossover']['ox'] == 0.5
+
+
+def test_ag_adaptativo_registra_operadores_no_historico():
+    """Escolhas de operadores aparecem no histórico por geração"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
+    populacao = Populacao(coordenadas[:20], Drone(), GerenciadorVento(), tamanho=10)
+    algoritmo = AlgoritmoGenetico(populacao, taxa_mutacao=0.5, operadores_adaptativos=True)
+
+    for _ in range(3):
+        algoritmo.executar_geracao()
+
+    historico = algoritmo.get_historico()
+    assert 'operadores' in historico[-1]
+    usos = historico[-1]['operadores']['usos']
+    assert sum(usos['crossover'].values()) > 0
+    assert set(historico[-1]['operadores']['probabilidades']) == {'crossover', 'mutacao', 'busca_local'}
+    assert algoritmo.get_melhor_individuo().viabilidade
+
+
+def test_credito_proporcional_ao_ganho_de_cada_operador(populacao_pequena):
+    """Cada operador recebe só a parte da melhoria que causou, e o tempo inclui o refinamento"""
+    algoritmo = AlgoritmoGenetico(populacao_pequena(), operadores_adaptativos=True)
+    registros = {}
+    algoritmo.seletor.registrar = lambda grupo, operador, melhoria, segundos: \
+        registros.setdefault(grupo, (operador, melhoria, segundos))
+
+    # o crossover alongou a rota, a busca local encurtou 3 km e o memético 1 km
+    filho = SimpleNamespace(operadores_usados={'crossover': 'ox', 'busca_local': '2opt_amostrado'},
+                            ganho_operadores={'crossover': -2.0, 'busca_local': 3.0},
+                            tempo_operadores={'crossover': 0.01, 'busca_local': 0.02},
+                            fitness_referencia=100.0, fitness=80.0, tempo_avaliacao=0.03,
+                            ganho_memetico=1.0, tempo_memetico=0.5)
+    algoritmo._creditar_operadores([filho])
+
+    assert registros['crossover'] == ('ox', 0.0, 0.01 + 0.03 + 0.5)
+    operador, melhoria, segundos = registros['busca_local']
+    assert operador == '2opt_amostrado' and melhoria == 15.0
+    assert abs(segundos - (0.02 + 0.03 + 0.5)) < 1e-12
+    assert filho.operadores_usados is None
+
+
+def test_filhos_refinados_guardam_tempo_e_ganho_memetico(populacao_pequena):
+    """O refinamento memético registra CPU e km no filho para o crédito dos operadores"""
+    algoritmo = AlgoritmoGenetico(populacao_pequena(pontos=30), taxa_mutacao=0.5, operadores_adaptativos=True,
+                                  memetico=True, fracao_memetica=1.0, orcamento_memetico=0.2)
+    algoritmo.executar_geracao()
+
+    filhos = [ind for ind in algoritmo.populacao.individuos if getattr(ind, 'operadores_usados', None)]
+    assert filhos and all(set(f.tempo_operadores) == set(f.operadores_usados) for f in filhos)
+    assert all(f.tempo_memetico > 0 for f in filhos)
+    assert any(f.ganho_memetico > 0 for f in filhos)
+    algoritmo.encerrar()
+
+
+def test_busca_local_amostrada_usa_a_matriz_da_populacao(populacao_pequena):
+    """As reversões são decididas pela matriz da população, não por Haversine recalculada"""
+    populacao = populacao_pequena(pontos=30)
+    algoritmo = AlgoritmoGenetico(populacao, operadores_adaptativos=True)
+    matriz = populacao.matriz_distancias
+    individuo = populacao.individuos[0]
+
+    refinado = algoritmo._busca_local_amostrada(individuo, tentativas=200)
+    assert algoritmo._comprimento(refinado.coordenadas) < algoritmo._comprimento(individuo.coordenadas)
+
+    # com todas as distâncias iguais nenhuma reversão encurta a rota
+    matriz.distancias = np.ones_like(matriz.distancias)
+    mantido = algoritmo._busca_local_amostrada(individuo, tentativas=200)
+    assert [c.cep for c in mantido.coordenadas] == [c.cep for c in individuo.coordenadas]
@@ -0,0 +1,38 @@
+"""Testes dos parâmetros imutáveis de execução"""
+import copy
+import dataclasses
+import pytest
+from src.core.settings import Config
+from src.core.parametros import ParametrosExecucao
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.individuo import Individuo
+
+
+def test_de_config_resolve_valores_e_congela():
+    parametros = ParametrosExecucao.de_config(custo_recarga=120.0)
+    assert parametros.hora_inicio == Config.HORA_INICIO
+    assert parametros.battery_reserve_seconds == Config.BATTERY_RESERVE_SECONDS
+    assert parametros.custo_recarga == 120.0
+    assert Config.CUSTO_RECARGA == 80.0
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        parametros.custo_recarga = 1.0
+    with pytest.raises(TypeError):
+        ParametrosExecucao.de_config(parametro_inexistente=1)
+
+
+def test_cenarios_com_parametros_diferentes_coexistem():
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:60]
+    rota = [coordenadas[0]] + coordenadas[1:] + [coordenadas[0]]
+    vento = GerenciadorVento()
+
+    padrao = Individuo(list(rota), Drone(), vento)
+    caro = Individuo(list(rota), Drone(parametros=ParametrosExecucao.de_config(custo_recarga=160.0)), vento)
+    padrao.avaliar()
+    caro.avaliar()
+
+    assert padrao.numero_pousos == caro.numero_pousos > 0
+    assert caro.custo_total - padrao.custo_total == pytest.approx(80.0 * padrao.numero_pousos)
+    assert copy.deepcopy(caro).parametros is caro.parametros
@@ -0,0 +1,62 @@
+"""Testes da partida a quente a partir de rotas anteriores"""
+import random
+from src.utils_custom.file_handlers import carregar_coordenadas, carregar_rota
+from src.utils_custom.matriz_distancias import MatrizDistancias
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.populacao import Populacao
+from src.simulation.csv_exporter import CSVExporter
+
+
+def _vizinho_mais_proximo(coordenadas):
+    matriz = MatrizDistancias(coordenadas)
+    rota, restantes = [0], set(range(1, len(coordenadas)))
+    while restantes:
+        proximo = min(restantes, key=lambda j: matriz.distancias[rota[-1], j])
+        rota.append(proximo)
+        restantes.remove(proximo)
+    return [coordenadas[i].cep for i in rota + [0]]
+
+
+def _distancia_media(populacao):
+    matriz = populacao.matriz_distancias
+    total = 0.0
+    for ind in populacao.individuos:
+        idx = matriz.indices_da_rota(ind.coordenadas)
+        total += sum(matriz.distancias[a, b] for a, b in zip(idx[:-1], idx[1:]))
+    return total / len(populacao.individuos)
+
+
+def test_carregar_rota_de_plano_de_voo_e_genoma(tmp_path):
+    random.seed(2)
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:15]
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=1)
+    individuo = populacao.individuos[0]
+    individuo.simular_rota()
+
+    exporter = CSVExporter(str(tmp_path))
+    esperado = [c.cep for c in individuo.coordenadas]
+    assert carregar_rota(exporter.exportar_rota_completa(individuo)) == esperado
+    assert carregar_rota(exporter.exportar_genoma(individuo)) == esperado
+
+
+def test_populacao_semeada_repara_e_varia_a_rota():
+    random.seed(4)
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:60])
+    semente = _vizinho_mais_proximo(coordenadas)
+    removido = semente.pop(10)  # CEP novo na missão de hoje
+    semente.insert(5, '99999999')  # CEP que saiu da missão
+
+    drone, vento = Drone(), GerenciadorVento()
+    semeada = Populacao(coordenadas, drone, vento, tamanho=20, sementes=[semente])
+    aleatoria = Populacao(coordenadas, drone, vento, tamanho=20)
+
+    assert semeada.reparo_sementes == {'descartados': 1, 'inseridos': 1}
+    todos = sorted(c.cep for c in coordenadas)
+    for ind in semeada.individuos:
+        ceps = [c.cep for c in ind.coordenadas]
+        assert ceps[0] == ceps[-1] == coordenadas[0].cep
+        assert sorted(ceps[:-1]) == todos
+    primeira = [c.cep for c in semeada.individuos[0].coordenadas]
+    assert removido in primeira and primeira[:5] == semente[:5]
+    assert _distancia_media(semeada) < 0.6 * _distancia_media(aleatoria)
@@ -0,0 +1,70 @@
+"""Testes do recozimento simulado e da interface comum de motores"""
+import random
+import pytest
+from src.algorithms.genetico import AlgoritmoGenetico
+from src.algorithms.recozimento import RecozimentoSimulado
+from src.algorithms.solver import Solver, comparar_solvers
+
+
+def test_recozimento_incremental_igual_a_simulacao_completa(populacao_pequena):
+    random.seed(4)
+    populacao = populacao_pequena()
+    populacao.avaliar_populacao()
+    inicial = populacao.melhor_individuo.fitness
+
+    solver = RecozimentoSimulado(populacao, passos_por_temperatura=50, pre_otimizar_distancia=False)
+    passos = solver.executar(iteracoes=4)
+    assert passos == 4 and len(solver.get_historico()) == 4
+    assert solver.avaliacoes > 0
+    assert solver.melhor_fitness <= inicial
+
+    # o fitness acompanhado por sufixos é o mesmo de uma simulação completa
+    melhor = solver.get_melhor_individuo()
+    assert abs(melhor.fitness - solver.melhor_fitness) < 1e-6
+    atual = populacao.novo_individuo(list(solver.atual.coordenadas))
+    assert abs(atual.avaliar('guloso') - solver.fitness_atual) < 1e-6
+
+    rota = [c.cep for c in melhor.coordenadas]
+    assert rota[0] == rota[-1] and sorted(rota[1:-1]) == sorted(c.cep for c in populacao.coordenadas
+                                                                 if not c.eh_unibrasil())
+
+
+def test_comparacao_com_mesmo_tempo_de_relogio(populacao_pequena):
+    def ag():
+        random.seed(1)
+        return AlgoritmoGenetico(populacao_pequena(), eliminar_duplicatas=True)
+
+    def recozimento():
+        random.seed(1)
+        return RecozimentoSimulado(populacao_pequena(), passos_por_temperatura=20, resfriamento='tempo')
+
+    resultados = comparar_solvers({'ag': ag, 'recozimento': recozimento}, iteracoes=3)
+    assert [r['nome'] for r in resultados] == ['ag', 'recozimento']
+    assert resultados[0]['passos'] == 3
+    # o recozimento recebe o tempo gasto pelo AG (terminando o passo em andamento)
+    assert resultados[1]['segundos'] >= resultados[0]['segundos']
+    assert all(r['fitness'] == r['melhor'].fitness < float('inf') for r in resultados)
+    assert resultados[1]['solver'].temperatura < resultados[1]['solver'].temperatura_inicial
+
+
+def test_recozimento_otimiza_no_modo_da_populacao(populacao_pequena):
+    """No modo split, o fitness otimizado é o mesmo que o reportado"""
+    random.seed(3)
+    recozimento = RecozimentoSimulado(populacao_pequena(pontos=150, modo_avaliacao='split'),
+                                      passos_por_temperatura=15, pre_otimizar_distancia=False)
+    recozimento.executar(iteracoes=2)
+
+    melhor = recozimento.get_melhor_individuo()
+    assert recozimento.avaliacoes > 0
+    assert melhor.fitness == recozimento.melhor_fitness
+    assert melhor.avaliar('guloso') != recozimento.melhor_fitness
+
+
+def test_solver_exige_passo_e_melhor_individuo():
+    """Solver é abstrato: motores sem os métodos obrigatórios não instanciam"""
+    class Incompleto(Solver):
+        def executar_geracao(self):
+            return {}
+
+    with pytest.raises(TypeError):
+        Incompleto()
@@ -0,0 +1,73 @@
+"""Testes do replanejamento a partir do estado da missão"""
+import random
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.estado_missao import EstadoMissao
+from src.core.individuo import Individuo
+from src.utils_custom.matriz_distancias import MatrizDistancias
+from src.algorithms.replanejamento import replanejar
+
+
+def _plano(coordenadas, drone, vento):
+    rota = list(coordenadas) + [coordenadas[0]]
+    return Individuo(rota, drone, vento)
+
+
+def test_sufixo_simulado_do_estado_reproduz_o_plano():
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:80])
+    drone, vento = Drone(), GerenciadorVento()
+    plano = _plano(coordenadas, drone, vento)
+    estado = EstadoMissao.do_plano(plano, 30)
+    plano.simular_rota()
+
+    sufixo = Individuo(plano.coordenadas[30:], drone, vento, estado_inicial=estado)
+    sufixo.simular_rota()
+    assert sufixo.viabilidade
+    assert sufixo.minutos_totais_desde_inicio == plano.minutos_totais_desde_inicio
+    assert sufixo.dias_utilizados == plano.dias_utilizados
+    assert len(sufixo.lista_recargas) == len(plano.lista_recargas) - sum(
+        1 for r in plano.lista_recargas if (r[0], r[1]) < (estado.dia, estado.hora_minutos))
+
+
+def test_replanejar_otimiza_apenas_o_restante():
+    random.seed(5)
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:60])
+    drone = Drone()
+    plano = _plano(coordenadas, drone, GerenciadorVento())
+    estado = EstadoMissao.do_plano(plano, 20)
+    vento_novo = GerenciadorVento.de_csv('data/wind_table.csv')
+
+    resultado = replanejar(estado, coordenadas, drone, vento_novo, rota_anterior=plano.coordenadas,
+                           geracoes=3, tamanho_populacao=10, limite_segundos=0.5)
+    rota = [c.cep for c in resultado['individuo'].coordenadas]
+
+    assert rota[0] == estado.cep_atual and rota[-1] == coordenadas[0].cep
+    assert set(rota[1:-1]) == {c.cep for c in coordenadas[21:]}
+    assert resultado['restantes'] == 39
+
+    sem_replanejar = Individuo(plano.coordenadas[20:], drone, vento_novo, estado_inicial=estado)
+    assert resultado['individuo'].fitness <= sem_replanejar.avaliar()
+
+
+def test_replanejar_com_matriz_completa_e_workers_igual_ao_serial():
+    """A matriz da missão inteira é restrita ao restante antes de ir aos trabalhadores"""
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:50])
+    drone, vento = Drone(), GerenciadorVento()
+    plano = _plano(coordenadas, drone, vento)
+    estado = EstadoMissao.do_plano(plano, 25)
+    matriz = MatrizDistancias(coordenadas)
+
+    resultados = []
+    for workers in (1, 2):
+        random.seed(11)
+        resultado = replanejar(estado, coordenadas, drone, vento, matriz=matriz, geracoes=3,
+                               tamanho_populacao=8, opcoes_ag={'workers_avaliacao': workers,
+                                                               'corte_avaliacao': True})
+        resultados.append([c.cep for c in resultado['individuo'].coordenadas])
+    assert resultados[0] == resultados[1]
+    assert len(resultados[0]) == len(coordenadas) - 25 + 1
+
+    restante = matriz.submatriz(coordenadas[25:] + coordenadas[:1])
+    assert restante.distancias.shape == (26, 26)
+    assert restante.distancias[1, 0] == matriz.distancias[26, 25]
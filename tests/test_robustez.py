@@ -0,0 +1,49 @@
+"""Testes da avaliação vetorizada sob cenários de vento"""
+import random
+import numpy as np
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.individuo import Individuo
+from src.core.parametros import ParametrosExecucao
+from src.core.populacao import Populacao
+from src.core.robustez import CenariosVento, simular_cenarios, medida_risco
+from src.algorithms.genetico import AlgoritmoGenetico
+from src.algorithms.robustez import AvaliadorRobusto
+
+
+def test_cenarios_reproduzem_simulador_escalar(rota_embaralhada):
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:120])
+    previsoes = [GerenciadorVento(), GerenciadorVento.de_csv('data/wind_table.csv')]
+    cenarios = CenariosVento.de_gerenciadores(previsoes)
+    drone = Drone(parametros=ParametrosExecucao.de_config(taxa_baseada_em='end', custo_por_minuto=0.5,
+                                                          dias_maximos=2))
+
+    for semente in range(3):
+        rota = rota_embaralhada(coordenadas, semente)
+        resultado = simular_cenarios(Individuo(rota, drone, previsoes[0]), cenarios)
+        for s, vento in enumerate(previsoes):
+            individuo = Individuo(rota, drone, vento)
+            assert resultado['fitness'][s] == individuo.avaliar()
+            assert resultado['dias'][s] == individuo.dias_utilizados
+            assert resultado['pousos'][s] == individuo.numero_pousos
+            assert resultado['pousos_taxa_tarde'][s] == individuo.pousos_taxa_tarde
+            assert resultado['minutos_totais'][s] == individuo.minutos_totais_desde_inicio
+            assert resultado['pousos_por_trecho'][s].sum() == individuo.numero_pousos
+
+
+def test_fitness_robusto_no_ag():
+    coordenadas = list(carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:30])
+    vento = GerenciadorVento()
+    cenarios = CenariosVento.perturbar(vento, 50, semente=3)
+    assert np.array_equal(cenarios.velocidades[0], CenariosVento.de_gerenciadores([vento]).velocidades[0])
+    assert medida_risco([1, 2, 3, 10], 'cvar', 0.75) == 10.0
+
+    random.seed(1)
+    populacao = Populacao(coordenadas, Drone(), vento, tamanho=8)
+    algoritmo = AlgoritmoGenetico(populacao, robustez=AvaliadorRobusto(cenarios, 'cvar', 0.9))
+    algoritmo.executar_geracao()
+    melhor = populacao.melhor_individuo
+    distribuicao = simular_cenarios(melhor, cenarios)['fitness']
+    assert melhor.fitness == medida_risco(distribuicao, 'cvar', 0.9)
+    assert melhor.fitness_nominal == distribuicao[0] and melhor.fitness >= distribuicao.mean()
@@ -0,0 +1,102 @@
+"""Testes do serviço local de otimização"""
+import asyncio
+import json
+from src.simulation.servico import ServicoOtimizacao
+
+
+async def _pedir(leitor, escritor, pedido):
+    escritor.write(json.dumps(pedido).encode() + b'\n')
+    await escritor.drain()
+    return json.loads(await leitor.readline())
+
+
+def test_avaliacao_repetida_vem_do_cache(csv_coordenadas):
+    async def cenario():
+        servico = ServicoOtimizacao(workers=1, caminho_dados=csv_coordenadas)
+        try:
+            base = {'comando': 'avaliar', 'limite': 20}
+            conjunto = servico._conjunto(base)
+            ceps = [c.cep for c in conjunto['coordenadas']]
+            rota = ceps + ceps[:1]
+
+            primeira = await servico.processar({**base, 'rota': rota})
+            segunda = await servico.processar({**base, 'rota': rota})
+            cara = await servico.processar({**base, 'rota': rota, 'parametros': {'custo_recarga': 160.0}})
+            invalida = await servico.processar({**base, 'rota': ['00000000']})
+        finally:
+            servico.encerrar()
+
+        assert primeira['ok'] and not primeira['cache']
+        assert segunda['cache'] and segunda['fitness'] == primeira['fitness']
+        assert not cara['cache'] and cara['custo_total'] > primeira['custo_total']
+        assert not invalida['ok'] and 'CEP' in invalida['erro']
+
+    asyncio.run(cenario())
+
+
+def test_otimizacao_transmite_progresso_e_melhor_plano(tmp_path, csv_coordenadas):
+    async def cenario():
+        servico = ServicoOtimizacao(workers=1, caminho_dados=csv_coordenadas)
+        servidor = await servico.iniciar(caminho_socket=str(tmp_path / 'servico.sock'))
+        try:
+            leitor, escritor = await asyncio.open_unix_connection(str(tmp_path / 'servico.sock'))
+            aceite = await _pedir(leitor, escritor, {'comando': 'otimizar', 'limite': 20, 'geracoes': 3,
+                                                     'populacao': 8, 'semente': 1, 'acompanhar': True})
+            eventos = []
+            while not eventos or eventos[-1]['evento'] != 'fim':
+                eventos.append(json.loads(await leitor.readline()))
+            melhor = await _pedir(leitor, escritor, {'comando': 'melhor', 'tarefa': aceite['tarefa']})
+            escritor.close()
+        finally:
+            servidor.close()
+            await servidor.wait_closed()
+            servico.encerrar()
+
+        assert aceite['ok'] and aceite['geracoes'] == 3
+        assert [e['geracao'] for e in eventos[:-1]] == [1, 2, 3]
+        assert eventos[-1]['estado'] == 'concluida'
+        plano = melhor['plano']
+        assert melhor['ok'] and plano['fitness'] == eventos[-1]['plano']['fitness']
+        assert plano['rota'][0] == plano['rota'][-1] and len(set(plano['rota'])) == 20
+
+    asyncio.run(cenario())
+
+
+def test_tarefas_com_semente_simultaneas_sao_reprodutiveis(csv_coordenadas):
+    """Tarefas com semente rodando juntas dão o mesmo plano que sozinhas"""
+    pedido = {'comando': 'otimizar', 'limite': 25, 'geracoes': 5, 'populacao': 12, 'semente': 7,
+              'parametros': {'geometria': 'equiretangular'}}
+
+    async def cenario():
+        servico = ServicoOtimizacao(workers=2, caminho_dados=csv_coordenadas)
+        try:
+            juntas = [servico._otimizar(pedido), servico._otimizar(pedido)]
+            await asyncio.gather(*(t.concluida.wait() for t in juntas))
+            sozinha = servico._otimizar(pedido)
+            await sozinha.concluida.wait()
+            matrizes = servico._conjunto(pedido)['matrizes']
+        finally:
+            servico.encerrar()
+        return [t.melhor for t in juntas + [sozinha]], matrizes
+
+    planos, matrizes = asyncio.run(cenario())
+    assert planos[0] is not None
+    assert planos[0] == planos[1] == planos[2]
+    assert [m.geometria for m in matrizes.values()] == ['equiretangular']
+
+
+def test_tarefas_encerradas_expiram(csv_coordenadas):
+    """Tarefas encerradas são descartadas depois de `ttl_tarefas`"""
+    async def cenario():
+        servico = ServicoOtimizacao(workers=1, caminho_dados=csv_coordenadas, ttl_tarefas=0.0)
+        try:
+            tarefa = servico._otimizar({'comando': 'otimizar', 'limite': 10, 'geracoes': 1, 'populacao': 4})
+            await tarefa.concluida.wait()
+            await asyncio.sleep(0.01)
+            return await servico.processar({'comando': 'estado', 'tarefa': tarefa.id}), servico._tarefas
+        finally:
+            servico.encerrar()
+
+    resposta, tarefas = asyncio.run(cenario())
+    assert not resposta['ok'] and 'desconhecida' in resposta['erro']
+    assert tarefas == {}
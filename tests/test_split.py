@@ -0,0 +1,42 @@
+"""Testes da avaliação por divisão ótima de surtidas (split)"""
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.individuo import Individuo
+from src.core.populacao import Populacao
+from src.core.split import AvaliadorSplit
+
+
+def test_custo_da_dp_coincide_com_simulacao(rota_embaralhada):
+    """O custo previsto pela DP é exatamente o obtido pelo simulador"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:150]
+    individuo = Individuo(rota_embaralhada(coordenadas, 1), Drone(), GerenciadorVento())
+
+    plano, custo = AvaliadorSplit(individuo).planejar()
+    individuo.simular_rota(recargas_planejadas=plano)
+    componente_distancia = individuo.calcular_fitness() - individuo.custo_total - individuo.penalidades
+
+    assert abs(individuo.custo_total + individuo.penalidades - custo) < 1e-6
+    assert componente_distancia > 0
+
+
+def test_split_nao_pior_que_guloso_em_rotas_longas(rota_embaralhada):
+    """Posições de recarga da DP custam no máximo o mesmo que a regra gulosa"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
+
+    for semente in (0, 1):
+        rota = rota_embaralhada(coordenadas, semente)
+        guloso = Individuo(list(rota), Drone(), GerenciadorVento()).avaliar('guloso')
+        split = Individuo(list(rota), Drone(), GerenciadorVento()).avaliar('split')
+        assert split <= guloso
+
+
+def test_populacao_aceita_modo_split():
+    """Modo de avaliação alternativo é exposto pela população"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:20]
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=4, modo_avaliacao='split')
+    populacao.avaliar_populacao()
+
+    melhor = populacao.melhor_individuo
+    referencia = Individuo(list(melhor.coordenadas), Drone(), GerenciadorVento()).avaliar('split')
+    assert melhor.fitness == referencia
@@ -0,0 +1,94 @@
+"""Testes do modelo substituto de pré-seleção"""
+import copy
+import random
+from src.utils_custom.file_handlers import carregar_coordenadas
+from src.core.entities.drone import Drone
+from src.core.entities.vento import GerenciadorVento
+from src.core.populacao import Populacao
+from src.algorithms.genetico import AlgoritmoGenetico
+from src.algorithms.surrogate import ModeloSubstituto, correlacao_spearman
+
+
+def test_correlacao_spearman():
+    """Correlação de postos nos extremos e None com poucas amostras"""
+    assert correlacao_spearman([1, 2, 3, 4], [10, 20, 30, 40]) == 1.0
+    assert correlacao_spearman([1, 2, 3, 4], [4, 3, 2, 1]) == -1.0
+    assert correlacao_spearman([1, 2], [1, 2]) is None
+
+
+def test_substituto_calibrado_preve_ordem_da_simulacao():
+    """Após calibrar, a previsão ordena rotas de forma coerente com a simulação"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:80]
+    random.seed(4)
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=30)
+    modelo = ModeloSubstituto(populacao.matriz_distancias, populacao.drone)
+
+    simulados = modelo.filtrar(populacao.individuos)
+    assert len(simulados) == 30
+    for ind in simulados:
+        ind.avaliar()
+    modelo.calibrar(simulados)
+
+    assert modelo.resumo()['correlacao_spearman'] > 0.5
+
+
+def test_ag_com_substituto_simula_apenas_parte():
+    """Filhos fora da fração simulada ficam estimados e nunca viram o melhor"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:60]
+    random.seed(8)
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=20)
+    algoritmo = AlgoritmoGenetico(populacao, substituto=True, fracao_substituto=0.5)
+
+    for _ in range(3):
+        algoritmo.executar_geracao()
+
+    historico = algoritmo.get_historico()
+    assert historico[0]['estimados'] == 0
+    assert any(h['estimados'] > 0 for h in historico[1:])
+    assert all('correlacao_spearman' in h['substituto'] for h in historico)
+
+    melhor = algoritmo.get_melhor_individuo()
+    assert melhor.exato
+    assert copy.deepcopy(melhor).avaliar() == melhor.fitness
+
+
+def test_amostra_de_controle_fora_dos_melhores_previstos():
+    """Parte dos filhos não selecionados também é simulada e entra na correlação"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:60]
+    random.seed(5)
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=40)
+    modelo = ModeloSubstituto(populacao.matriz_distancias, populacao.drone, fracao_simulada=0.5,
+                              fracao_controle=0.2, rng=random.Random(1))
+
+    iniciais, filhos = populacao.individuos[:20], populacao.individuos[20:]
+    for ind in modelo.filtrar(iniciais):
+        ind.avaliar()
+    modelo.calibrar(iniciais)
+
+    simulados = modelo.filtrar(filhos)
+    melhores = sorted(filhos, key=lambda ind: ind.fitness_previsto)[:10]
+    controle = [ind for ind in simulados if ind not in melhores]
+    assert len(simulados) == 12 and len(controle) == 2
+    assert all(not ind.fitness_estimado for ind in simulados)
+    assert sum(ind.fitness_estimado for ind in filhos) == 8
+
+    for ind in simulados:
+        ind.avaliar()
+    modelo.calibrar(simulados, estimados=8)
+    assert modelo.resumo()['controle'] == 2
+    assert modelo.resumo()['simulados'] == 12
+
+
+def test_estatisticas_ignoram_fitness_estimado():
+    """Um fitness só previsto pelo substituto nunca aparece como melhor da geração"""
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)[:30]
+    random.seed(3)
+    populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), tamanho=6)
+    populacao.avaliar_populacao()
+    simulados = [ind.fitness for ind in populacao.individuos]
+
+    populacao.individuos[0].marcar_estimado(-1.0)
+    stats = populacao.get_estatisticas()
+    assert stats['estimados'] == 1
+    assert stats['melhor_fitness'] == min(simulados[1:])
+    assert stats['fitness_medio'] == sum(simulados[1:]) / 5
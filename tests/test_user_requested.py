@@ -10,7 +10,7 @@ from src.algorithms.genetico import AlgoritmoGenetico
 
 def test_population_vs_generations_deterministic_when_elite_full():
     """Teste de determinismo com elite total"""
-    coordenadas = carregar_coordenadas('data/coordenadas.csv')
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
     drone = Drone()
     vento = GerenciadorVento()
 
@@ -22,7 +22,7 @@ def test_population_vs_generations_deterministic_when_elite_full():
 
 def test_wind_affects_flight_time_tail_vs_headwind():
     """Teste de que vento afeta tempo de voo"""
-    coordenadas = carregar_coordenadas('data/coordenadas.csv')
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
     drone = Drone()
     vento = GerenciadorVento()
     
@@ -38,7 +38,7 @@ def test_wind_affects_flight_time_tail_vs_headwind():
 
 def test_battery_triggers_recharge_and_marks_landed():
     """Teste de que bateria baixa aciona recarga"""
-    coordenadas = carregar_coordenadas('data/coordenadas.csv')
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
     drone = Drone()
     vento = GerenciadorVento()
     
@@ -53,7 +53,7 @@ def test_battery_triggers_recharge_and_marks_landed():
 
 def test_fitness_decreases_when_late_fee_applied():
     """Teste de que fitness é calculado corretamente"""
-    coordenadas = carregar_coordenadas('data/coordenadas.csv')
+    coordenadas = carregar_coordenadas('data/coordenadas.csv', usar_cache=False)
     drone = Drone()
     vento = GerenciadorVento()
     